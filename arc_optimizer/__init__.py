@@ -0,0 +1 @@
+"""Shared compute core for the Arc Optimizer dashboards."""
@@ -0,0 +1,25 @@
+"""Static assets (the logo), read and encoded once per process."""
+import base64
+from pathlib import Path
+
+from arc_optimizer.cache import memoize
+
+# The dashboards run from the repository root, next to the logo
+LOGO_PATH = Path(__file__).resolve().parent.parent / "images.png"
+
+
+@memoize(maxsize=4)
+def logo_bytes(path=LOGO_PATH):
+    """Raw PNG bytes; ``st.image`` takes them directly, without PIL."""
+    return Path(path).read_bytes()
+
+
+@memoize(maxsize=4)
+def logo_html(path=LOGO_PATH, width=120):
+    """Right-aligned ``<img>`` with the logo inlined as a base64 data URI."""
+    encoded = base64.b64encode(logo_bytes(path)).decode()
+    return f"""
+    <div style='display: flex; justify-content: flex-end;'>
+        <img src='data:image/png;base64,{encoded}' width='{width}'/>
+    </div>
+    """
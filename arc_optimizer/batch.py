@@ -0,0 +1,219 @@
+"""Headless batch runs of the savings / ROI pipeline over scenario configs.
+
+For every scenario the pipeline is the dashboards' chain
+
+    power series (simulated or from a historian file) -> savings zones
+    -> MWh saved -> saving % -> monthly kWh / EUR -> payback months
+
+and the results of all scenarios go into one consolidated file:
+
+    python -m arc_optimizer.batch configs/ -o nightly.parquet --processes 8
+
+``configs/`` holds ``.json`` files (one scenario object or a list of them)
+and ``.csv`` files with a ``name`` column (one scenario per row). A scenario may list several
+``tariffs`` (``{"name": price_eur_per_kwh}``), which expand into one row per
+tariff. Relative ``source`` paths are resolved against the config file.
+
+With ``--root-seed`` the simulated scenarios draw from child streams of
+that one seed instead of their own ``seed`` values (see
+:mod:`arc_optimizer.seeding`); results are then the same for any number of
+worker processes.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time as clock
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from arc_optimizer.fleet import config_from_record
+from arc_optimizer.historian import integrated_savings, load_series
+from arc_optimizer.roi import monthly_kwh_saved, monthly_tons, payback_months
+from arc_optimizer.seeding import spawn_seeds
+from arc_optimizer.simulation import simulate_power
+from arc_optimizer.zones import find_zones
+
+
+class Scenario(NamedTuple):
+    name: str
+    site: str = ""
+    tariff: str = ""
+    source: str = ""                 # historian file or store; empty to simulate
+    duration: int = 30               # simulated minutes (when there is no source)
+    prediction_minutes: int = 5
+    seed: int = 0                    # or a SeedSequence (see with_streams)
+    tap_weight: float = 145.0
+    heats_per_day: int = 8
+    days_per_month: int = 26
+    energy_baseline: float = 296.0
+    electricity_price: float = 0.10
+    software_cost: float = 200000.0
+    min_zone_samples: int = 5        # savings zones shorter than this are not counted
+    error: str = ""                  # why the config record could not be parsed
+
+
+def _expand(record, path, index):
+    name = path.stem if index is None else f"{path.stem}-{index + 1}"
+    try:
+        record = dict(record)
+        name = str(record.setdefault("name", name))
+        source = record.get("source")
+        if source and not Path(source).is_absolute():
+            record["source"] = str(path.parent / source)
+        tariffs = record.pop("tariffs", None)
+        if not tariffs:
+            return [config_from_record(record, Scenario)]
+        return [config_from_record({**record, "tariff": label, "electricity_price": price}, Scenario)
+                for label, price in tariffs.items()]
+    except Exception as exc:
+        # Reported as a failed scenario, like a failure during the run
+        return [Scenario(name, error=f"{path.name}: {type(exc).__name__}: {exc}")]
+
+
+def load_scenarios(directory):
+    """Every scenario in the ``.json`` and ``.csv`` files of ``directory``, in file-name order.
+
+    A record (or a whole JSON file) that cannot be parsed becomes a scenario
+    carrying only its ``error``, so the rest of the batch still runs.
+    """
+    scenarios = []
+    for path in sorted(Path(directory).iterdir()):
+        suffix = path.suffix.lower()
+        if suffix == ".json":
+            try:
+                data = json.loads(path.read_text())
+            except ValueError as exc:
+                scenarios.append(Scenario(path.stem, error=f"{path.name}: {type(exc).__name__}: {exc}"))
+                continue
+            records = [(data, None)] if isinstance(data, dict) else [(r, i) for i, r in enumerate(data)]
+        elif suffix == ".csv":
+            with open(path, newline="") as handle:
+                reader = csv.DictReader(handle)
+                # Data files (historian exports) can live next to the configs
+                if "name" not in (reader.fieldnames or ()):
+                    continue
+                records = [(r, i) for i, r in enumerate(reader)]
+        else:
+            continue
+        for record, index in records:
+            scenarios.extend(_expand(record, path, index))
+    return scenarios
+
+
+def with_streams(scenarios, root_seed):
+    """``scenarios`` with their seeds replaced by child streams of ``root_seed``.
+
+    Streams are assigned per scenario name in load order, so the tariff
+    rows of one scenario share a power series and a scenario's stream does
+    not depend on how the batch is later split across workers.
+    """
+    names = list(dict.fromkeys(s.name for s in scenarios))
+    streams = dict(zip(names, spawn_seeds(root_seed, len(names))))
+    return [s._replace(seed=streams[s.name]) for s in scenarios]
+
+
+def evaluate_scenario(scenario):
+    """Run the pipeline for one scenario; returns a flat result dict.
+
+    Failures (a missing source file, say) are reported in ``error`` so one
+    bad config does not stop the rest of the batch.
+    """
+    result = {"name": scenario.name, "site": scenario.site, "tariff": scenario.tariff,
+              "electricity_price": scenario.electricity_price, "error": scenario.error}
+    if scenario.error:
+        return result
+    try:
+        if scenario.source:
+            time, base_power, mpc_power = load_series(scenario.source)
+        else:
+            time, base_power, mpc_power = simulate_power(scenario.duration, scenario.prediction_minutes,
+                                                          scenario.seed)
+        saved_mwh, mean_savings, mean_base = integrated_savings(time, base_power, mpc_power)
+        zones = find_zones(np.greater(base_power, mpc_power)).longer_than(scenario.min_zone_samples)
+        saving_pct = mean_savings / mean_base * 100 if mean_base else 0.0
+
+        kwh = float(monthly_kwh_saved(scenario.tap_weight, scenario.heats_per_day, scenario.days_per_month,
+                                      scenario.energy_baseline, saving_pct))
+        result.update({
+            "samples": len(time),
+            "minutes": float(time[-1] - time[0]) if len(time) else 0.0,
+            "savings_zones": len(zones.start),
+            "longest_zone_samples": int(zones.length.max()) if len(zones.length) else 0,
+            "saved_mwh": saved_mwh,
+            "saving_pct": saving_pct,
+            "monthly_tons": float(monthly_tons(scenario.tap_weight, scenario.heats_per_day,
+                                               scenario.days_per_month)),
+            "monthly_kwh_saved": kwh,
+            "monthly_eur_saved": kwh * scenario.electricity_price,
+            "payback_months": payback_months(scenario.software_cost, scenario.tap_weight,
+                                             scenario.heats_per_day, scenario.days_per_month,
+                                             scenario.energy_baseline, saving_pct,
+                                             scenario.electricity_price),
+        })
+    except Exception as exc:
+        result["error"] = f"{type(exc).__name__}: {exc}"
+    return result
+
+
+def run_batch(scenarios, processes=None):
+    """Evaluate ``scenarios`` across ``processes`` workers (CPU count by default; 1 runs in-process)."""
+    scenarios = list(scenarios)
+    processes = min(processes or os.cpu_count() or 1, len(scenarios))
+    if processes <= 1:
+        return [evaluate_scenario(s) for s in scenarios]
+    chunksize = max(len(scenarios) // (processes * 4), 1)
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        return list(pool.map(evaluate_scenario, scenarios, chunksize=chunksize))
+
+
+def write_results(results, destination):
+    """Write results to CSV, Parquet, Arrow IPC (by suffix) or JSON."""
+    destination = Path(destination)
+    suffix = destination.suffix.lower()
+    if suffix == ".json":
+        destination.write_text(json.dumps(results, indent=2, default=float))
+        return
+    import pyarrow as pa
+
+    from arc_optimizer.reports import write_batches
+
+    fmt = {".parquet": "parquet", ".pq": "parquet", ".arrow": "arrow", ".feather": "arrow"}.get(suffix, "csv")
+    # Failed scenarios lack the result columns; give every row the same keys
+    names = list(dict.fromkeys(key for result in results for key in result))
+    batch = pa.RecordBatch.from_pylist([{key: result.get(key) for key in names} for result in results])
+    write_batches(str(destination), [batch], fmt)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the savings/ROI pipeline over a directory of scenario configs.")
+    parser.add_argument("configs", help="directory of .json / .csv scenario files")
+    parser.add_argument("-o", "--output", required=True, help="result file (.csv, .parquet, .arrow or .json)")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--root-seed", type=int, default=None,
+                        help="derive every scenario's random stream from this seed instead of its own 'seed'")
+    args = parser.parse_args(argv)
+
+    start = clock.perf_counter()
+    scenarios = load_scenarios(args.configs)
+    if not scenarios:
+        parser.error(f"no scenarios found in {args.configs}")
+    if args.root_seed is not None:
+        scenarios = with_streams(scenarios, args.root_seed)
+    results = run_batch(scenarios, args.processes)
+    write_results(results, args.output)
+    failed = sum(1 for r in results if r["error"])
+    print(f"{len(results)} scenarios ({failed} failed) in {clock.perf_counter() - start:.2f} s -> {args.output}",
+          file=sys.stderr)
+    for r in results:
+        if r["error"]:
+            print(f"  {r['name']} [{r['tariff']}]: {r['error']}", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
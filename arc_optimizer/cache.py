@@ -0,0 +1,98 @@
+"""Bounded, process-wide LRU memoization for simulation, chart and report results.
+
+Streamlit reruns the whole script on every widget change; functions wrapped
+with :func:`memoize` live in this package (not in the page script), so their
+caches survive reruns and are shared by every session in the server process.
+NumPy arrays in cached results are made read-only so one caller cannot
+corrupt what the next one gets back.
+"""
+import functools
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+_MISSING = object()
+
+
+class LRUCache:
+    def __init__(self, maxsize=32):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def info(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses,
+                    "size": len(self._data), "maxsize": self.maxsize}
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+
+def _freeze(value):
+    if isinstance(value, np.ndarray):
+        value.setflags(write=False)
+    elif isinstance(value, (tuple, list)):
+        for item in value:
+            _freeze(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _freeze(item)
+    return value
+
+
+def memoize(maxsize=32, key=None):
+    """Cache a function's results in an :class:`LRUCache` of ``maxsize`` entries.
+
+    By default the key is built from the positional and keyword arguments,
+    which must be hashable. Pass ``key`` (called with the same arguments) to
+    derive the key yourself, e.g. from the scalar inputs an array came from.
+    """
+    def decorator(func):
+        cache = LRUCache(maxsize)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            cache_key = key(*args, **kwargs) if key else (args, tuple(sorted(kwargs.items())))
+            result = cache.get(cache_key, _MISSING)
+            if result is _MISSING:
+                result = _freeze(func(*args, **kwargs))
+                cache.put(cache_key, result)
+            return result
+
+        wrapper.cache = cache
+        wrapper.cache_clear = cache.clear
+        wrapper.cache_info = cache.info
+        return wrapper
+
+    return decorator
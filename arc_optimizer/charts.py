@@ -0,0 +1,76 @@
+"""Rendered dashboard charts, cached as PNG bytes.
+
+Figures are drawn with the object-oriented ``Figure`` API rather than
+``pyplot`` so rendering does not touch global state shared between sessions.
+matplotlib is imported on the first render, not when the module loads.
+"""
+import io
+
+import numpy as np
+
+from arc_optimizer.cache import memoize
+from arc_optimizer.decimate import decimate_for_plot, minmax_indices
+from arc_optimizer.forecast import Z_95
+from arc_optimizer.seeding import seed_key
+from arc_optimizer.simulation import SAMPLES_PER_MINUTE, predicted_power, simulate_power
+
+CHART_DPI = 150
+
+
+def _to_png(fig, dpi=CHART_DPI):
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=dpi, bbox_inches="tight")
+    return buffer.getvalue()
+
+
+def render_live_vs_predicted(time_live, live_base, live_mpc, time_pred, pred_base, pred_mpc,
+                             dpi=CHART_DPI, pred_std=None):
+    """PNG of the live segment, the predicted segment and the predicted savings band.
+
+    With ``pred_std`` (the forecast standard deviation per predicted sample)
+    a 95 % confidence band is shaded around both predicted curves.
+    """
+    time_live, live_base, live_mpc = decimate_for_plot(time_live, live_base, live_mpc)
+    # The band follows the samples picked for the two predicted curves
+    idx = minmax_indices(time_pred, pred_base, pred_mpc)
+    time_pred, pred_base, pred_mpc = (np.asarray(values)[idx] for values in (time_pred, pred_base, pred_mpc))
+    if pred_std is not None:
+        pred_std = np.asarray(pred_std)[idx]
+
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(10, 5))
+    ax = fig.subplots()
+    ax.plot(time_live, live_base, '--', label="Without MPC (Live)", color="red")
+    ax.plot(time_live, live_mpc, '-', label="With MPC (Live)", color="green")
+    ax.plot(time_pred, pred_base, '--', color="red", alpha=0.6, label="Without MPC (Predicted)")
+    ax.plot(time_pred, pred_mpc, '-', color="green", alpha=0.6, label="With MPC (Predicted)")
+    ax.fill_between(time_pred, pred_mpc, pred_base, where=(pred_base > pred_mpc),
+                    interpolate=True, color='lightgreen', alpha=0.4, label="Predicted Energy Savings")
+    if pred_std is not None:
+        spread = Z_95 * pred_std
+        ax.fill_between(time_pred, pred_base - spread, pred_base + spread, color="red", alpha=0.08, linewidth=0)
+        ax.fill_between(time_pred, pred_mpc - spread, pred_mpc + spread, color="green", alpha=0.08,
+                        linewidth=0, label="95 % Forecast Band")
+
+    # Vertical line separating live and predicted
+    split = time_pred[0] if len(time_pred) else time_live[-1]
+    ax.axvline(x=split, color='black', linestyle=':', linewidth=1.5)
+    ax.text(split + 0.5, ax.get_ylim()[1] - 1, 'Prediction Starts →', fontsize=9, color='black')
+
+    ax.set_xlabel("Time (minutes)")
+    ax.set_ylabel("Power Input (MW)")
+    ax.set_title("Live and Future Power Input with Predicted Savings")
+    ax.legend()
+    ax.grid(True)
+    return _to_png(fig, dpi)
+
+
+@memoize(maxsize=32, key=lambda duration, prediction_minutes, seed=0: (duration, prediction_minutes, seed_key(seed)))
+def live_vs_predicted_png(duration, prediction_minutes, seed=0):
+    """Cached :func:`render_live_vs_predicted` for a simulated window, with the forecast as the prediction."""
+    time, base_power, mpc_power = simulate_power(duration, prediction_minutes, seed)
+    time_pred, pred_base, pred_mpc, pred_std = predicted_power(duration, prediction_minutes, seed)
+    live_end = duration * SAMPLES_PER_MINUTE
+    return render_live_vs_predicted(time[:live_end], base_power[:live_end], mpc_power[:live_end],
+                                    time_pred, pred_base, pred_mpc, pred_std=pred_std)
@@ -0,0 +1,77 @@
+"""Plot-aware decimation so charts draw ~2 points per pixel column.
+
+Decimation only affects what is drawn: savings integrals and exports keep
+using the full-resolution arrays.
+"""
+import numpy as np
+
+# Chart width the dashboards render at (10 in figures, ~100 px per inch)
+PLOT_WIDTH_PX = 1000
+
+
+def _bucket_extrema(values, size):
+    """Indices of the min and max of every ``size``-sample bucket (the last one may be shorter)."""
+    n = len(values)
+    whole = n // size
+    offsets = np.arange(whole) * size
+    bulk = values[:whole * size].reshape(whole, size)
+    lo, hi = bulk.argmin(axis=1) + offsets, bulk.argmax(axis=1) + offsets
+    if whole * size < n:
+        rest = values[whole * size:]
+        lo = np.append(lo, whole * size + rest.argmin())
+        hi = np.append(hi, whole * size + rest.argmax())
+    return lo, hi
+
+
+def _first_flips(above, size):
+    """Index of the first change of ``above`` within every bucket that has one."""
+    n = len(above)
+    whole = n // size
+    rows = above[:whole * size].reshape(whole, size)
+    flipped = rows != rows[:, :1]
+    flips = (flipped.argmax(axis=1) + np.arange(whole) * size)[flipped.any(axis=1)]
+    if whole * size < n:
+        change = np.flatnonzero(above[whole * size:] != above[whole * size])
+        if len(change):
+            flips = np.append(flips, whole * size + change[0])
+    return flips
+
+
+def minmax_indices(x, *series, width_px=PLOT_WIDTH_PX, max_points=None):
+    """Sample indices that keep every series' extremes and crossings within a point budget.
+
+    At most ``max_points`` indices are returned (``2 * width_px`` by
+    default); shorter inputs are kept whole. The samples are split into as
+    many equal buckets as the budget allows, and each bucket keeps the min
+    and max of every series and, for exactly two series, the first sign
+    change of their difference (both sides). That keeps peaks visible and
+    lets ``fill_between(..., interpolate=True)`` place its crossings where
+    the full-resolution data has them. The first and last samples are
+    always kept.
+    """
+    n = len(x)
+    max_points = 2 * width_px if max_points is None else max_points
+    if n <= max_points:
+        return np.arange(n)
+    per_bucket = 2 * len(series) + (2 if len(series) == 2 else 0) or 1
+    n_buckets = max((max_points - 2) // per_bucket, 1)
+    size = -(-n // n_buckets)
+    picks = [[0, n - 1]]
+    if not series:
+        picks.append(np.arange(0, n, size))
+    for values in series:
+        picks += _bucket_extrema(np.asarray(values), size)
+
+    if len(series) == 2:
+        cross = _first_flips(np.asarray(series[0]) > np.asarray(series[1]), size)
+        picks += [cross - 1, cross]
+    return np.unique(np.concatenate(picks))
+
+
+def decimate_for_plot(x, *series, width_px=PLOT_WIDTH_PX):
+    """Return ``x`` and each series reduced with :func:`minmax_indices`."""
+    idx = minmax_indices(x, *series, width_px=width_px)
+    if len(idx) == len(x):
+        return (x, *series)
+    return (np.asarray(x[idx]), *(np.asarray(values[idx]) for values in series))
+
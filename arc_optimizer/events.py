@@ -0,0 +1,97 @@
+"""Streaming event-zone detection on live arc power.
+
+The detector keeps an exponentially weighted mean and variance of the
+signal (O(1) state and work per sample, no history) and flags an event when
+a sample deviates from the running mean by more than ``enter_sigma``
+standard deviations. The event stays open until the deviation falls back
+below ``exit_sigma`` (hysteresis), so a noisy excursion produces one event
+instead of a burst of flickering ones.
+"""
+import math
+from typing import NamedTuple
+
+
+class EventRecord(NamedTuple):
+    kind: str        # "start" or "stop"
+    index: int       # sample number since the detector was created/reset
+    time: float
+    value: float
+    zscore: float
+
+
+class EventDetector:
+    def __init__(self, window=20, enter_sigma=2.5, exit_sigma=1.5, warmup=None):
+        if window < 1:
+            raise ValueError("window must be at least one sample")
+        if exit_sigma > enter_sigma:
+            raise ValueError("exit_sigma must not exceed enter_sigma")
+        self.alpha = 2.0 / (window + 1)
+        self.enter_sigma = enter_sigma
+        self.exit_sigma = exit_sigma
+        self.warmup = window if warmup is None else warmup
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self.mean = 0.0
+        self.var = 0.0
+        self.in_event = False
+
+    @property
+    def std(self):
+        return math.sqrt(self.var)
+
+    def update(self, value, time=None):
+        """Feed one sample; return an :class:`EventRecord` on a state change, else None."""
+        records = self.update_batch((value,), None if time is None else (time,))
+        return records[0] if records else None
+
+    def update_batch(self, values, times=None):
+        """Feed a batch of samples; return the start/stop records it produced."""
+        # Hot loop: state lives in locals and is written back once per batch
+        alpha = self.alpha
+        enter, leave = self.enter_sigma, self.exit_sigma
+        warmup = self.warmup
+        count, mean, var, in_event = self.count, self.mean, self.var, self.in_event
+        records = []
+        for i, x in enumerate(values):
+            x = float(x)
+            if count == 0:
+                mean = x
+            deviation = x - mean
+            std = math.sqrt(var)
+            z = deviation / std if std > 0 else 0.0
+            if count >= warmup:
+                if not in_event and abs(z) > enter:
+                    in_event = True
+                    t = count if times is None else float(times[i])
+                    records.append(EventRecord("start", count, t, x, z))
+                elif in_event and abs(z) < leave:
+                    in_event = False
+                    t = count if times is None else float(times[i])
+                    records.append(EventRecord("stop", count, t, x, z))
+            # EWMA update of mean and variance (West, 1979)
+            increment = alpha * deviation
+            mean += increment
+            var = (1 - alpha) * (var + deviation * increment)
+            count += 1
+        self.count, self.mean, self.var, self.in_event = count, mean, var, in_event
+        return records
+
+
+def event_spans(records, end_time):
+    """Pair start/stop records into ``(start_time, stop_time)`` spans.
+
+    An event still open at the end of the records is closed at ``end_time``.
+    """
+    spans = []
+    start = None
+    for record in records:
+        if record.kind == "start":
+            start = record.time
+        elif start is not None:
+            spans.append((start, record.time))
+            start = None
+    if start is not None:
+        spans.append((start, end_time))
+    return spans
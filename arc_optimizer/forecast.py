@@ -0,0 +1,131 @@
+"""Online autoregressive forecaster for the predicted chart segment.
+
+An AR(``order``) model with intercept,
+
+    y[k] = c + a1 * y[k-1] + ... + ap * y[k-p] + e[k],
+
+is fitted by recursive least squares with exponential forgetting: every new
+sample costs one rank-one update of the ``(p+1) x (p+1)`` inverse
+covariance, independent of how much history has been seen, so the forecast
+can be refreshed on every live tick instead of refitting over the window.
+The innovation variance is tracked from the one-step-ahead errors and
+propagated through the model's impulse response to give a confidence band
+that widens with the horizon.
+
+Values are modelled relative to the first sample, which keeps the intercept
+column well scaled for signals that sit far from zero (furnace power in MW).
+"""
+import math
+
+import numpy as np
+
+# Two-sided 95 % normal quantile
+Z_95 = 1.959964
+
+
+class ARForecaster:
+    def __init__(self, order=4, forgetting=0.998, delta=100.0):
+        if order < 1:
+            raise ValueError("order must be at least 1")
+        if not 0 < forgetting <= 1:
+            raise ValueError("forgetting must be in (0, 1]")
+        self.order = int(order)
+        self.forgetting = forgetting
+        self.delta = delta
+        self.reset()
+
+    def reset(self):
+        p = self.order
+        self.count = 0
+        self.offset = 0.0
+        # Regressor: 1 then the last p values, newest first
+        self.theta = np.zeros(p + 1)
+        self.P = np.eye(p + 1) * self.delta
+        self._phi = np.zeros(p + 1)
+        self._phi[0] = 1.0
+        self.var = 0.0
+        self._weight = 0.0
+
+    @property
+    def ready(self):
+        """True once every lag of the regressor holds a real sample."""
+        return self.count > self.order
+
+    @property
+    def std(self):
+        """One-step-ahead error standard deviation."""
+        return math.sqrt(self.var)
+
+    def update(self, value):
+        """Feed one sample; returns its one-step-ahead prediction error (0 while warming up)."""
+        return self.update_batch((value,))
+
+    def update_batch(self, values):
+        """Feed samples in order; returns the last one-step-ahead prediction error."""
+        # Hot loop: state lives in locals and is written back once per batch
+        lam = self.forgetting
+        theta, P, phi = self.theta, self.P, self._phi
+        count, var, offset, weight = self.count, self.var, self.offset, self._weight
+        p = self.order
+        error = 0.0
+        for y in values:
+            y = float(y)
+            if count == 0:
+                offset = y
+            y -= offset
+            if count >= p:
+                error = y - theta @ phi
+                Pphi = P @ phi
+                gain = Pphi / (lam + phi @ Pphi)
+                theta += gain * error
+                P -= np.outer(gain, Pphi)
+                P /= lam
+                # Forgetting-weighted mean of the squared errors, once the
+                # first estimates (a few samples per parameter) have settled
+                if count >= 3 * (p + 1):
+                    weight = lam * weight + 1.0
+                    var += (error * error - var) / weight
+            phi[2:] = phi[1:-1]
+            phi[1] = y
+            count += 1
+        self.count, self.var, self.offset, self._weight = count, var, offset, weight
+        return error
+
+    def forecast(self, horizon, out=None):
+        """Mean forecast for the next ``horizon`` samples and its standard deviation.
+
+        Returns ``(mean, std)``; ``out`` may be a preallocated ``(2, horizon)``
+        array to write them into. Before the model is :attr:`ready` the last
+        value is held with zero spread.
+        """
+        mean, std = np.empty((2, horizon)) if out is None else out
+        if not self.ready:
+            mean[:] = self.offset + self._phi[1] if self.count else 0.0
+            std[:] = 0.0
+            return mean, std
+        c, a = self.theta[0], self.theta[1:]
+        lags = self._phi[1:].copy()
+        # psi: impulse response of the AR filter, newest first (psi[0] = 1)
+        psi = np.zeros(self.order)
+        psi[0] = 1.0
+        spread = 0.0
+        for h in range(horizon):
+            spread += psi[0] * psi[0]
+            std[h] = spread
+            mean[h] = c + a @ lags
+            lags[1:] = lags[:-1]
+            lags[0] = mean[h]
+            step = a @ psi
+            psi[1:] = psi[:-1]
+            psi[0] = step
+        mean += self.offset
+        np.sqrt(std, out=std)
+        std *= self.std
+        return mean, std
+
+
+def fit_forecast(values, horizon, order=4, forgetting=0.998):
+    """Fit an :class:`ARForecaster` on ``values`` and return its ``(mean, std)`` forecast."""
+    forecaster = ARForecaster(order, forgetting)
+    forecaster.update_batch(values)
+    return forecaster.forecast(horizon)
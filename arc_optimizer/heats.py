@@ -0,0 +1,109 @@
+"""Heat-by-heat simulation of a month (or year) of furnace operation.
+
+Every heat gets its own tap weight, specific-energy demand, MPC on/off
+state and a power-on profile at ``dt`` second resolution. A block of heats
+is one ``(heats x samples)`` array: the heat ends at the first sample where
+the cumulative energy reaches its demand, and every KPI is an axis-wise
+reduction over that array. Blocks are a week of heats each, so memory is
+bounded by one week however long the simulated period is.
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+from arc_optimizer.cache import memoize
+from arc_optimizer.seeding import seed_key, spawn_seeds
+from arc_optimizer.simulation import BASE_SETPOINT
+
+# Spread of the per-heat quantities around their nominal values
+TAP_WEIGHT_SD = 0.03        # relative
+SPECIFIC_ENERGY_SD = 0.03   # relative
+SAVING_SD = 0.2             # relative to the nominal saving
+# Arc power fluctuation (MW) without MPC and the share of it left with MPC
+FLUCTUATION_MW = (1.5, 0.8, 0.8)   # slow sine, fast sine, noise
+MPC_FLUCTUATION_SHARE = 0.4
+
+
+class HeatResults(NamedTuple):
+    tons: np.ndarray            # tapped weight per heat
+    mpc_on: np.ndarray          # whether MPC ran on the heat
+    energy_kwh: np.ndarray      # electrical energy drawn
+    kwh_per_ton: np.ndarray
+    power_on_min: np.ndarray
+    saved_kwh: np.ndarray       # vs. the same heat's demand without MPC (0 for MPC OFF heats)
+
+
+def _simulate_block(rng, n_heats, tap_weight, energy_baseline, saving_pct, mpc_share, dt):
+    tons = tap_weight * (1 + TAP_WEIGHT_SD * rng.standard_normal(n_heats))
+    mpc_on = rng.random(n_heats) < mpc_share
+    base_kwh_t = energy_baseline * (1 + SPECIFIC_ENERGY_SD * rng.standard_normal(n_heats))
+    saving = np.where(mpc_on, saving_pct / 100 * (1 + SAVING_SD * rng.standard_normal(n_heats)), 0.0)
+    demand_kwh = tons * base_kwh_t * (1 - saving)
+
+    # Long enough for the hungriest heat at the lowest plausible mean power
+    slow, fast, noise = FLUCTUATION_MW
+    worst_mw = BASE_SETPOINT - slow - fast
+    n_samples = int(np.ceil(demand_kwh.max() * 3.6 / (worst_mw * dt) * 1.05)) + 1
+
+    t = (np.arange(n_samples, dtype=np.float32) * dt / 60)[None, :]
+    phase = rng.uniform(0, 2 * np.pi, (n_heats, 1)).astype(np.float32)
+    scale = np.where(mpc_on, MPC_FLUCTUATION_SHARE, 1.0).astype(np.float32)[:, None]
+    power = rng.standard_normal((n_heats, n_samples), dtype=np.float32)
+    power *= noise
+    power += slow * np.sin(0.25 * t + phase) + fast * np.sin(0.35 * t + 2 * phase)
+    power *= scale
+    power += BASE_SETPOINT
+
+    # kWh per sample = MW * s / 3.6
+    cumulative = np.cumsum(power, axis=1, dtype=np.float64) * (dt / 3.6)
+    done = cumulative >= demand_kwh[:, None]
+    end = done.argmax(axis=1)
+    energy_kwh = cumulative[np.arange(n_heats), end]
+    power_on_min = (end + 1) * dt / 60
+    saved_kwh = np.where(mpc_on, tons * base_kwh_t - energy_kwh, 0.0)
+    return HeatResults(tons, mpc_on, energy_kwh, energy_kwh / tons, power_on_min, saved_kwh)
+
+
+def simulate_heats(n_heats, tap_weight, energy_baseline, saving_pct, mpc_share=1.0,
+                   dt=1.0, block_heats=56, seed=0):
+    """Simulate ``n_heats`` heats in blocks of ``block_heats`` and return per-heat results."""
+    n_blocks = -(-n_heats // block_heats)
+    streams = spawn_seeds(seed, n_blocks)
+    blocks = []
+    for i, stream in enumerate(streams):
+        size = min(block_heats, n_heats - i * block_heats)
+        blocks.append(_simulate_block(np.random.default_rng(stream), size, tap_weight,
+                                      energy_baseline, saving_pct, mpc_share, dt))
+    return HeatResults(*(np.concatenate(field) for field in zip(*blocks)))
+
+
+def summarize(results):
+    """Period totals and MPC ON vs. OFF comparisons from :func:`simulate_heats`."""
+    on, off = results.mpc_on, ~results.mpc_on
+    summary = {
+        "heats": len(results.tons),
+        "mpc_heats": int(on.sum()),
+        "tons": float(results.tons.sum()),
+        "energy_kwh": float(results.energy_kwh.sum()),
+        "saved_kwh": float(results.saved_kwh.sum()),
+        "kwh_per_ton": float(results.energy_kwh.sum() / results.tons.sum()),
+        "power_on_hours": float(results.power_on_min.sum() / 60),
+    }
+    summary["saving_pct"] = summary["saved_kwh"] / (summary["energy_kwh"] + summary["saved_kwh"]) * 100
+    if on.any() and off.any():
+        summary["kwh_per_ton_on"] = float(results.energy_kwh[on].sum() / results.tons[on].sum())
+        summary["kwh_per_ton_off"] = float(results.energy_kwh[off].sum() / results.tons[off].sum())
+        summary["power_on_reduction_pct"] = float(
+            (1 - results.power_on_min[on].mean() / results.power_on_min[off].mean()) * 100)
+    return summary
+
+
+@memoize(maxsize=16, key=lambda tap_weight, heats_per_day, days_per_month, energy_baseline, saving_pct,
+         mpc_share=0.9, seed=0: (tap_weight, heats_per_day, days_per_month, energy_baseline, saving_pct,
+                                 mpc_share, seed_key(seed)))
+def simulate_month(tap_weight, heats_per_day, days_per_month, energy_baseline, saving_pct,
+                   mpc_share=0.9, seed=0):
+    """:func:`summarize` of every heat in one month, blocked by week."""
+    results = simulate_heats(heats_per_day * days_per_month, tap_weight, energy_baseline,
+                             saving_pct, mpc_share=mpc_share, block_heats=heats_per_day * 7, seed=seed)
+    return summarize(results)
@@ -0,0 +1,219 @@
+"""Chunked, memory-mapped access to recorded furnace power histories.
+
+Sources are read in bounded chunks (CSV via pandas, Parquet and Arrow IPC
+via pyarrow) and can be converted once into a *store*: a directory holding
+one raw little-endian float64 file per channel. A store is opened with
+``np.memmap``, so ``time``/``base_power``/``mpc_power`` are zero-copy views
+of the files and only the pages that are actually touched are read.
+"""
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from arc_optimizer.integrator import EnergyIntegrator
+
+CHANNELS = ("time", "base_power", "mpc_power")
+STORE_DTYPE = np.dtype("<f8")
+DEFAULT_CHUNK_ROWS = 1_000_000
+
+# Column headers accepted for each channel, in order of preference; the
+# second entry matches the CSV report written by the dashboards
+COLUMN_ALIASES = {
+    "time": ("time", "Time (min)"),
+    "base_power": ("base_power", "Power Without MPC (MW)"),
+    "mpc_power": ("mpc_power", "Power With MPC (MW)"),
+}
+
+
+class PowerSeries(NamedTuple):
+    time: np.ndarray
+    base_power: np.ndarray
+    mpc_power: np.ndarray
+
+
+def _resolve_columns(available, columns=None):
+    columns = dict(columns or {})
+    resolved = {}
+    for channel in CHANNELS:
+        candidates = (columns[channel],) if channel in columns else COLUMN_ALIASES[channel]
+        for name in candidates:
+            if name in available:
+                resolved[channel] = name
+                break
+        else:
+            raise KeyError(f"no column for {channel!r}; tried {', '.join(candidates)}")
+    return resolved
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as exc:
+        raise ImportError("Parquet/Arrow historian files need pyarrow (pip install pyarrow)") from exc
+    return pyarrow
+
+
+def iter_csv(path, chunk_rows=DEFAULT_CHUNK_ROWS, columns=None):
+    import pandas as pd
+
+    header = pd.read_csv(path, nrows=0).columns
+    resolved = _resolve_columns(header, columns)
+    reader = pd.read_csv(path, usecols=list(resolved.values()), dtype=np.float64,
+                         chunksize=chunk_rows)
+    for frame in reader:
+        yield PowerSeries(*(frame[resolved[c]].to_numpy() for c in CHANNELS))
+
+
+def _batch_series(batch, resolved):
+    # Zero-copy for null-free float64 columns; pyarrow copies otherwise
+    return PowerSeries(*(batch.column(resolved[c]).to_numpy(zero_copy_only=False) for c in CHANNELS))
+
+
+def iter_parquet(path, chunk_rows=DEFAULT_CHUNK_ROWS, columns=None):
+    _require_pyarrow()
+    import pyarrow.parquet as pq
+
+    parquet = pq.ParquetFile(path)
+    resolved = _resolve_columns(parquet.schema_arrow.names, columns)
+    for batch in parquet.iter_batches(batch_size=chunk_rows, columns=list(resolved.values())):
+        yield _batch_series(batch, resolved)
+
+
+def iter_arrow(path, chunk_rows=DEFAULT_CHUNK_ROWS, columns=None):
+    """Record batches of an Arrow IPC file, read through a memory map."""
+    pa = _require_pyarrow()
+
+    with pa.memory_map(str(path), "r") as source:
+        reader = pa.ipc.open_file(source)
+        resolved = _resolve_columns(reader.schema.names, columns)
+        for i in range(reader.num_record_batches):
+            batch = reader.get_batch(i)
+            for offset in range(0, batch.num_rows, chunk_rows):
+                yield _batch_series(batch.slice(offset, chunk_rows), resolved)
+
+
+def iter_store(series, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Consecutive zero-copy slices of an in-memory or memory-mapped series."""
+    for offset in range(0, len(series.time), chunk_rows):
+        yield PowerSeries(*(channel[offset:offset + chunk_rows] for channel in series))
+
+
+def iter_chunks(path, chunk_rows=DEFAULT_CHUNK_ROWS, columns=None):
+    """Dispatch on the file type and yield :class:`PowerSeries` chunks."""
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if path.is_dir() or suffix == ".npy":
+        return iter_store(load_series(path), chunk_rows)
+    if suffix in (".csv", ".txt") or path.name.lower().endswith(".csv.gz"):
+        return iter_csv(path, chunk_rows, columns)
+    if suffix in (".parquet", ".pq"):
+        return iter_parquet(path, chunk_rows, columns)
+    if suffix in (".arrow", ".feather", ".ipc"):
+        return iter_arrow(path, chunk_rows, columns)
+    raise ValueError(f"unsupported historian file type: {path.name}")
+
+
+def write_store(directory, chunks):
+    """Stream ``chunks`` to a store directory and return it memory-mapped."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    files = {c: open(directory / f"{c}.f64", "wb") for c in CHANNELS}
+    try:
+        for chunk in chunks:
+            for channel, values in zip(CHANNELS, chunk):
+                np.ascontiguousarray(values, dtype=STORE_DTYPE).tofile(files[channel])
+    finally:
+        for handle in files.values():
+            handle.close()
+    return open_store(directory)
+
+
+def open_store(directory):
+    directory = Path(directory)
+    views = []
+    for channel in CHANNELS:
+        path = directory / f"{channel}.f64"
+        if path.stat().st_size == 0:
+            views.append(np.zeros(0, dtype=STORE_DTYPE))
+        else:
+            views.append(np.memmap(path, dtype=STORE_DTYPE, mode="r"))
+    if len({len(v) for v in views}) != 1:
+        raise ValueError(f"store channels in {directory} have different lengths")
+    return PowerSeries(*views)
+
+
+def cache_root():
+    """Local working directory: ``$ARC_OPTIMIZER_CACHE`` or ``<tmp>/arc_optimizer``."""
+    return Path(os.environ.get("ARC_OPTIMIZER_CACHE", Path(tempfile.gettempdir()) / "arc_optimizer"))
+
+
+def _store_cache_dir(path, cache_dir, columns=None):
+    stat = path.stat()
+    mapping = sorted((columns or {}).items())
+    key = f"{path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}:{mapping}"
+    digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+    return Path(cache_dir or cache_root()) / f"{path.stem}-{digest}"
+
+
+def load_series(path, cache_dir=None, chunk_rows=DEFAULT_CHUNK_ROWS, columns=None):
+    """Open any historian source as a memory-mapped :class:`PowerSeries`.
+
+    A store directory or a ``(3, n)`` ``.npy`` file is mapped directly. CSV,
+    Parquet and Arrow files are converted chunk by chunk into a store under
+    ``cache_dir`` on first use (keyed on path, size, mtime and the
+    ``columns`` mapping) and mapped from there afterwards. The conversion
+    is written to a temporary directory and renamed into place, so a
+    crashed or concurrent conversion never leaves a partial store behind.
+    """
+    path = Path(path)
+    if path.is_dir():
+        return open_store(path)
+    if path.suffix.lower() == ".npy":
+        table = np.load(path, mmap_mode="r")
+        if table.ndim != 2 or table.shape[0] != len(CHANNELS):
+            raise ValueError(f"{path.name}: expected shape (3, n), got {table.shape}")
+        return PowerSeries(*table)
+
+    store = _store_cache_dir(path, cache_dir, columns)
+    if (store / "complete").exists():
+        return open_store(store)
+    store.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=f".{store.name}-", dir=store.parent))
+    try:
+        write_store(staging, iter_chunks(path, chunk_rows, columns))
+        (staging / "complete").touch()
+        if store.exists() and not (store / "complete").exists():
+            shutil.rmtree(store)  # left by an interrupted conversion
+        os.replace(staging, store)
+    except OSError:
+        # Another session finished the same conversion first
+        if not (store / "complete").exists():
+            raise
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    return open_store(store)
+
+
+def integrated_savings(time, base_power, mpc_power, chunk_rows=DEFAULT_CHUNK_ROWS, time_unit="min"):
+    """Energy saved (MWh, clipped at zero) integrated chunk by chunk.
+
+    Works on memory-mapped channels without materialising full-length
+    temporaries; returns ``(energy_mwh, mean_savings, mean_base_power)``.
+    """
+    n = len(time)
+    if n == 0:
+        return 0.0, 0.0, 0.0
+    integrator = EnergyIntegrator(time_unit=time_unit)
+    savings_sum = base_sum = 0.0
+    for offset in range(0, n, chunk_rows):
+        base = np.asarray(base_power[offset:offset + chunk_rows], dtype=np.float64)
+        s = np.clip(base - mpc_power[offset:offset + chunk_rows], 0, None)
+        integrator.update_batch(time[offset:offset + chunk_rows], s)
+        savings_sum += float(s.sum())
+        base_sum += float(base.sum())
+    return integrator.mwh, savings_sum / n, base_sum / n
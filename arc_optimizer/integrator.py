@@ -0,0 +1,178 @@
+"""Streaming energy integration for live savings counters.
+
+Power is in MW and timestamps are in ``time_unit`` (minutes, as everywhere
+else in the dashboards). Energy is always accumulated in MWh, so a total
+never depends on the sample rate or on the unit the timestamps came in.
+
+Each update integrates only the new samples (trapezoid rule on their own,
+possibly irregular, timestamps plus the interval that bridges them to the
+previous sample), so the cost is O(1) per sample and history is never
+re-integrated. Intervals longer than ``max_gap`` are treated as data gaps:
+they contribute no energy and are reported in ``gap_time``. Samples that do
+not move time forward, or whose power is NaN, are dropped.
+"""
+import numpy as np
+
+# Hours per time unit: MW x unit x HOURS_PER_UNIT[unit] = MWh
+HOURS_PER_UNIT = {"s": 1 / 3600, "min": 1 / 60, "h": 1.0}
+
+PERIODS = ("heat", "shift", "month", "total")
+
+
+def to_mwh(mw_time, time_unit="min"):
+    """Convert an integral of MW over ``time_unit`` to MWh."""
+    return mw_time * HOURS_PER_UNIT[time_unit]
+
+
+class EnergyIntegrator:
+    """Running trapezoid integral of a power signal."""
+
+    def __init__(self, time_unit="min", max_gap=None):
+        if time_unit not in HOURS_PER_UNIT:
+            raise ValueError(f"unknown time unit {time_unit!r}; expected one of {sorted(HOURS_PER_UNIT)}")
+        self.time_unit = time_unit
+        self.max_gap = max_gap
+        self._scale = HOURS_PER_UNIT[time_unit]
+        self.reset()
+
+    def reset(self):
+        self.mwh = 0.0
+        self.gap_time = 0.0
+        self.samples = 0
+        self.last_time = self.last_power = None
+
+    @property
+    def kwh(self):
+        return self.mwh * 1000
+
+    def _intervals(self, times, powers):
+        """Per-interval ``(dt, mwh)`` for new samples, bridged to the previous one."""
+        times = np.asarray(times, dtype=np.float64).ravel()
+        powers = np.asarray(powers, dtype=np.float64).ravel()
+        if times.shape != powers.shape:
+            raise ValueError("times and powers must have the same length")
+        keep = ~np.isnan(powers) & ~np.isnan(times)
+        if not keep.all():
+            times, powers = times[keep], powers[keep]
+        if self.last_time is not None:
+            times = np.concatenate(([self.last_time], times))
+            powers = np.concatenate(([self.last_power], powers))
+        if len(times) == 0:
+            return times, powers, np.empty(0), np.empty(0)
+
+        # Drop samples that do not move time forward (repeats, late arrivals)
+        forward = times > np.maximum.accumulate(np.concatenate(([-np.inf], times[:-1])))
+        if not forward.all():
+            times, powers = times[forward], powers[forward]
+        dt = np.diff(times)
+        energy = 0.5 * (powers[1:] + powers[:-1]) * dt * self._scale
+        if self.max_gap is not None:
+            gap = dt > self.max_gap
+            energy[gap] = 0.0
+            self.gap_time += float(dt[gap].sum())
+        return times, powers, dt, energy
+
+    def _advance(self, times, powers):
+        if len(times):
+            self.samples += len(times) - (self.last_time is not None)
+            self.last_time, self.last_power = float(times[-1]), float(powers[-1])
+
+    def update(self, time, power):
+        """Add one sample; returns the energy (MWh) it added."""
+        return self.update_batch((time,), (power,))
+
+    def update_batch(self, times, powers):
+        """Add a batch of samples in time order; returns the energy (MWh) they added."""
+        times, powers, _, energy = self._intervals(times, powers)
+        added = float(energy.sum())
+        self.mwh += added
+        self._advance(times, powers)
+        return added
+
+
+class EnergyCounters(EnergyIntegrator):
+    """:class:`EnergyIntegrator` with cumulative counters per heat, shift and month.
+
+    ``start`` is the wall-clock time of ``t = 0`` (anything
+    ``np.datetime64`` accepts). Shifts are ``shift_hours`` long starting at
+    ``shift_start_hour``; months are calendar months. Each interval is
+    booked to the period of its closing sample, and when a shift or month
+    rolls over its final value is appended to ``history`` as
+    ``(period, key, mwh)``. Heats are closed explicitly with
+    :meth:`start_heat`.
+    """
+
+    def __init__(self, start="2025-01-01T00:00", time_unit="min", max_gap=None,
+                 shift_hours=8, shift_start_hour=6, max_history=1000):
+        self.start = np.datetime64(start, "s")
+        self.shift_hours = shift_hours
+        self.shift_start_hour = shift_start_hour
+        self.max_history = max_history
+        super().__init__(time_unit=time_unit, max_gap=max_gap)
+
+    def reset(self):
+        super().reset()
+        self.counters = dict.fromkeys(PERIODS, 0.0)
+        self.keys = {"heat": 0, "shift": None, "month": None}
+        self.history = []
+        self._heats = 0
+
+    def _period_keys(self, times):
+        seconds = np.asarray(times) * (self._scale * 3600)
+        stamps = self.start + seconds.astype("m8[s]")
+        hours = stamps.astype("M8[h]").astype(np.int64)
+        return {"shift": (hours - self.shift_start_hour) // self.shift_hours,
+                "month": stamps.astype("M8[M]").astype(np.int64)}
+
+    def _close(self, period):
+        self.history.append((period, self.keys[period], self.counters[period]))
+        del self.history[:-self.max_history]
+        self.counters[period] = 0.0
+
+    def start_heat(self, label=None):
+        """Close the running heat counter and start a new heat."""
+        self._close("heat")
+        self._heats += 1
+        self.keys["heat"] = label if label is not None else self._heats
+
+    def update_batch(self, times, powers):
+        times, powers, _, energy = self._intervals(times, powers)
+        added = float(energy.sum())
+        self.mwh += added
+        self.counters["heat"] += added
+        self.counters["total"] += added
+        if len(times):
+            for period, keys in self._period_keys(times).items():
+                if self.keys[period] is None:
+                    self.keys[period] = int(keys[0])
+                # Book each interval to its closing sample's period, one run of equal keys at a time
+                closing = keys[1:]
+                bounds = np.concatenate(([0], np.flatnonzero(closing[1:] != closing[:-1]) + 1, [len(closing)]))
+                for lo, hi in zip(bounds[:-1], bounds[1:]):
+                    if hi == lo:
+                        continue
+                    if closing[lo] != self.keys[period]:
+                        self._close(period)
+                        self.keys[period] = int(closing[lo])
+                    self.counters[period] += float(energy[lo:hi].sum())
+        self._advance(times, powers)
+        return added
+
+    def period_start(self, period, key):
+        """Wall-clock start of a shift or month ``key`` (as found in ``keys`` and ``history``)."""
+        if period == "shift":
+            return np.datetime64(int(key) * self.shift_hours + self.shift_start_hour, "h")
+        if period == "month":
+            return np.datetime64(int(key), "M")
+        raise ValueError(f"{period!r} has no calendar start")
+
+    def value(self, period="total", unit="MWh"):
+        """Counter for ``period`` (one of :data:`PERIODS`) in ``"MWh"`` or ``"kWh"``."""
+        scale = {"MWh": 1.0, "kWh": 1000.0}[unit]
+        return self.counters[period] * scale
+
+
+def integrate(times, powers, time_unit="min", max_gap=None):
+    """One-shot trapezoid integral in MWh (a fresh :class:`EnergyIntegrator`)."""
+    integrator = EnergyIntegrator(time_unit=time_unit, max_gap=max_gap)
+    return integrator.update_batch(times, powers)
@@ -0,0 +1,111 @@
+"""Simulated live plant feed for the dashboards' live mode.
+
+The feed advances the simulated furnace one sample at a time with the MPC
+in closed loop, keeps only the last ``window`` samples in a fixed-size
+:class:`~arc_optimizer.ringbuffer.RingBuffer`, and builds the predicted
+segment from the controller's own plan plus an online AR forecast of the
+MPC OFF power (updated in O(1) per sample, with a confidence band). Nothing is reallocated per tick, so a
+feed left running 24/7 has a constant memory footprint. Energy saved is
+accumulated per heat, shift and month as samples arrive, so the counters
+cover the whole session and not just the visible window.
+"""
+import numpy as np
+
+from arc_optimizer.forecast import ARForecaster
+from arc_optimizer.integrator import EnergyCounters
+from arc_optimizer.mpc import MPCController
+from arc_optimizer.ringbuffer import RingBuffer
+from arc_optimizer.seeding import generator
+from arc_optimizer.simulation import BASE_SETPOINT, MPC_REFERENCE, SAMPLES_PER_MINUTE, arc_fluctuation
+
+
+class LiveFeed:
+    def __init__(self, window_minutes, prediction_minutes, seed=0, heat_minutes=None, start=None):
+        self.window = int(window_minutes * SAMPLES_PER_MINUTE)
+        self.horizon = int(prediction_minutes * SAMPLES_PER_MINUTE)
+        self.controller = MPCController(self.horizon)
+        self._rng = generator(seed)
+        self._steps = np.arange(1, self.horizon + 1) / SAMPLES_PER_MINUTE
+        self.count = 0
+        self.x = self.u_prev = BASE_SETPOINT
+        self.plan = np.full(self.horizon, BASE_SETPOINT)
+        self._plan_x0 = BASE_SETPOINT
+        self.buffer = RingBuffer(self.window, ("time", "base_power", "mpc_power"))
+        self.forecaster = ARForecaster()
+        # Predicted segment rows: time, base_power, std, mpc_power (overwritten in place)
+        self._prediction = np.empty((4, self.horizon))
+        # A new heat every ``heat_minutes`` (tap-to-tap); None keeps one running heat
+        self.heat_samples = int(heat_minutes * SAMPLES_PER_MINUTE) if heat_minutes else None
+        self.savings = EnergyCounters(start=start if start is not None else np.datetime64("now", "s"),
+                                      max_gap=2 / SAMPLES_PER_MINUTE)
+
+    @property
+    def time(self):
+        return self.buffer.channel("time")
+
+    @property
+    def base_power(self):
+        return self.buffer.channel("base_power")
+
+    @property
+    def mpc_power(self):
+        return self.buffer.channel("mpc_power")
+
+    def matches(self, window_minutes, prediction_minutes, heat_minutes=None):
+        return (self.window == int(window_minutes * SAMPLES_PER_MINUTE)
+                and self.horizon == int(prediction_minutes * SAMPLES_PER_MINUTE)
+                and self.heat_samples == (int(heat_minutes * SAMPLES_PER_MINUTE) if heat_minutes else None))
+
+    def advance(self, n_samples=1):
+        """Acquire ``n_samples`` new samples and return them as ``(time, base, mpc)``."""
+        t = (self.count + np.arange(n_samples)) / SAMPLES_PER_MINUTE
+        disturbance = arc_fluctuation(t) + 0.8 * self._rng.standard_normal(n_samples)
+        base = BASE_SETPOINT + disturbance
+        power = np.empty(n_samples)
+        controller = self.controller
+        for i in range(n_samples):
+            power[i] = self.x + disturbance[i]
+            self._plan_x0 = self.x
+            self.plan = controller.solve(self.x, self.u_prev, arc_fluctuation(t[i] + self._steps),
+                                         MPC_REFERENCE)
+            self.u_prev = self.plan[0]
+            self.x = controller.a * self.x + (1 - controller.a) * self.u_prev
+        self.forecaster.update_batch(base)
+        self._count_savings(t, np.clip(base - power, 0, None))
+        self.count += n_samples
+
+        self.buffer.extend(t, base, power)
+        return t, base, power
+
+    def _count_savings(self, t, savings):
+        if not self.heat_samples:
+            self.savings.update_batch(t, savings)
+            return
+        # A heat starts at every multiple of ``heat_samples``; split the batch there
+        index = self.count + np.arange(len(t))
+        lo = 0
+        for cut in np.flatnonzero((index % self.heat_samples == 0) & (index > 0)):
+            self.savings.update_batch(t[lo:cut], savings[lo:cut])
+            self.savings.start_heat()
+            lo = cut
+        self.savings.update_batch(t[lo:], savings[lo:])
+
+    @property
+    def prediction_std(self):
+        """Forecast standard deviation per predicted sample, as of the last :meth:`prediction`."""
+        return self._prediction[2]
+
+    def prediction(self):
+        """``(time, base, mpc)`` over the horizon.
+
+        ``base`` is the AR forecast of the MPC OFF power; ``mpc`` is the
+        controller's planned regulated power plus the same forecast
+        disturbance. The rows are views of a preallocated array reused on
+        every call.
+        """
+        time, base, _, mpc = self._prediction
+        np.add(self._steps, (self.count - 1) / SAMPLES_PER_MINUTE, out=time)
+        self.forecaster.forecast(self.horizon, out=self._prediction[1:3])
+        np.add(self.controller.predict(self._plan_x0, self.plan), base, out=mpc)
+        mpc -= BASE_SETPOINT
+        return time, base, mpc
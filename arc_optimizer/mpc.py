@@ -0,0 +1,149 @@
+"""Receding-horizon MPC for electrode power regulation.
+
+The furnace power loop is modelled as a first-order lag from the power
+setpoint ``u`` to the regulated power ``x``, with the arc fluctuation ``d``
+acting as an additive output disturbance:
+
+    x[k+1] = a * x[k] + (1 - a) * u[k]
+    y[k]   = x[k] + d[k]
+
+Each control step solves the condensed QP (states eliminated, decision
+vector = the ``N`` future setpoints)
+
+    min_u  q * |y - r|^2 + r_move * |du|^2 + r_input * |u - r|^2
+    s.t.   u_min <= u <= u_max
+
+The Hessian only depends on the horizon, so it is built and inverted once
+per controller.  When the unconstrained optimum is inside the bounds it is
+returned directly; otherwise an accelerated projected gradient (FISTA,
+with adaptive restart) is run from whichever of the clipped unconstrained
+optimum and the previous step's solution shifted by one sample has the lower
+cost. It stops when the gradient mapping ``L * |y - u_next|`` drops below
+``tol``, a bound on how far the iterate is from stationarity, rather than on
+the step length, which can be tiny long before convergence.
+"""
+import numpy as np
+
+
+class MPCController:
+    def __init__(self, horizon, a=0.5, q=1.0, r_move=0.5, r_input=1e-3,
+                 u_min=80.0, u_max=100.0, tol=1e-6, max_iter=200):
+        if horizon < 1:
+            raise ValueError("horizon must be at least one step")
+        self.horizon = int(horizon)
+        self.a = a
+        self.q = q
+        self.r_move = r_move
+        self.r_input = r_input
+        self.u_min = u_min
+        self.u_max = u_max
+        self.tol = tol
+        self.max_iter = max_iter
+
+        n = self.horizon
+        steps = np.arange(n)
+        # x[1..N] = phi * x0 + gamma @ u
+        self._phi = a ** (steps + 1)
+        lag = steps[:, None] - steps[None, :]
+        self._gamma = np.where(lag >= 0, (1 - a) * a ** np.maximum(lag, 0), 0.0)
+        diff = np.eye(n) - np.eye(n, k=-1)
+
+        self._hessian = (q * self._gamma.T @ self._gamma
+                         + r_move * diff.T @ diff
+                         + r_input * np.eye(n))
+        self._hessian_inv = np.linalg.inv(self._hessian)
+        self._lipschitz = np.linalg.eigvalsh(self._hessian)[-1]
+        self._warm = None
+        self.last_iterations = 0
+
+    def reset(self):
+        self._warm = None
+
+    def predict(self, x0, u):
+        """Regulated power ``x[1..N]`` the model predicts for setpoints ``u``."""
+        return self._phi * x0 + self._gamma @ u
+
+    def _gradient_offset(self, x0, u_prev, disturbance, reference):
+        free = self._phi * x0 + disturbance - reference
+        g = self.q * self._gamma.T @ free - self.r_input * reference
+        g[0] -= self.r_move * u_prev
+        return g
+
+    def _cost(self, u, g):
+        """QP objective up to a constant."""
+        return 0.5 * u @ (self._hessian @ u) + g @ u
+
+    def solve(self, x0, u_prev, disturbance, reference):
+        """Return the optimal setpoint sequence over the horizon.
+
+        ``disturbance`` is the forecast of ``d`` over the next ``horizon``
+        samples (a scalar is held constant); ``reference`` may likewise be a
+        scalar or a per-step target.
+        """
+        n = self.horizon
+        disturbance = np.broadcast_to(np.asarray(disturbance, dtype=float), (n,))
+        reference = np.broadcast_to(np.asarray(reference, dtype=float), (n,))
+        g = self._gradient_offset(x0, u_prev, disturbance, reference)
+
+        u = -self._hessian_inv @ g
+        if u.min() >= self.u_min and u.max() <= self.u_max:
+            self.last_iterations = 0
+            self._warm = u
+            return u
+
+        u = np.clip(u, self.u_min, self.u_max)
+        if self._warm is not None:
+            shifted = np.empty(n)
+            shifted[:-1] = self._warm[1:]
+            shifted[-1] = self._warm[-1]
+            if self._cost(shifted, g) < self._cost(u, g):
+                u = shifted
+
+        y = u.copy()
+        t = 1.0
+        step = 1.0 / self._lipschitz
+        for it in range(1, self.max_iter + 1):
+            u_next = np.clip(y - step * (self._hessian @ y + g), self.u_min, self.u_max)
+            if np.max(np.abs(u_next - y)) * self._lipschitz < self.tol:
+                u = u_next
+                break
+            if np.dot(y - u_next, u_next - u) > 0:
+                # Momentum is pointing uphill: restart from the new iterate
+                y, u, t = u_next, u_next, 1.0
+                continue
+            t_next = 0.5 * (1.0 + np.sqrt(1.0 + 4.0 * t * t))
+            y = u_next + ((t - 1.0) / t_next) * (u_next - u)
+            u, t = u_next, t_next
+        self.last_iterations = it
+        self._warm = u
+        return u
+
+
+def simulate_closed_loop(disturbance, horizon, reference=91.0, forecast=None, x0=None, **kwargs):
+    """Run the MPC in closed loop against a measured disturbance sequence.
+
+    ``disturbance`` is the realised arc fluctuation per sample. ``forecast``
+    is what the controller is allowed to anticipate (e.g. the deterministic
+    part of the disturbance); by default the last measured value is held
+    over the horizon. Returns the controlled power ``x + d`` per sample.
+    """
+    disturbance = np.asarray(disturbance, dtype=float)
+    n = len(disturbance)
+    if forecast is not None:
+        forecast = np.asarray(forecast, dtype=float)
+        padded = np.concatenate([forecast, np.full(horizon, forecast[-1] if n else 0.0)])
+
+    controller = MPCController(horizon, **kwargs)
+    x = reference if x0 is None else x0
+    u_prev = x
+    power = np.empty(n)
+    for k in range(n):
+        power[k] = x + disturbance[k]
+        if forecast is None:
+            d_hat = disturbance[k]
+        else:
+            d_hat = padded[k + 1:k + 1 + horizon]
+        u = controller.solve(x, u_prev, d_hat, reference)
+        u_prev = u[0]
+        x = controller.a * x + (1 - controller.a) * u_prev
+    return power
@@ -0,0 +1,209 @@
+"""Opt-in per-rerun profiling for the dashboards.
+
+A :class:`Profiler` records named timing spans for one script run, with
+optional allocation and peak-memory figures from ``tracemalloc``, and counts
+reruns per page for the whole process. Flat scripts mark their sections
+with :meth:`Profiler.section` (each call closes the previous section);
+nested work can use :meth:`Profiler.span` as a context manager.
+
+Profiling is off unless the page is opened with ``?profile=1`` (timings)
+or ``?profile=memory`` (timings and memory), or ``ARC_OPTIMIZER_PROFILE``
+is set to one of those values. Every profiled run is shown in a collapsed
+debug panel and appended as one JSON line to ``ARC_OPTIMIZER_PROFILE_LOG``
+(default ``<cache root>/profile.jsonl``).
+
+``tracemalloc`` is process-wide, so memory profiling is serialised: one
+run at a time owns it, and a run that asks while another session's run is
+measuring gets timings only. Tracing is stopped when the owning run
+finishes, and also when a run cut short (an exception, ``st.stop()``, a
+widget-triggered rerun) is collected or the next profiled run takes over.
+"""
+import json
+import os
+import threading
+import time
+import tracemalloc
+import weakref
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+from pathlib import Path
+
+from arc_optimizer.historian import cache_root
+
+_reruns = Counter()
+# Reentrant: a memory owner's finalizer may run during garbage collection
+_lock = threading.RLock()
+# (token, profiler weakref, thread, started tracing) of the run measuring memory
+_memory_owner = None
+
+
+def default_log_path():
+    return Path(os.environ.get("ARC_OPTIMIZER_PROFILE_LOG", cache_root() / "profile.jsonl"))
+
+
+def _claim_memory(profiler):
+    """Make ``profiler`` the memory-measuring run; False if another live run holds it."""
+    global _memory_owner
+    with _lock:
+        if _memory_owner is not None:
+            token, owner, thread, _ = _memory_owner
+            current = threading.current_thread()
+            if owner() is not None and thread.is_alive() and thread is not current:
+                return False
+            # The owner's run ended without finishing (same script thread, or gone)
+            _release_memory(token)
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        token = object()
+        _memory_owner = (token, weakref.ref(profiler), threading.current_thread(), started)
+        profiler._memory_token = token
+        weakref.finalize(profiler, _release_memory, token)
+        return True
+
+
+def _release_memory(token):
+    global _memory_owner
+    with _lock:
+        if _memory_owner is None or _memory_owner[0] is not token:
+            return
+        if _memory_owner[3]:
+            tracemalloc.stop()
+        _memory_owner = None
+
+
+def rerun_count(page):
+    """Profiled runs of ``page`` in this process so far."""
+    return _reruns[page]
+
+
+class Profiler:
+    def __init__(self, page, memory=False, log_path=None):
+        self.page = page
+        self._memory_token = None
+        self.memory = memory and _claim_memory(self)
+        self.memory_busy = memory and not self.memory
+        self.log_path = Path(log_path) if log_path else default_log_path()
+        self.spans = []
+        self._stack = []
+        self._section = None
+        self._start = time.perf_counter()
+
+    def _open(self, name):
+        # The record goes in now so spans are listed in start order
+        record = {"name": name, "depth": len(self._stack), "seconds": 0.0}
+        self.spans.append(record)
+        entry = {"record": record, "start": time.perf_counter()}
+        if self.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                # The reset below would lose the parent's peak so far
+                self._stack[-1]["peak"] = max(self._stack[-1]["peak"], peak)
+            tracemalloc.reset_peak()
+            entry["mem_start"], entry["peak"] = current, current
+        self._stack.append(entry)
+        return entry
+
+    def _close(self, entry):
+        self._stack.remove(entry)
+        record = entry["record"]
+        record["seconds"] = time.perf_counter() - entry["start"]
+        if self.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            peak = max(entry["peak"], peak)
+            record["alloc_mb"] = (current - entry["mem_start"]) / 2**20
+            record["peak_mb"] = (peak - entry["mem_start"]) / 2**20
+            if self._stack:
+                self._stack[-1]["peak"] = max(self._stack[-1]["peak"], peak)
+
+    @contextmanager
+    def span(self, name):
+        entry = self._open(name)
+        try:
+            yield
+        finally:
+            self._close(entry)
+
+    def section(self, name):
+        """Close the running top-level section (if any) and start ``name``."""
+        if self._section is not None:
+            self._close(self._section)
+        self._section = self._open(name)
+
+    def finish(self):
+        """Close everything, count the rerun, append to the log; returns the run record."""
+        if self._section is not None:
+            self._close(self._section)
+            self._section = None
+        total = time.perf_counter() - self._start
+        if self._memory_token is not None:
+            _release_memory(self._memory_token)
+            self._memory_token = None
+        with _lock:
+            _reruns[self.page] += 1
+            reruns = _reruns[self.page]
+        run = {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            "page": self.page,
+            "pid": os.getpid(),
+            "rerun": reruns,
+            "seconds": total,
+            "memory_busy": self.memory_busy,
+            "spans": self.spans,
+        }
+        try:
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            with _lock, open(self.log_path, "a") as log:
+                log.write(json.dumps(run) + "\n")
+        except OSError:
+            pass  # profiling must never break the page
+        return run
+
+
+class NullProfiler:
+    """Stand-in used when profiling is off; every call is a no-op."""
+
+    def span(self, name):
+        return nullcontext()
+
+    def section(self, name):
+        pass
+
+    def finish(self):
+        return None
+
+
+def page_profiler(page):
+    """A :class:`Profiler` if this run asked for one, else a :class:`NullProfiler`."""
+    import streamlit as st
+
+    mode = st.query_params.get("profile") or os.environ.get("ARC_OPTIMIZER_PROFILE", "")
+    if mode not in ("1", "memory"):
+        return NullProfiler()
+    return Profiler(page, memory=mode == "memory")
+
+
+def show_profiler(profiler):
+    """Finish ``profiler`` and render its run in a collapsed debug panel."""
+    run = profiler.finish()
+    if run is None:
+        return
+    import streamlit as st
+
+    session_runs = st.session_state["profiler_runs"] = st.session_state.get("profiler_runs", 0) + 1
+    with st.expander(f"🛠️ Profiling – {run['seconds'] * 1000:.0f} ms", expanded=False):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Script Run", f"{run['seconds'] * 1000:.0f} ms")
+        with col2:
+            st.metric("Reruns (this session)", f"{session_runs}")
+        with col3:
+            st.metric("Reruns (process)", f"{run['rerun']}")
+        rows = [{"Section": "  " * s["depth"] + s["name"], "Time (ms)": s["seconds"] * 1000,
+                 **({"Allocated (MB)": s["alloc_mb"], "Peak (MB)": s["peak_mb"]} if "peak_mb" in s else {})}
+                for s in run["spans"]]
+        st.dataframe(rows, hide_index=True)
+        if run["memory_busy"]:
+            st.caption("Memory figures skipped: another session is profiling memory.")
+        st.caption(f"Logged to {profiler.log_path}")
@@ -0,0 +1,109 @@
+"""Downloadable report payloads, generated on demand and written in chunks.
+
+Reports are written batch by batch through pyarrow as CSV, zstd Parquet or
+zstd Arrow IPC. Each batch wraps slices of the source NumPy arrays (or
+memory-mapped channels) without copying them. The ``*_report`` functions
+return zero-argument callables for ``st.download_button``. Nothing is
+serialised until the button is clicked; the payload is then written into
+one Arrow buffer and handed to Streamlit as ``bytes``. NaN values (e.g. the
+padding of unequal-length columns) are written as nulls, so CSV cells are
+empty rather than ``nan``.
+"""
+import functools
+
+import numpy as np
+
+from arc_optimizer.historian import DEFAULT_CHUNK_ROWS
+from arc_optimizer.simulation import simulate_power
+
+# Label -> (file extension, MIME type)
+REPORT_FORMATS = {
+    "CSV": ("csv", "text/csv"),
+    "Parquet": ("parquet", "application/vnd.apache.parquet"),
+    "Arrow IPC": ("arrow", "application/vnd.apache.arrow.file"),
+}
+POWER_REPORT_COLUMNS = ("Time (min)", "Power Without MPC (MW)", "Power With MPC (MW)", "Savings (MW)")
+
+
+def _open_writer(sink, schema, fmt):
+    import pyarrow as pa
+
+    if fmt == "csv":
+        import pyarrow.csv as pacsv
+
+        return pacsv.CSVWriter(sink, schema)
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+
+        return pq.ParquetWriter(sink, schema, compression="zstd")
+    if fmt == "arrow":
+        return pa.ipc.new_file(sink, schema, options=pa.ipc.IpcWriteOptions(compression="zstd"))
+    raise ValueError(f"unknown report format {fmt!r}; expected one of "
+                     f"{[ext for ext, _ in REPORT_FORMATS.values()]}")
+
+
+def write_batches(sink, batches, fmt="csv"):
+    """Write an iterable of ``pyarrow.RecordBatch`` to ``sink`` (a path or binary file)."""
+    writer = None
+    rows = 0
+    try:
+        for batch in batches:
+            if writer is None:
+                writer = _open_writer(sink, batch.schema, fmt)
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def column_batches(columns, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Record batches over a ``name -> array`` mapping, ``chunk_rows`` rows at a time."""
+    import pyarrow as pa
+
+    names = list(columns)
+    n = len(columns[names[0]])
+    for start in range(0, n, chunk_rows):
+        stop = min(start + chunk_rows, n)
+        yield pa.RecordBatch.from_arrays([pa.array(np.asarray(columns[name][start:stop]), from_pandas=True)
+                                          for name in names], names=names)
+
+
+def power_report_batches(time, base_power, mpc_power, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Record batches of the power report; savings are computed one chunk at a time."""
+    import pyarrow as pa
+
+    for start in range(0, len(time), chunk_rows):
+        chunk = slice(start, start + chunk_rows)
+        base, mpc = np.asarray(base_power[chunk]), np.asarray(mpc_power[chunk])
+        arrays = [np.asarray(time[chunk]), base, mpc, np.clip(base - mpc, 0, None)]
+        yield pa.RecordBatch.from_arrays([pa.array(a, from_pandas=True) for a in arrays], names=list(POWER_REPORT_COLUMNS))
+
+
+def report_bytes(batches, fmt="csv"):
+    """Write ``batches`` into an in-memory Arrow buffer and return its contents as ``bytes``."""
+    import pyarrow as pa
+
+    sink = pa.BufferOutputStream()
+    write_batches(sink, batches, fmt)
+    return sink.getvalue().to_pybytes()
+
+
+def power_report(time, base_power, mpc_power, fmt="csv", chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Deferred power report over the given channels, for ``st.download_button``."""
+    return lambda: report_bytes(power_report_batches(time, base_power, mpc_power, chunk_rows), fmt)
+
+
+def columns_report(columns, fmt="csv", chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Deferred report of arbitrary columns (e.g. a DataFrame's), for ``st.download_button``."""
+    return lambda: report_bytes(column_batches(columns, chunk_rows), fmt)
+
+
+def _prediction_report(duration, prediction_minutes, fmt, seed):
+    return report_bytes(power_report_batches(*simulate_power(duration, prediction_minutes, seed)), fmt)
+
+
+def prediction_report(duration, prediction_minutes, fmt="csv", seed=0):
+    """Deferred report of the full simulated window with per-sample savings."""
+    return functools.partial(_prediction_report, duration, prediction_minutes, fmt, seed)
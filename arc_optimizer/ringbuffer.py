@@ -0,0 +1,73 @@
+"""Fixed-capacity multi-channel sample buffer for 24/7 live windows.
+
+Samples are stored channel-major in one preallocated array of
+``capacity + slack`` columns. Appends write at the head; when the head
+reaches the end of the storage, the samples still inside the window are
+moved back to the start in one copy (once every ``slack`` appends, so O(1)
+amortised). In exchange every window returned by :meth:`RingBuffer.latest`
+is a contiguous, zero-copy view and nothing is ever reallocated.
+
+Views alias the storage: they stay valid until the next append, so copy
+them if they must outlive the current tick.
+"""
+import numpy as np
+
+
+class RingBuffer:
+    def __init__(self, capacity, channels, slack=None, dtype=np.float64):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = int(capacity)
+        self.channels = tuple(channels)
+        self._index = {name: i for i, name in enumerate(self.channels)}
+        self.slack = self.capacity if slack is None else max(int(slack), 1)
+        self._data = np.zeros((len(self.channels), self.capacity + self.slack), dtype=dtype)
+        self._head = 0
+        self.total = 0
+
+    def __len__(self):
+        return min(self._head, self.capacity)
+
+    @property
+    def nbytes(self):
+        return self._data.nbytes
+
+    def _compact(self, incoming=1):
+        # Keep only what is still inside the window once ``incoming`` samples land
+        keep = min(self._head, self.capacity - incoming)
+        self._data[:, :keep] = self._data[:, self._head - keep:self._head]
+        self._head = keep
+
+    def append(self, *values):
+        """Append one sample given as one value per channel."""
+        if self._head == self._data.shape[1]:
+            self._compact()
+        self._data[:, self._head] = values
+        self._head += 1
+        self.total += 1
+
+    def extend(self, *columns):
+        """Append a batch given as one equal-length array per channel."""
+        n = len(columns[0])
+        if n > self.capacity:
+            columns = [np.asarray(c)[-self.capacity:] for c in columns]
+            self.total += n - self.capacity
+            n = self.capacity
+        if self._head + n > self._data.shape[1]:
+            self._compact(n)
+        for row, values in zip(self._data, columns):
+            row[self._head:self._head + n] = values
+        self._head += n
+        self.total += n
+
+    def latest(self, n=None):
+        """Contiguous ``(channels, n)`` view of the newest ``n`` samples (default: all)."""
+        n = len(self) if n is None else min(n, len(self))
+        return self._data[:, self._head - n:self._head]
+
+    def channel(self, name, n=None):
+        return self.latest(n)[self._index[name]]
+
+    def clear(self):
+        self._head = 0
+        self.total = 0
@@ -0,0 +1,144 @@
+"""ROI / payback calculations, deterministic and Monte Carlo.
+
+``payback_months`` is the dashboards' chain
+
+    monthly_tons -> monthly_kwh_saved -> monthly_eur_saved -> roi_months
+
+written with NumPy operations only, so every argument may be a scalar or an
+array and the same function evaluates one sidebar point or millions of
+sampled scenarios at once.
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from arc_optimizer.cache import memoize
+
+PERCENTILES = (5, 10, 25, 50, 75, 90, 95)
+
+
+def monthly_tons(tap_weight, heats_per_day, days_per_month):
+    return tap_weight * heats_per_day * days_per_month
+
+
+def monthly_kwh_saved(tap_weight, heats_per_day, days_per_month, energy_baseline, saving_pct):
+    return monthly_tons(tap_weight, heats_per_day, days_per_month) * energy_baseline * (saving_pct / 100)
+
+
+def monthly_eur_saved(tap_weight, heats_per_day, days_per_month, energy_baseline,
+                      saving_pct, electricity_price):
+    return monthly_kwh_saved(tap_weight, heats_per_day, days_per_month, energy_baseline,
+                             saving_pct) * electricity_price
+
+
+def payback_months(software_cost, tap_weight, heats_per_day, days_per_month, energy_baseline,
+                   saving_pct, electricity_price):
+    """Months until ``software_cost`` is recovered; ``inf`` where nothing is saved."""
+    eur = np.asarray(monthly_eur_saved(tap_weight, heats_per_day, days_per_month,
+                                       energy_baseline, saving_pct, electricity_price), dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        months = np.where(eur > 0, np.divide(software_cost, eur), np.inf)
+    return months if months.ndim else float(months)
+
+
+# --- Monte Carlo ---
+#
+# Each uncertain input is either a fixed number or a tuple:
+#   ("normal", mean, sd)  ("uniform", low, high)  ("triangular", low, mode, high)
+# Normal draws are clipped at zero; heats per day and working days are rounded
+# to whole numbers and clipped to at least one.
+
+UNCERTAIN_INPUTS = ("electricity_price", "saving_pct", "heats_per_day",
+                    "days_per_month", "energy_baseline")
+_WHOLE_NUMBERS = ("heats_per_day", "days_per_month")
+
+
+def _sample(rng, spec, n):
+    if np.isscalar(spec):
+        return np.full(n, float(spec))
+    kind, *params = spec
+    if kind == "normal":
+        return np.maximum(rng.normal(params[0], params[1], n), 0.0)
+    if kind == "uniform":
+        return rng.uniform(params[0], params[1], n)
+    if kind == "triangular":
+        return rng.triangular(params[0], params[1], params[2], n)
+    raise ValueError(f"unknown distribution {kind!r}")
+
+
+def _chunk_histogram(seed, n, software_cost, tap_weight, inputs, edges):
+    rng = np.random.default_rng(seed)
+    draws = {}
+    for name in UNCERTAIN_INPUTS:
+        values = _sample(rng, inputs[name], n)
+        if name in _WHOLE_NUMBERS:
+            values = np.maximum(np.rint(values), 1.0)
+        draws[name] = values
+    months = payback_months(software_cost, tap_weight, **draws)
+
+    bins = len(edges) - 1
+    width = edges[1] - edges[0]
+    # Slot ``bins`` collects everything beyond the range, including inf (no payback)
+    index = np.minimum(months / width, bins).astype(np.intp)
+    counts = np.bincount(index, minlength=bins + 1)
+    finite = months[np.isfinite(months)]
+    return counts, float(finite.sum()), len(finite)
+
+
+@memoize(maxsize=16)
+def monte_carlo_payback(software_cost, tap_weight, electricity_price, saving_pct, heats_per_day,
+                        days_per_month, energy_baseline, n_scenarios=1_000_000, seed=0,
+                        chunk_size=1_000_000, max_months=120.0, bins=2400, processes=None):
+    """Payback-time distribution over ``n_scenarios`` sampled scenarios.
+
+    Scenarios are evaluated in chunks of ``chunk_size`` so memory stays
+    bounded, optionally across ``processes`` worker processes. Each chunk has
+    its own child seed spawned from ``seed``, so results are identical however
+    the chunks are distributed. Percentiles are interpolated from a histogram
+    of ``bins`` bins over ``[0, max_months]``; scenarios beyond that (or that
+    never pay back) land in an overflow slot and read as ``inf``. Results are
+    cached on the arguments, which must therefore be hashable.
+    """
+    inputs = {"electricity_price": electricity_price, "saving_pct": saving_pct,
+              "heats_per_day": heats_per_day, "days_per_month": days_per_month,
+              "energy_baseline": energy_baseline}
+    edges = np.linspace(0.0, max_months, bins + 1)
+    sizes = [min(chunk_size, n_scenarios - start) for start in range(0, n_scenarios, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    jobs = [(s, n, software_cost, tap_weight, inputs, edges) for s, n in zip(seeds, sizes)]
+
+    if processes and processes > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            results = list(pool.map(_chunk_histogram, *zip(*jobs)))
+    else:
+        results = [_chunk_histogram(*job) for job in jobs]
+
+    counts = np.sum([r[0] for r in results], axis=0)
+    finite_sum = sum(r[1] for r in results)
+    finite_n = sum(r[2] for r in results)
+
+    cdf = np.cumsum(counts[:-1]) / n_scenarios
+    percentiles = {}
+    for p in PERCENTILES:
+        q = p / 100
+        i = int(np.searchsorted(cdf, q))
+        if i >= bins:
+            percentiles[p] = float("inf")
+            continue
+        below = cdf[i - 1] if i else 0.0
+        percentiles[p] = float(edges[i] + (edges[i + 1] - edges[i]) * (q - below) / (cdf[i] - below))
+    return {
+        "n_scenarios": n_scenarios,
+        "percentiles": percentiles,
+        "mean_finite": finite_sum / finite_n if finite_n else float("inf"),
+        "counts": counts[:-1],
+        "edges": edges,
+        "cdf": cdf,
+        "overflow": int(counts[-1]),
+    }
+
+
+def probability_within(result, months):
+    """Share of scenarios in a :func:`monte_carlo_payback` result that pay back within ``months``."""
+    i = int(np.searchsorted(result["edges"], months, side="right")) - 1
+    return float(result["cdf"][min(i, len(result["cdf"])) - 1]) if i > 0 else 0.0
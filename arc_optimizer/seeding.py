@@ -0,0 +1,40 @@
+"""Explicit random streams for the simulations.
+
+Nothing in the package draws from NumPy's global random state. Every
+simulation takes a ``seed`` that is turned into its own
+:class:`numpy.random.Generator`, so concurrent sessions never share state.
+A batch of scenarios takes one root seed and gives each scenario a child
+stream spawned from it. Scenario ``i`` then gets the same numbers whether
+the batch runs in one process, across threads or across worker processes,
+and however the work is split.
+"""
+import numpy as np
+
+
+def generator(seed=0):
+    """A Generator for ``seed``: an int, a ``SeedSequence`` or an existing Generator."""
+    return seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+
+
+def spawn_seeds(root_seed, n):
+    """``n`` independent child ``SeedSequence`` streams of ``root_seed``.
+
+    The children depend only on the value of ``root_seed``: a ``SeedSequence``
+    is spawned from a copy, since ``spawn`` on the original would advance its
+    child counter and hand out different streams on the next call.
+    """
+    if isinstance(root_seed, np.random.SeedSequence):
+        root = np.random.SeedSequence(root_seed.entropy, spawn_key=root_seed.spawn_key,
+                                      pool_size=root_seed.pool_size)
+    else:
+        root = np.random.SeedSequence(root_seed)
+    return root.spawn(n)
+
+
+def seed_key(seed):
+    """Hashable, value-based cache key for an int or ``SeedSequence`` seed."""
+    if isinstance(seed, np.random.SeedSequence):
+        return ("SeedSequence", seed.entropy, seed.spawn_key, seed.pool_size)
+    if isinstance(seed, np.random.Generator):
+        raise TypeError("cached simulations need a seed, not a stateful Generator")
+    return seed
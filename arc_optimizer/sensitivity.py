@@ -0,0 +1,67 @@
+"""Sensitivity (tornado) and grid sweeps of the ROI chain.
+
+Every sweep builds broadcastable arrays for the inputs and makes a single
+call into :mod:`arc_optimizer.roi`, so a 1000 x 1000 grid is one vectorized
+evaluation.
+"""
+import numpy as np
+
+from arc_optimizer.roi import monthly_eur_saved, payback_months
+
+INPUTS = ("software_cost", "tap_weight", "heats_per_day", "days_per_month",
+          "energy_baseline", "saving_pct", "electricity_price")
+
+LABELS = {
+    "software_cost": "Software Cost (€)",
+    "tap_weight": "Tap Weight (tons)",
+    "heats_per_day": "Heats per Day",
+    "days_per_month": "Working Days per Month",
+    "energy_baseline": "Consumption (kWh/ton)",
+    "saving_pct": "Energy Saving (%)",
+    "electricity_price": "Electricity Price (€/kWh)",
+}
+
+METRICS = {
+    "payback_months": payback_months,
+    "monthly_eur_saved": lambda software_cost, **inputs: monthly_eur_saved(**inputs),
+}
+
+
+def evaluate(base, metric="payback_months", **overrides):
+    """Evaluate ``metric`` at ``base`` with some inputs replaced by (broadcastable) arrays."""
+    inputs = {name: overrides.get(name, base[name]) for name in INPUTS}
+    return METRICS[metric](**inputs)
+
+
+def tornado(base, swing_pct=20.0, metric="payback_months"):
+    """Low/high ``metric`` when each input alone moves by ``-/+ swing_pct`` %.
+
+    Returns ``(names, low, high, base_value)`` sorted by decreasing swing.
+    """
+    names = list(INPUTS)
+    n = len(names)
+    factor = np.array([1 - swing_pct / 100, 1 + swing_pct / 100])
+    # Row i varies only input i; column 0 is the low case, column 1 the high case
+    overrides = {}
+    for i, name in enumerate(names):
+        values = np.full((n, 2), float(base[name]))
+        values[i] = base[name] * factor
+        overrides[name] = values
+    result = np.asarray(evaluate(base, metric, **overrides), dtype=float)
+    low, high = result[:, 0], result[:, 1]
+    with np.errstate(invalid="ignore"):
+        order = np.argsort(-np.nan_to_num(np.abs(high - low), posinf=np.finfo(float).max))
+    return [names[i] for i in order], low[order], high[order], evaluate(base, metric)
+
+
+def sweep(base, name, values, metric="payback_months"):
+    """``metric`` for each value of one input, others held at ``base``."""
+    return evaluate(base, metric, **{name: np.asarray(values, dtype=float)})
+
+
+def grid(base, x_name, x_values, y_name, y_values, metric="payback_months"):
+    """``metric`` over the ``len(y_values) x len(x_values)`` grid of two inputs."""
+    x = np.asarray(x_values, dtype=float)[None, :]
+    y = np.asarray(y_values, dtype=float)[:, None]
+    result = evaluate(base, metric, **{x_name: x, y_name: y})
+    return np.broadcast_to(result, (y.shape[0], x.shape[1]))
@@ -0,0 +1,99 @@
+"""Simulated EAF power series shared by the dashboards."""
+import numpy as np
+
+from arc_optimizer.cache import memoize
+from arc_optimizer.forecast import ARForecaster
+from arc_optimizer.mpc import simulate_closed_loop
+from arc_optimizer.seeding import generator, seed_key
+
+SAMPLES_PER_MINUTE = 4
+
+# MPC OFF: the operator holds a fixed setpoint and the arc fluctuates around it
+BASE_SETPOINT = 92.5
+# MPC ON: energy-optimal power target the controller regulates to
+MPC_REFERENCE = 91.0
+# Controller horizon used when a dashboard has no prediction window of its own
+DEFAULT_HORIZON_MINUTES = 5
+
+
+def arc_fluctuation(time):
+    """Deterministic (forecastable) part of the arc power fluctuation in MW."""
+    return 1.5 * np.sin(0.25 * time + 0.5) + 0.8 * np.sin(0.35 * time)
+
+
+@memoize(maxsize=64, key=lambda duration, prediction_minutes=0, seed=0: (duration, prediction_minutes, seed_key(seed)))
+def simulate_power(duration, prediction_minutes=0, seed=0):
+    """Return ``time``, ``base_power`` and ``mpc_power`` for a simulated heat.
+
+    ``mpc_power`` comes from the receding-horizon controller in
+    :mod:`arc_optimizer.mpc` with a horizon of ``prediction_minutes`` worth of
+    samples, or ``DEFAULT_HORIZON_MINUTES`` when there is no prediction window.
+    ``seed`` is an int or a ``SeedSequence`` (e.g. one of
+    :func:`~arc_optimizer.seeding.spawn_seeds`). Results are cached on
+    ``(duration, prediction_minutes, seed)`` and the returned arrays are
+    read-only.
+    """
+    total_minutes = duration + prediction_minutes
+    time = np.linspace(0, total_minutes, total_minutes * SAMPLES_PER_MINUTE)
+    noise = 0.8 * generator(seed).standard_normal(len(time))
+
+    forecast = arc_fluctuation(time)
+    disturbance = forecast + noise
+    base_power = BASE_SETPOINT + disturbance
+
+    horizon = (prediction_minutes or DEFAULT_HORIZON_MINUTES) * SAMPLES_PER_MINUTE
+    mpc_power = simulate_closed_loop(disturbance, horizon, reference=MPC_REFERENCE,
+                                     forecast=forecast, x0=BASE_SETPOINT)
+    return time, base_power, mpc_power
+
+
+@memoize(maxsize=64, key=lambda duration, prediction_minutes, seed=0: (duration, prediction_minutes, seed_key(seed)))
+def forecast_curves(duration, prediction_minutes, seed=0):
+    """Return ``time``, ``live_power`` and ``prediction_power`` for the event-detection views.
+
+    The live curve is the MPC ON profile; the prediction adds an offset, a
+    faster oscillation and noise. Cached like :func:`simulate_power`.
+    """
+    total_minutes = duration + prediction_minutes
+    time = np.linspace(0, total_minutes, total_minutes * SAMPLES_PER_MINUTE)
+    live_power = 91 + 1.5 * np.sin(0.25 * time + 0.5)
+    noise = 0.6 * generator(seed).standard_normal(len(time))
+    prediction_power = live_power + 1.2 + 0.5 * np.sin(0.35 * time) + noise
+    return time, live_power, prediction_power
+
+
+@memoize(maxsize=64, key=lambda duration, prediction_minutes, seed=0: (duration, prediction_minutes, seed_key(seed)))
+def predicted_power(duration, prediction_minutes, seed=0):
+    """Forecast ``time``, ``base_power``, ``mpc_power`` and ``std`` over the prediction window.
+
+    Only the first ``duration`` minutes of the simulated heat are observed.
+    The MPC OFF power (setpoint plus arc disturbance) and the regulated power
+    (MPC ON minus the disturbance) each get an online AR forecaster; the MPC
+    ON forecast is the regulated forecast plus the forecast disturbance, so
+    both curves share the disturbance's ``std``. Cached like
+    :func:`simulate_power`.
+    """
+    time, base_power, mpc_power = simulate_power(duration, prediction_minutes, seed)
+    live_end = duration * SAMPLES_PER_MINUTE
+    horizon = len(time) - live_end
+    disturbance = ARForecaster()
+    disturbance.update_batch(base_power[:live_end])
+    pred_base, std = disturbance.forecast(horizon)
+    regulated = ARForecaster()
+    regulated.update_batch(mpc_power[:live_end] - base_power[:live_end] + BASE_SETPOINT)
+    pred_mpc = regulated.forecast(horizon)[0] + (pred_base - BASE_SETPOINT)
+    return time[live_end:], pred_base, pred_mpc, std
+
+
+@memoize(maxsize=64, key=lambda duration, prediction_minutes, seed=0: (duration, prediction_minutes, seed_key(seed)))
+def predicted_saving_pct(duration, prediction_minutes, seed=0):
+    """Mean clipped forecast savings over the prediction window as % of MPC OFF power."""
+    _, pred_base, pred_mpc, _ = predicted_power(duration, prediction_minutes, seed)
+    return saving_pct(pred_base, pred_mpc)
+
+
+def saving_pct(base_power, mpc_power):
+    """Mean clipped savings as % of mean MPC OFF power."""
+    savings = np.clip(base_power - mpc_power, 0, None)
+    mean_base = np.mean(base_power)
+    return float(np.mean(savings) / mean_base * 100) if mean_base != 0 else 0.0
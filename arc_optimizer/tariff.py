@@ -0,0 +1,230 @@
+"""Heat scheduling against a time-of-use electricity tariff.
+
+The month is cut into slots of ``slot_minutes``. A heat started in slot
+``s`` occupies the furnace for its tap-to-tap time and draws its energy
+evenly over the power-on part, so its energy cost is a fixed number per
+start slot (one cumulative sum over the slot prices). Placing exactly
+``heats_per_day`` heats on every day without overlap and outside
+maintenance windows is then a shortest path over ``(slot, heats started
+today)`` states, solved by forward dynamic programming with one small
+vector operation per slot.
+
+A peak-demand charge is billed on the highest furnace demand inside the
+``demand_hours``. A single furnace either draws its full power-on demand
+in those hours or stays out of them, so both cases are solved (the second
+with those hours closed to power-on) and the cheaper schedule is kept.
+"""
+import csv
+from typing import NamedTuple
+
+import numpy as np
+
+SLOT_MINUTES = 15
+
+# Example day-ahead profile (€/kWh per hour): cheap nights, a morning
+# shoulder and an evening peak
+EXAMPLE_PRICES = (0.07,) * 6 + (0.10,) * 2 + (0.12,) * 9 + (0.17,) * 4 + (0.10,) * 2 + (0.07,)
+# Hours in which the example contract measures billed peak demand
+EXAMPLE_DEMAND_HOURS = tuple(17 <= hour < 21 for hour in range(24))
+
+
+class Schedule(NamedTuple):
+    starts: np.ndarray      # heat start times, minutes from the start of the month
+    energy_kwh: float
+    energy_eur: float
+    peak_kw: float          # billed peak demand (0 when no power-on slot falls in the demand hours)
+    demand_eur: float
+
+    @property
+    def total_eur(self):
+        return self.energy_eur + self.demand_eur
+
+
+def _slot_values(hourly, days, slot_minutes, name):
+    """Expand an hourly vector (one day, repeated, or the whole month) to slots."""
+    hourly = np.asarray(hourly)
+    hours = days * 24
+    if len(hourly) == 24:
+        hourly = np.tile(hourly, days)
+    elif len(hourly) < hours:
+        raise ValueError(f"{name} needs 24 or at least {hours} hourly values, got {len(hourly)}")
+    return np.repeat(hourly[:hours], 60 // slot_minutes)
+
+
+def _heat_slots(tap_to_tap_min, power_on_min, slot_minutes):
+    duration = int(np.ceil(tap_to_tap_min / slot_minutes))
+    power_on = min(max(int(round(power_on_min / slot_minutes)), 1), duration)
+    return duration, power_on
+
+
+def _window_sums(values, width):
+    """``values[s:s + width].sum()`` for every start ``s`` (shorter near the end)."""
+    cumulative = np.concatenate([[0.0], np.cumsum(values, dtype=float)])
+    ends = np.minimum(np.arange(len(values)) + width, len(values))
+    return cumulative[ends] - cumulative[:len(values)]
+
+
+def _solve(start_cost, allowed, heats_per_day, slots_per_day, duration):
+    """Cheapest start slots with exactly ``heats_per_day`` starts per day and no overlap."""
+    n_slots = len(start_cost)
+    n = heats_per_day
+    best = np.full((n_slots + 1, n + 1), np.inf)
+    best[0, 0] = 0.0
+    # Whether the best path into (slot, count) ends with a heat rather than an idle slot
+    via_heat = np.zeros((n_slots + 1, n + 1), dtype=bool)
+    idle_rollover = np.full(n + 1, np.inf)
+    for t in range(n_slots):
+        row = best[t]
+        nxt = t + 1
+        if nxt % slots_per_day == 0:
+            # Day boundary: only a day with all its heats continues, as a fresh day
+            idle_rollover[0] = row[n]
+            candidate = idle_rollover
+        else:
+            candidate = row
+        better = candidate < best[nxt]
+        best[nxt, better] = candidate[better]
+        via_heat[nxt, better] = False
+
+        end = t + duration
+        if not allowed[t] or end > n_slots:
+            continue
+        target = best[end]
+        if end // slots_per_day != t // slots_per_day:
+            # The heat runs into the next day; it must be the day's last
+            cost = row[n - 1] + start_cost[t]
+            if cost < target[0]:
+                target[0] = cost
+                via_heat[end, 0] = True
+        else:
+            candidate = row[:-1] + start_cost[t]
+            better = candidate < target[1:]
+            target[1:][better] = candidate[better]
+            via_heat[end, 1:][better] = True
+
+    if not np.isfinite(best[n_slots, 0]):
+        raise ValueError("no feasible schedule: too many heats for the open hours of some day")
+    starts = []
+    t, count = n_slots, 0
+    while t > 0:
+        if via_heat[t, count]:
+            s = t - duration
+            count = n - 1 if t // slots_per_day != s // slots_per_day else count - 1
+            starts.append(s)
+            t = s
+        else:
+            if t % slots_per_day == 0:
+                count = n
+            t -= 1
+    return np.array(starts[::-1], dtype=np.intp)
+
+
+def _open_slots(n_slots, maintenance, slot_minutes):
+    """Slots outside the ``(start_hour, end_hour)`` maintenance windows (hours from the month start)."""
+    open_ = np.ones(n_slots, dtype=bool)
+    for start_hour, end_hour in maintenance:
+        lo = max(int(np.floor(start_hour * 60 / slot_minutes)), 0)
+        hi = min(int(np.ceil(end_hour * 60 / slot_minutes)), n_slots)
+        open_[lo:hi] = False
+    return open_
+
+
+def _evaluate(starts, price, demand, power_on, heat_kwh, heat_kw, demand_charge, slot_minutes):
+    energy_eur = float(_window_sums(price, power_on)[starts].sum() * heat_kwh / power_on)
+    if demand is None:
+        in_demand_hours = len(starts) > 0
+    else:
+        in_demand_hours = bool(_window_sums(demand, power_on)[starts].any())
+    peak_kw = heat_kw if in_demand_hours else 0.0
+    return Schedule(starts * slot_minutes, heat_kwh * len(starts), energy_eur, peak_kw, peak_kw * demand_charge)
+
+
+def schedule_heats(prices, days, heats_per_day, heat_kwh, tap_to_tap_min=60, power_on_min=45,
+                   maintenance=(), demand_charge=0.0, demand_hours=None, slot_minutes=SLOT_MINUTES,
+                   baseline=False):
+    """Place ``heats_per_day`` heats on each of ``days`` days at minimum electricity cost.
+
+    ``prices`` are €/kWh per hour, either one day (repeated) or the whole
+    month. ``maintenance`` lists ``(start_hour, end_hour)`` windows, in hours
+    from the start of the month, in which no heat may run. ``demand_charge``
+    is €/kW on the billed peak, measured only in the hours flagged by
+    ``demand_hours`` (same layout as ``prices``; all hours when omitted).
+
+    With ``baseline=True`` the prices are ignored and heats are spread as
+    evenly over each day as the maintenance windows allow, which is the
+    plant's usual pattern to compare the optimized schedule against.
+    Returns a :class:`Schedule`.
+    """
+    if 60 % slot_minutes:
+        raise ValueError("slot_minutes must divide an hour")
+    slots_per_day = 24 * 60 // slot_minutes
+    duration, power_on = _heat_slots(tap_to_tap_min, power_on_min, slot_minutes)
+    price = _slot_values(prices, days, slot_minutes, "prices")
+    demand = None if demand_hours is None else _slot_values(demand_hours, days, slot_minutes, "demand_hours")
+    open_ = _open_slots(len(price), maintenance, slot_minutes)
+    # A heat may start only if it ends before the next closed slot
+    allowed = _window_sums(~open_, duration) == 0
+    heat_kw = heat_kwh / (power_on * slot_minutes / 60)
+    args = (price, demand, power_on, heat_kwh, heat_kw, demand_charge, slot_minutes)
+
+    if baseline:
+        slot_of_day = np.arange(len(price)) % slots_per_day
+        spacing = slots_per_day / heats_per_day
+        offset = np.abs(slot_of_day / spacing - np.round(slot_of_day / spacing))
+        starts = _solve(offset, allowed, heats_per_day, slots_per_day, duration)
+        return _evaluate(starts, *args)
+
+    start_cost = _window_sums(price, power_on) * (heat_kwh / power_on)
+    candidates = [_solve(start_cost, allowed, heats_per_day, slots_per_day, duration)]
+    if demand is not None and demand_charge > 0:
+        # Also try keeping every power-on slot out of the demand hours
+        quiet = allowed & (_window_sums(demand, power_on) == 0)
+        try:
+            candidates.append(_solve(start_cost, quiet, heats_per_day, slots_per_day, duration))
+        except ValueError:
+            pass
+    return min((_evaluate(starts, *args) for starts in candidates), key=lambda s: s.total_eur)
+
+
+def parse_prices(text):
+    """Hourly prices from CSV text: the ``price`` column if there is one, else the last column."""
+    rows = list(csv.reader(text.splitlines()))
+    header = [name.strip().lower() for name in rows[0]]
+    try:
+        [float(value) for value in rows[0]]
+    except ValueError:
+        rows = rows[1:]
+    else:
+        header = []
+    column = header.index("price") if "price" in header else -1
+    return np.array([float(row[column]) for row in rows if row])
+
+
+def weekly_maintenance(days, weekday, start_hour, hours):
+    """``(start_hour, end_hour)`` windows for a stop every 7 days from ``weekday`` (0 = first day)."""
+    return [(day * 24 + start_hour, day * 24 + start_hour + hours) for day in range(weekday, days, 7)]
+
+
+def tariff_savings(prices, days, heats_per_day, tap_weight, energy_baseline, saving_pct,
+                   flat_price, software_cost, **schedule_args):
+    """Optimized vs. evenly spaced schedule, and MPC savings at tariff prices vs. the flat-price ROI.
+
+    MPC saves ``saving_pct`` of every heat's energy at the prices of the
+    hours the heat runs in, so its € value follows the schedule.
+    """
+    heat_kwh = tap_weight * energy_baseline
+    optimized = schedule_heats(prices, days, heats_per_day, heat_kwh, **schedule_args)
+    baseline = schedule_heats(prices, days, heats_per_day, heat_kwh, baseline=True, **schedule_args)
+    flat_eur = optimized.energy_kwh * flat_price
+    mpc_eur = optimized.energy_eur * saving_pct / 100
+    flat_mpc_eur = flat_eur * saving_pct / 100
+    return {
+        "optimized": optimized,
+        "baseline": baseline,
+        "flat_eur": flat_eur,
+        "scheduling_eur_saved": baseline.total_eur - optimized.total_eur,
+        "mpc_eur_saved": mpc_eur,
+        "flat_mpc_eur_saved": flat_mpc_eur,
+        "payback_months": software_cost / mpc_eur if mpc_eur > 0 else float("inf"),
+        "flat_payback_months": software_cost / flat_mpc_eur if flat_mpc_eur > 0 else float("inf"),
+    }
@@ -0,0 +1,54 @@
+"""Vectorized run-length detection of savings zones."""
+from typing import NamedTuple
+
+import numpy as np
+
+
+class Zones(NamedTuple):
+    start: np.ndarray   # index of the first sample in each zone
+    end: np.ndarray     # index of the last sample in each zone (inclusive)
+    length: np.ndarray  # samples per zone
+    energy: np.ndarray  # trapezoid integral of ``savings`` over each zone
+
+    def longer_than(self, min_length):
+        keep = self.length > min_length
+        return Zones(*(field[keep] for field in self))
+
+
+def find_zones(mask, time=None, savings=None):
+    """Return every run of ``True`` in ``mask`` in a single vectorized pass.
+
+    When ``savings`` is given, ``energy`` holds its trapezoid integral over
+    ``time`` within each zone (in ``savings`` units x ``time`` units);
+    otherwise it is all zeros.
+    """
+    mask = np.asarray(mask, dtype=bool)
+    n = len(mask)
+    if n == 0:
+        empty = np.zeros(0, dtype=np.intp)
+        return Zones(empty, empty, empty, np.zeros(0))
+    # Runs alternate between True and False at every change point
+    changes = np.flatnonzero(mask[1:] != mask[:-1]) + 1
+    bounds = np.concatenate(([0], changes, [n]))
+    first = 0 if mask[0] else 1
+    start = bounds[:-1][first::2]
+    end = bounds[1:][first::2] - 1
+    length = end - start + 1
+
+    if savings is None or len(start) == 0:
+        return Zones(start, end, length, np.zeros(len(start)))
+    if time is None:
+        raise ValueError("time is required to integrate savings")
+
+    savings = np.asarray(savings, dtype=float)
+    time = np.asarray(time, dtype=float)
+    # increments[i] integrates [i, i + 1]; the trailing 0 keeps every zone end a valid index
+    increments = np.empty(len(savings))
+    np.multiply(0.5 * (savings[1:] + savings[:-1]), np.diff(time), out=increments[:-1])
+    increments[-1] = 0.0
+    segments = np.empty(2 * len(start), dtype=np.intp)
+    segments[0::2] = start
+    segments[1::2] = end
+    energy = np.add.reduceat(increments, segments)[0::2]
+    energy[length == 1] = 0.0
+    return Zones(start, end, length, energy)
@@ -1,15 +1,18 @@
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
-import pandas as pd
-import io
-from PIL import Image
+
+from arc_optimizer.assets import logo_bytes
+from arc_optimizer.events import EventDetector, event_spans
+from arc_optimizer.profiling import page_profiler, show_profiler
+from arc_optimizer.reports import REPORT_FORMATS, columns_report
+from arc_optimizer.simulation import forecast_curves
 
 st.set_page_config(page_title="Arc Optimizer Dashboard", layout="wide")
+profiler = page_profiler("events")
 
 # --- Company Logo ---
-logo = Image.open("images.png")
-st.image(logo, width=120, use_column_width=False)
+profiler.section("layout")
+st.image(logo_bytes(), width=120)
 
 # --- Editable Company Name ---
 company_name = st.sidebar.text_input("Company Name", value="Your Company")
@@ -17,6 +20,7 @@ company_name = st.sidebar.text_input("Company Name", value="Your Company")
 st.title(f"{company_name} ⚡ Arc Optimizer – EAF Optimization Dashboard")
 
 # --- Editable Parameters ---
+profiler.section("inputs")
 st.sidebar.header("Furnace & Cost Settings")
 tap_weight = st.sidebar.number_input("Tap Weight per Heat (tons)", value=145)
 heats_per_day = st.sidebar.slider("Heats per Day", 1, 20, 8)
@@ -32,10 +36,8 @@ prediction_minutes = st.sidebar.slider("Prediction Horizon (minutes)", 1, 10, 5)
 duration = st.sidebar.slider("Simulation Duration (minutes)", 10, 60, 30)
 
 # --- Simulated Data ---
-time = np.linspace(0, duration + prediction_minutes, (duration + prediction_minutes) * 4)
-np.random.seed(0)
-live_power = 91 + 1.5 * np.sin(0.25 * time + 0.5)
-prediction_power = live_power + 1.2 + 0.5 * np.sin(0.35 * time) + 0.6 * np.random.randn(len(time))
+profiler.section("data")
+time, live_power, prediction_power = forecast_curves(duration, prediction_minutes)
 
 # Split live and prediction range
 live_end_index = int(duration * 4)
@@ -45,30 +47,36 @@ live_curve = live_power[:live_end_index]
 predict_curve = prediction_power[live_end_index:]
 
 # --- Event Zone Detection ---
-event_threshold = 2.5  # MW threshold for detecting an event zone
-power_diff = np.abs(live_curve - np.mean(live_curve))
-event_flags = power_diff > event_threshold
+profiler.section("event detection")
+# Rolling (EWMA) mean/sigma over ~5 minutes with hysteresis instead of the global mean
+event_sigma = 2.5  # deviation from the rolling mean, in sigma, that opens an event zone
+detector = EventDetector(window=20, enter_sigma=event_sigma, exit_sigma=1.0)
+event_records = detector.update_batch(live_curve, time_live)
+event_zones = event_spans(event_records, time_live[-1])
 
 # --- Graph Output ---
+profiler.section("chart")
+import matplotlib.pyplot as plt
 st.subheader("Power Input: Live vs. Prediction")
 fig, ax = plt.subplots(figsize=(10, 5))
 ax.plot(time_live, live_curve, label="Live Data", color="blue")
 ax.plot(time_pred, predict_curve, label="Prediction", linestyle="--", color="orange")
 
-# Highlight event zones
-for i in range(1, len(event_flags)):
-    if event_flags[i] and not event_flags[i-1]:
-        ax.axvspan(time_live[i], time_live[min(i+4, len(time_live)-1)], color='red', alpha=0.2)
-        ax.text(time_live[i], live_curve[i]+2, 'Event Zone', color='red', fontsize=8)
+# Highlight event zones (one artist for all zones)
+if event_zones:
+    ax.broken_barh([(start, stop - start) for start, stop in event_zones], (0, 1),
+                   transform=ax.get_xaxis_transform(), color='red', alpha=0.2, label="Event Zone")
 
 ax.set_xlabel("Time (minutes)")
 ax.set_ylabel("Power Input (MW)")
 ax.set_title("Live Power Input and Future Prediction")
 ax.legend()
 ax.grid(True)
+profiler.section("st.pyplot (PNG)")
 st.pyplot(fig)
 
 # --- KPI Table ---
+profiler.section("kpis")
 st.markdown("### 🔍 Optimization Gains Summary")
 col1, col2, col3 = st.columns(3)
 with col1:
@@ -79,6 +87,7 @@ with col3:
     st.metric("🧱 Refractory Life Extension", "4.0 %")
 
 # --- ROI Table ---
+profiler.section("roi")
 st.markdown("### 💰 Investment Return Summary")
 monthly_tons = tap_weight * heats_per_day * days_per_month
 monthly_energy_baseline = monthly_tons * energy_baseline
@@ -95,13 +104,18 @@ with col6:
     st.metric("ROI", f"{roi_months:.1f} months")
 
 # --- Downloadable Report ---
+profiler.section("report")
 st.markdown("### 📄 Download Report")
-data = pd.DataFrame({
+data = {
     "Time (min)": time,
     "Live Power (MW)": np.concatenate([live_curve, [np.nan]*len(predict_curve)]),
     "Predicted Power (MW)": np.concatenate([[np.nan]*len(live_curve), predict_curve])
-})
+}
+
+report_format = st.radio("Report Format", list(REPORT_FORMATS), horizontal=True)
+extension, mime = REPORT_FORMATS[report_format]
+# Written only when the button is clicked
+st.download_button(f"🔍 Download {report_format} Report", columns_report(data, extension),
+                   file_name=f"apc_prediction_report.{extension}", mime=mime)
 
-csv_buffer = io.StringIO()
-data.to_csv(csv_buffer, index=False)
-st.download_button("🔍 Download CSV Report", csv_buffer.getvalue(), file_name="apc_prediction_report.csv", mime="text/csv")
+show_profiler(profiler)
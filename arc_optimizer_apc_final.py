@@ -1,22 +1,27 @@
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
-import pandas as pd
-import io
-from PIL import Image
+
+from arc_optimizer.assets import logo_bytes
+from arc_optimizer.decimate import decimate_for_plot
+from arc_optimizer.integrator import integrate
+from arc_optimizer.profiling import page_profiler, show_profiler
+from arc_optimizer.reports import REPORT_FORMATS, power_report
+from arc_optimizer.simulation import simulate_power
 
 st.set_page_config(page_title="Arc Optimizer Dashboard", layout="wide")
+profiler = page_profiler("apc")
 
 # --- Layout with logo on the top-right ---
+profiler.section("layout")
 col_logo, col_title = st.columns([1, 8])
 with col_logo:
-    logo = Image.open("images.png")
-    st.image(logo, width=120)
+    st.image(logo_bytes(), width=120)
 with col_title:
     company_name = st.sidebar.text_input("Company Name", value="Your Company")
     st.title(f"{company_name} ⚡ Arc Optimizer – EAF Optimization Dashboard")
 
 # --- Editable Parameters ---
+profiler.section("inputs")
 st.sidebar.header("Furnace & Cost Settings")
 tap_weight = st.sidebar.number_input("Tap Weight per Heat (tons)", value=145)
 heats_per_day = st.sidebar.slider("Heats per Day", 1, 20, 8)
@@ -32,10 +37,8 @@ prediction_minutes = st.sidebar.slider("Prediction Horizon (minutes)", 1, 10, 5)
 duration = st.sidebar.slider("Simulation Duration (minutes)", 10, 60, 30)
 
 # --- Simulated Data ---
-time = np.linspace(0, duration + prediction_minutes, (duration + prediction_minutes) * 4)
-np.random.seed(0)
-mpc_power = 91 + 1.5 * np.sin(0.25 * time + 0.5)
-base_power = mpc_power + 1.5 + 0.8 * np.sin(0.35 * time) + 0.8 * np.random.randn(len(time))
+profiler.section("data")
+time, base_power, mpc_power = simulate_power(duration, prediction_minutes)
 
 # Split time ranges
 live_end_index = int(duration * 4)
@@ -47,16 +50,19 @@ pred_base = base_power[live_end_index:]
 pred_mpc = mpc_power[live_end_index:]
 
 # Calculate savings
-energy_savings_live = np.clip(live_base - live_mpc, 0, None)
-energy_savings_pred = np.clip(pred_base - pred_mpc, 0, None)
-total_saved_kwh = np.trapz(energy_savings_live + energy_savings_pred, time)
+energy_savings = np.clip(base_power - mpc_power, 0, None)
+total_saved_mwh = integrate(time, energy_savings)
 
 # --- Graph Output ---
+profiler.section("chart")
 st.subheader("Power Input: Live vs. Predicted with Energy Savings")
+# Draw ~2 points per pixel (extremes and crossings); savings and the CSV export use the full-resolution arrays
+plot_time, plot_base, plot_mpc = decimate_for_plot(time, base_power, mpc_power)
+import matplotlib.pyplot as plt
 fig, ax = plt.subplots(figsize=(10, 5))
-ax.plot(time, base_power, '--', label="Without MPC", color="red")
-ax.plot(time, mpc_power, '-', label="With MPC", color="green")
-ax.fill_between(time, mpc_power, base_power, where=(base_power > mpc_power),
+ax.plot(plot_time, plot_base, '--', label="Without MPC", color="red")
+ax.plot(plot_time, plot_mpc, '-', label="With MPC", color="green")
+ax.fill_between(plot_time, plot_mpc, plot_base, where=(plot_base > plot_mpc),
                 interpolate=True, color='lightgreen', alpha=0.4, label="Energy Savings")
 
 ax.set_xlabel("Time (minutes)")
@@ -64,9 +70,12 @@ ax.set_ylabel("Power Input (MW)")
 ax.set_title("Live and Future Power Input with Predicted Savings")
 ax.legend()
 ax.grid(True)
+profiler.section("st.pyplot (PNG)")
 st.pyplot(fig)
+st.success(f"Estimated Energy Saved with MPC: {total_saved_mwh:.2f} MWh over {duration + prediction_minutes} minutes")
 
 # --- KPI Table ---
+profiler.section("kpis")
 st.markdown("### 🔍 Optimization Gains Summary")
 col1, col2, col3 = st.columns(3)
 with col1:
@@ -77,6 +86,7 @@ with col3:
     st.metric("🧱 Refractory Life Extension", "4.0 %")
 
 # --- ROI Table ---
+profiler.section("roi")
 st.markdown("### 💰 Investment Return Summary")
 monthly_tons = tap_weight * heats_per_day * days_per_month
 monthly_energy_baseline = monthly_tons * energy_baseline
@@ -93,14 +103,12 @@ with col6:
     st.metric("ROI", f"{roi_months:.1f} months")
 
 # --- Downloadable Report ---
+profiler.section("report")
 st.markdown("### 📄 Download Report")
-data = pd.DataFrame({
-    "Time (min)": time,
-    "Power Without MPC (MW)": base_power,
-    "Power With MPC (MW)": mpc_power,
-    "Savings (MW)": np.clip(base_power - mpc_power, 0, None)
-})
-
-csv_buffer = io.StringIO()
-data.to_csv(csv_buffer, index=False)
-st.download_button("🔍 Download CSV Report", csv_buffer.getvalue(), file_name="apc_prediction_report.csv", mime="text/csv")
+report_format = st.radio("Report Format", list(REPORT_FORMATS), horizontal=True)
+extension, mime = REPORT_FORMATS[report_format]
+# Written only when the button is clicked
+st.download_button(f"🔍 Download {report_format} Report", power_report(time, base_power, mpc_power, extension),
+                   file_name=f"apc_prediction_report.{extension}", mime=mime)
+
+show_profiler(profiler)
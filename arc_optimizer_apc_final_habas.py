@@ -1,19 +1,15 @@
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
-import pandas as pd
-import io
-from PIL import Image
+
+from arc_optimizer.assets import logo_html
+from arc_optimizer.integrator import integrate
+from arc_optimizer.reports import REPORT_FORMATS, power_report
+from arc_optimizer.simulation import simulate_power
 
 st.set_page_config(page_title="Arc Optimizer Dashboard", layout="wide")
 
 # --- Layout with logo aligned top-right over full app ---
-logo = Image.open("images.png")
-st.markdown("""
-    <div style='display: flex; justify-content: flex-end;'>
-        <img src='data:image/png;base64,""" + st.image(logo, output_format="PNG", use_column_width=False).image_data.tobytes().hex() + """' width='120'/>
-    </div>
-    """, unsafe_allow_html=True)
+st.markdown(logo_html(), unsafe_allow_html=True)
 
 # --- Fixed Company Name ---
 company_name = "HABAS"
@@ -34,10 +30,7 @@ prediction_minutes = st.sidebar.slider("Prediction Horizon (minutes)", 1, 10, 5)
 duration = st.sidebar.slider("Simulation Duration (minutes)", 10, 60, 30)
 
 # --- Simulated Data ---
-time = np.linspace(0, duration + prediction_minutes, (duration + prediction_minutes) * 4)
-np.random.seed(0)
-mpc_power = 91 + 1.5 * np.sin(0.25 * time + 0.5)
-base_power = mpc_power + 1.5 + 0.8 * np.sin(0.35 * time) + 0.8 * np.random.randn(len(time))
+time, base_power, mpc_power = simulate_power(duration, prediction_minutes)
 
 # Recalculate only future segment for prediction horizon
 time_pred = time[-prediction_minutes * 4:]
@@ -46,10 +39,11 @@ pred_mpc = mpc_power[-prediction_minutes * 4:]
 
 # Calculate savings on predicted data
 energy_savings = np.clip(pred_base - pred_mpc, 0, None)
-total_saved_kwh = np.trapz(energy_savings, time_pred)
+total_saved_mwh = integrate(time_pred, energy_savings)
 expected_saving_pct = (np.mean(energy_savings) / np.mean(pred_base)) * 100 if np.mean(pred_base) != 0 else 0
 
 # --- Graph Output ---
+import matplotlib.pyplot as plt
 st.subheader("Predicted Power Input with Energy Savings")
 fig, ax = plt.subplots(figsize=(10, 5))
 ax.plot(time_pred, pred_base, '--', label="Without MPC", color="red")
@@ -63,6 +57,7 @@ ax.set_title("Future Power Prediction Only (Based on Selected Horizon)")
 ax.legend()
 ax.grid(True)
 st.pyplot(fig)
+st.success(f"Predicted Energy Saved with MPC: {total_saved_mwh:.2f} MWh over the next {prediction_minutes} minutes")
 
 # --- KPI Table ---
 st.markdown("### 🔍 Optimization Gains Summary")
@@ -92,13 +87,8 @@ with col6:
 
 # --- Downloadable Report ---
 st.markdown("### 📄 Download Report")
-data = pd.DataFrame({
-    "Time (min)": time_pred,
-    "Power Without MPC (MW)": pred_base,
-    "Power With MPC (MW)": pred_mpc,
-    "Savings (MW)": energy_savings
-})
-
-csv_buffer = io.StringIO()
-data.to_csv(csv_buffer, index=False)
-st.download_button("🔍 Download CSV Report", csv_buffer.getvalue(), file_name="apc_prediction_report.csv", mime="text/csv")
+report_format = st.radio("Report Format", list(REPORT_FORMATS), horizontal=True)
+extension, mime = REPORT_FORMATS[report_format]
+# Written only when the button is clicked
+st.download_button(f"🔍 Download {report_format} Report", power_report(time_pred, pred_base, pred_mpc, extension),
+                   file_name=f"apc_prediction_report.{extension}", mime=mime)
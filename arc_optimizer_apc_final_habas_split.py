@@ -1,25 +1,15 @@
 import streamlit as st
-import numpy as np
-import matplotlib.pyplot as plt
-import pandas as pd
-import io
-from PIL import Image
-import base64
+
+from arc_optimizer.assets import logo_html
+from arc_optimizer.charts import live_vs_predicted_png, render_live_vs_predicted
+from arc_optimizer.live import LiveFeed
+from arc_optimizer.reports import REPORT_FORMATS, prediction_report
+from arc_optimizer.simulation import SAMPLES_PER_MINUTE, predicted_saving_pct, saving_pct
 
 st.set_page_config(page_title="Arc Optimizer Dashboard", layout="wide")
 
 # --- Layout with logo aligned top-right using base64 ---
-logo_path = "images.png"
-with open(logo_path, "rb") as image_file:
-    encoded_string = base64.b64encode(image_file.read()).decode()
-st.markdown(
-    f"""
-    <div style='display: flex; justify-content: flex-end;'>
-        <img src='data:image/png;base64,{encoded_string}' width='120'/>
-    </div>
-    """,
-    unsafe_allow_html=True
-)
+st.markdown(logo_html(), unsafe_allow_html=True)
 
 # --- Fixed Company Name ---
 company_name = "HABAS"
@@ -39,55 +29,62 @@ software_cost = st.sidebar.number_input("Software Cost (€)", value=200000)
 prediction_minutes = st.sidebar.slider("Prediction Horizon (minutes)", 1, 10, 5)
 duration = st.sidebar.slider("Simulation Duration (minutes)", 10, 60, 30)
 
-# --- Simulated Data ---
-total_minutes = duration + prediction_minutes
-time = np.linspace(0, total_minutes, total_minutes * 4)
-np.random.seed(0)
-mpc_power = 91 + 1.5 * np.sin(0.25 * time + 0.5)
-base_power = mpc_power + 1.5 + 0.8 * np.sin(0.35 * time) + 0.8 * np.random.randn(len(time))
-
-# Define live and prediction segments
-time_live = time[:duration * 4]
-time_pred = time[duration * 4:]
-live_base = base_power[:duration * 4]
-live_mpc = mpc_power[:duration * 4]
-pred_base = base_power[duration * 4:]
-pred_mpc = mpc_power[duration * 4:]
-
-# Calculate savings on predicted data
-energy_savings = np.clip(base_power - mpc_power, 0, None)
-expected_saving_pct = (np.mean(energy_savings[duration * 4:]) / np.mean(base_power[duration * 4:])) * 100 if np.mean(base_power[duration * 4:]) != 0 else 0
-
-# --- Graph Output ---
-st.subheader("Power Input: Live vs. Predicted with Energy Savings")
-fig, ax = plt.subplots(figsize=(10, 5))
-ax.plot(time_live, live_base, '--', label="Without MPC (Live)", color="red")
-ax.plot(time_live, live_mpc, '-', label="With MPC (Live)", color="green")
-ax.plot(time_pred, pred_base, '--', color="red", alpha=0.6, label="Without MPC (Predicted)")
-ax.plot(time_pred, pred_mpc, '-', color="green", alpha=0.6, label="With MPC (Predicted)")
-ax.fill_between(time_pred, pred_mpc, pred_base, where=(pred_base > pred_mpc),
-                interpolate=True, color='lightgreen', alpha=0.4, label="Predicted Energy Savings")
-
-# Add a vertical line to separate live and predicted
-ax.axvline(x=duration, color='black', linestyle=':', linewidth=1.5)
-ax.text(duration + 0.5, ax.get_ylim()[1] - 1, 'Prediction Starts →', fontsize=9, color='black')
-
-ax.set_xlabel("Time (minutes)")
-ax.set_ylabel("Power Input (MW)")
-ax.set_title("Live and Future Power Input with Predicted Savings")
-ax.legend()
-ax.grid(True)
-st.pyplot(fig)
-
-# --- KPI Table ---
-st.markdown("### 🔍 Optimization Gains Summary")
-col1, col2, col3 = st.columns(3)
-with col1:
-    st.metric("⚡ Predicted Energy Savings", f"{expected_saving_pct:.1f} %")
-with col2:
-    st.metric("⏱️ Power-On Time Reduction", "6.2 %")
-with col3:
-    st.metric("🧱 Refractory Life Extension", "4.0 %")
+st.sidebar.header("Live Mode")
+live_mode = st.sidebar.toggle("Stream Live Data", value=False)
+refresh_hz = st.sidebar.select_slider("Refresh Rate (Hz)", options=[1, 2], value=1)
+
+
+def show_kpis(saving_pct_value):
+    st.markdown("### 🔍 Optimization Gains Summary")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("⚡ Predicted Energy Savings", f"{saving_pct_value:.1f} %")
+    with col2:
+        st.metric("⏱️ Power-On Time Reduction", "6.2 %")
+    with col3:
+        st.metric("🧱 Refractory Life Extension", "4.0 %")
+
+
+def show_counters(counters):
+    # Cumulative since the feed started; updated incrementally on every tick
+    st.markdown("### 🔋 Energy Saved (Live Counters)")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric(f"This Heat (#{counters.keys['heat']})", f"{counters.value('heat', 'kWh'):,.0f} kWh")
+    with col2:
+        st.metric("This Shift", f"{counters.value('shift', 'kWh'):,.0f} kWh")
+    with col3:
+        st.metric("This Month", f"{counters.value('month', 'MWh'):,.2f} MWh")
+
+
+# --- Simulated Data, KPI and Chart (cached on duration/horizon) ---
+expected_saving_pct = predicted_saving_pct(duration, prediction_minutes)
+
+if live_mode:
+    # One feed per browser session; only the fragment below reruns on each tick,
+    # so the sidebar, logo and ROI block are not re-executed
+    heat_minutes = 24 * 60 / heats_per_day
+    feed = st.session_state.get("live_feed")
+    if feed is None or not feed.matches(duration, prediction_minutes, heat_minutes):
+        feed = st.session_state["live_feed"] = LiveFeed(duration, prediction_minutes, heat_minutes=heat_minutes)
+        feed.advance(duration * SAMPLES_PER_MINUTE)
+
+    @st.fragment(run_every=1 / refresh_hz)
+    def live_panel():
+        feed.advance(1)
+        time_pred, pred_base, pred_mpc = feed.prediction()
+        st.subheader("Power Input: Live vs. Predicted with Energy Savings")
+        st.image(render_live_vs_predicted(feed.time, feed.base_power, feed.mpc_power,
+                                          time_pred, pred_base, pred_mpc, dpi=100,
+                                          pred_std=feed.prediction_std), width="stretch")
+        show_kpis(saving_pct(pred_base, pred_mpc))
+        show_counters(feed.savings)
+
+    live_panel()
+else:
+    st.subheader("Power Input: Live vs. Predicted with Energy Savings")
+    st.image(live_vs_predicted_png(duration, prediction_minutes), width="stretch")
+    show_kpis(expected_saving_pct)
 
 # --- ROI Table ---
 st.markdown("### 💰 Investment Return Summary")
@@ -107,13 +104,8 @@ with col6:
 
 # --- Downloadable Report ---
 st.markdown("### 📄 Download Report")
-data = pd.DataFrame({
-    "Time (min)": time,
-    "Power Without MPC (MW)": base_power,
-    "Power With MPC (MW)": mpc_power,
-    "Savings (MW)": energy_savings
-})
-
-csv_buffer = io.StringIO()
-data.to_csv(csv_buffer, index=False)
-st.download_button("🔍 Download CSV Report", csv_buffer.getvalue(), file_name="apc_prediction_report.csv", mime="text/csv")
+report_format = st.radio("Report Format", list(REPORT_FORMATS), horizontal=True)
+extension, mime = REPORT_FORMATS[report_format]
+# Written only when the button is clicked
+st.download_button(f"🔍 Download {report_format} Report", prediction_report(duration, prediction_minutes, extension),
+                   file_name=f"apc_prediction_report.{extension}", mime=mime)
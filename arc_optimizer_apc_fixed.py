@@ -1,17 +1,17 @@
 import streamlit as st
-import numpy as np
-import matplotlib.pyplot as plt
-import pandas as pd
-import io
-from PIL import Image
+
+from arc_optimizer.assets import logo_bytes
+from arc_optimizer.decimate import decimate_for_plot
+from arc_optimizer.historian import integrated_savings, load_series
+from arc_optimizer.reports import REPORT_FORMATS, power_report
+from arc_optimizer.simulation import simulate_power
 
 st.set_page_config(page_title="Arc Optimizer Dashboard", layout="wide")
 
 # --- Layout with logo on the top-right ---
 col_logo, col_title = st.columns([1, 8])
 with col_logo:
-    logo = Image.open("images.png")
-    st.image(logo, width=120)
+    st.image(logo_bytes(), width=120)
 with col_title:
     company_name = st.sidebar.text_input("Company Name", value="Your Company")
     st.title(f"{company_name} ⚡ Arc Optimizer – EAF Optimization Dashboard")
@@ -30,32 +30,32 @@ software_cost = st.sidebar.number_input("Software Cost (€)", value=200000)
 prediction_minutes = st.sidebar.slider("Prediction Horizon (minutes)", 1, 10, 5)
 duration = st.sidebar.slider("Simulation Duration (minutes)", 10, 60, 30)
 
-# --- Simulated Data ---
-time = np.linspace(0, duration + prediction_minutes, (duration + prediction_minutes) * 4)
-np.random.seed(0)
-mpc_power = 91 + 1.5 * np.sin(0.25 * time + 0.5)
-base_power = mpc_power + 1.5 + 0.8 * np.sin(0.35 * time) + 0.8 * np.random.randn(len(time))
+st.sidebar.header("Data Source")
+historian_path = st.sidebar.text_input("Historian File or Store (CSV/Parquet/Arrow/.npy)", value="")
 
-# Split time ranges
-live_end_index = int(duration * 4)
-time_live = time[:live_end_index]
-time_pred = time[live_end_index:]
-live_base = base_power[:live_end_index]
-live_mpc = mpc_power[:live_end_index]
-pred_base = base_power[live_end_index:]
-pred_mpc = mpc_power[live_end_index:]
+# --- Historian (memory-mapped) or Simulated Data ---
+if historian_path:
+    try:
+        time, base_power, mpc_power = load_series(historian_path)
+    except Exception as exc:
+        st.error(f"Could not load historian data from {historian_path!r}: {exc}")
+        st.stop()
+else:
+    time, base_power, mpc_power = simulate_power(duration, prediction_minutes)
 
-# Calculate savings
-energy_savings = np.clip(base_power - mpc_power, 0, None)
-total_saved_kwh = np.trapz(energy_savings, time)
-expected_saving_pct = (np.mean(energy_savings) / np.mean(base_power)) * 100
+# Calculate savings chunk by chunk so long histories are never fully loaded
+total_saved_mwh, mean_savings, mean_base = integrated_savings(time, base_power, mpc_power)
+expected_saving_pct = (mean_savings / mean_base) * 100 if mean_base > 0 else 0.0
 
 # --- Graph Output ---
 st.subheader("Power Input: Live vs. Predicted with Energy Savings")
+# Draw ~2 points per pixel (extremes and crossings); savings and the CSV export use the full-resolution arrays
+plot_time, plot_base, plot_mpc = decimate_for_plot(time, base_power, mpc_power)
+import matplotlib.pyplot as plt
 fig, ax = plt.subplots(figsize=(10, 5))
-ax.plot(time, base_power, '--', label="Without MPC", color="red")
-ax.plot(time, mpc_power, '-', label="With MPC", color="green")
-ax.fill_between(time, mpc_power, base_power, where=(base_power > mpc_power),
+ax.plot(plot_time, plot_base, '--', label="Without MPC", color="red")
+ax.plot(plot_time, plot_mpc, '-', label="With MPC", color="green")
+ax.fill_between(plot_time, plot_mpc, plot_base, where=(plot_base > plot_mpc),
                 interpolate=True, color='lightgreen', alpha=0.4, label="Energy Savings")
 
 ax.set_xlabel("Time (minutes)")
@@ -64,6 +64,7 @@ ax.set_title("Live and Future Power Input with Predicted Savings")
 ax.legend()
 ax.grid(True)
 st.pyplot(fig)
+st.success(f"Estimated Energy Saved with MPC: {total_saved_mwh:.2f} MWh over the charted period")
 
 # --- KPI Table ---
 st.markdown("### 🔍 Optimization Gains Summary")
@@ -93,13 +94,8 @@ with col6:
 
 # --- Downloadable Report ---
 st.markdown("### 📄 Download Report")
-data = pd.DataFrame({
-    "Time (min)": time,
-    "Power Without MPC (MW)": base_power,
-    "Power With MPC (MW)": mpc_power,
-    "Savings (MW)": energy_savings
-})
-
-csv_buffer = io.StringIO()
-data.to_csv(csv_buffer, index=False)
-st.download_button("🔍 Download CSV Report", csv_buffer.getvalue(), file_name="apc_prediction_report.csv", mime="text/csv")
+report_format = st.radio("Report Format", list(REPORT_FORMATS), horizontal=True)
+extension, mime = REPORT_FORMATS[report_format]
+# Written only when the button is clicked
+st.download_button(f"🔍 Download {report_format} Report", power_report(time, base_power, mpc_power, extension),
+                   file_name=f"apc_prediction_report.{extension}", mime=mime)
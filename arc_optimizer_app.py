@@ -0,0 +1,41 @@
+import streamlit as st
+
+# One Streamlit server for every dashboard view. The pages run in this
+# process and share the arc_optimizer caches, so a simulation computed on one
+# page is reused by every other page (and session) asking for the same inputs.
+#
+#     streamlit run arc_optimizer_app.py
+
+st.set_page_config(page_title="Arc Optimizer", layout="wide")
+
+pages = {
+    "Dashboards": [
+        st.Page("arc_optimizer_apc_final_habas_split.py", title="HABAS Live Dashboard", icon="⚡",
+                url_path="habas", default=True),
+        st.Page("arc_optimizer_apc_final_habas_fixed.py", title="HABAS Dashboard", icon="⚡",
+                url_path="habas-static"),
+        st.Page("arc_optimizer_apc_final.py", title="APC Dashboard", icon="⚡", url_path="apc"),
+        st.Page("arc_optimizer_apc_fixed.py", title="APC Dashboard (Historian)", icon="🗄️",
+                url_path="apc-historian"),
+        st.Page("arc_optimizer_apc_extension (1).py", title="Event Detection", icon="🚨",
+                url_path="events"),
+        st.Page("arc_optimizer_dashboard_full.py", title="Optimization Dashboard", icon="📊",
+                url_path="dashboard"),
+        st.Page("arc_optimizer_dashboard_with_company.py", title="Company Dashboard", icon="🏢",
+                url_path="company"),
+        st.Page("arc_optimizer_fleet_dashboard.py", title="Fleet Dashboard", icon="🏭", url_path="fleet"),
+    ],
+    "MPC Profiles": [
+        st.Page("arc_optimizer_mpc_corrected_graph.py", title="MPC vs Non-MPC (Corrected)", icon="📈",
+                url_path="mpc-corrected"),
+        st.Page("arc_optimizer_mpc_graph_with_inputs.py", title="MPC Energy Profile", icon="📈",
+                url_path="mpc-energy"),
+        st.Page("arc_optimizer_mpc_graph.py", title="MPC vs Non-MPC Demo", icon="📈", url_path="mpc-demo"),
+    ],
+    "Planning": [
+        st.Page("arc_optimizer_demo.py", title="Energy Balance Demo", icon="🔋", url_path="demo"),
+        st.Page("arc_optimizer_roi_demo.py", title="ROI Calculator", icon="💰", url_path="roi"),
+    ],
+}
+
+st.navigation(pages).run()
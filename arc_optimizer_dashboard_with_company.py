@@ -1,10 +1,10 @@
 
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
 
-from itertools import groupby
-from operator import itemgetter
+from arc_optimizer.integrator import integrate
+from arc_optimizer.simulation import simulate_power
+from arc_optimizer.zones import find_zones
 
 st.set_page_config(page_title="Arc Optimizer Dashboard", layout="wide")
 
@@ -28,15 +28,13 @@ software_cost = st.sidebar.number_input("Software Cost (€)", value=200000)
 duration = st.sidebar.slider("Simulation Duration (minutes)", 10, 60, 30)
 
 # --- Simulated MPC Curve ---
-time = np.linspace(0, duration, duration * 4)
-np.random.seed(0)
-mpc_power = 91 + 1.5 * np.sin(0.25 * time + 0.5)
-base_power = mpc_power + 1.5 + 0.8 * np.sin(0.35 * time) + 0.8 * np.random.randn(len(time))
+time, base_power, mpc_power = simulate_power(duration)
 
 energy_savings = np.clip(base_power - mpc_power, 0, None)
-total_saved_kwh = np.trapz(energy_savings, time)
+total_saved_mwh = integrate(time, energy_savings)
 
 # --- Graph Output ---
+import matplotlib.pyplot as plt
 st.subheader("Electrode Power Profile with MPC")
 fig, ax = plt.subplots(figsize=(10, 5))
 ax.plot(time, base_power, '--', label="MPC OFF", color="red")
@@ -44,15 +42,14 @@ ax.plot(time, mpc_power, '-', label="MPC ON", color="green")
 ax.fill_between(time, mpc_power, base_power, where=(base_power > mpc_power),
                 interpolate=True, color='lightgreen', alpha=0.4, label="Energy Savings")
 
-mask = (base_power > mpc_power)
-change_points = [i for i, x in enumerate(mask) if x]
-for k, g in groupby(enumerate(change_points), lambda i: i[0] - i[1]):
-    group = list(map(itemgetter(1), g))
-    if len(group) > 5:
-        mid = time[group[len(group)//2]]
-        ax.annotate("Savings", xy=(mid, mpc_power[group[len(group)//2]] + 0.5),
-                    xytext=(mid, mpc_power[group[len(group)//2]] + 2),
-                    arrowprops=dict(arrowstyle="->", color='green'), fontsize=9, color='green')
+# Annotate savings blocks longer than 5 samples
+zones = find_zones(base_power > mpc_power).longer_than(5)
+for start, length in zip(zones.start, zones.length):
+    centre = start + length // 2
+    mid = time[centre]
+    ax.annotate("Savings", xy=(mid, mpc_power[centre] + 0.5),
+                xytext=(mid, mpc_power[centre] + 2),
+                arrowprops=dict(arrowstyle="->", color='green'), fontsize=9, color='green')
 
 ax.set_xlabel("Time (minutes)")
 ax.set_ylabel("Power Input (MW)")
@@ -60,6 +57,7 @@ ax.set_title("Electrode Power Input Over Time")
 ax.legend()
 ax.grid(True)
 st.pyplot(fig)
+st.success(f"Estimated Energy Saved with MPC: {total_saved_mwh:.2f} MWh over {duration} minutes")
 
 # --- KPI Table ---
 st.markdown("### 🔍 Optimization Gains Summary")
@@ -1,6 +1,9 @@
 
 import streamlit as st
 
+from arc_optimizer.energy_balance import DEFAULTS, OUTPUTS, optimize, optimize_columns
+from arc_optimizer.reports import REPORT_FORMATS, columns_report
+
 st.set_page_config(page_title="Arc Optimizer Demo", layout="centered")
 
 st.title("⚡ Arc Optimizer – EAF Efficiency Demo")
@@ -20,15 +23,29 @@ power_on_time = st.number_input("Current Power-On Time (min)", value=32)
 
 st.header("Predicted Optimized Results")
 
-base_energy = tap_weight * elec_consumption
-hotheel_energy = hot_heel * elec_consumption
-slag_energy = tap_weight * ((charged_lime * 0.4 + charged_dolomite * 0.3) / 1000)
-chem_energy = tap_weight * (nat_gas * 9 + carbon_injected * 2)
-burner_factor = 0.9 if burners >= 5 else 1.0
-
-net_energy = (base_energy - hotheel_energy + slag_energy - chem_energy) * burner_factor
-optimized_elec_per_ton = net_energy / tap_weight
-optimized_pot = max(power_on_time - 2, 28)
+optimized_elec_per_ton, optimized_pot = optimize(
+    tap_weight, hot_heel, elec_consumption, burners, nat_gas, carbon_injected,
+    charged_lime, charged_dolomite, power_on_time)
 
 st.success(f"🔋 Optimized Electrical Energy per ton: {optimized_elec_per_ton:.2f} kWh/ton")
 st.success(f"⏱️ Optimized Power-On Time: {optimized_pot:.1f} minutes")
+
+st.header("Batch Evaluation")
+st.markdown("Upload a heat log (one row per heat, columns named like " + ", ".join(f"`{c}`" for c in DEFAULTS)
+            + ") to evaluate every heat at once. Missing columns use the defaults above.")
+heat_log = st.file_uploader("Heat Log", type=["csv", "parquet"])
+if heat_log is not None:
+    import pandas as pd
+
+    heats = pd.read_parquet(heat_log) if heat_log.name.lower().endswith(".parquet") else pd.read_csv(heat_log)
+    columns = {name: heats[name].to_numpy(dtype=float) for name in DEFAULTS if name in heats}
+    for name, values in zip(OUTPUTS, optimize_columns(columns, len(heats))):
+        heats[name] = values
+    st.metric("Heats", f"{len(heats):,}")
+    st.metric("Mean Optimized Energy", f"{heats[OUTPUTS[0]].mean():.2f} kWh/ton")
+    st.dataframe(heats.head(1000))
+    report_format = st.radio("Report Format", list(REPORT_FORMATS), horizontal=True)
+    extension, mime = REPORT_FORMATS[report_format]
+    st.download_button(f"Download Results ({report_format})",
+                       columns_report({name: heats[name].to_numpy() for name in heats}, extension),
+                       file_name=f"optimized_heats.{extension}", mime=mime)
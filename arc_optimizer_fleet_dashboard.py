@@ -0,0 +1,68 @@
+import streamlit as st
+import numpy as np
+import os
+import time as clock
+from pathlib import Path
+
+from arc_optimizer.fleet import evaluate_fleet, fleet_summary, load_fleet, parse_fleet
+
+st.set_page_config(page_title="Arc Optimizer Fleet Dashboard", layout="wide")
+st.title("🏭 Arc Optimizer – EAF Fleet Dashboard")
+
+# --- Fleet Configuration ---
+st.sidebar.header("Fleet Configuration")
+uploaded = st.sidebar.file_uploader("Furnace Configurations (CSV or JSON)", type=["csv", "json"])
+workers = st.sidebar.number_input("Worker Processes", min_value=1, value=os.cpu_count() or 1)
+
+if uploaded is not None:
+    fmt = "json" if uploaded.name.lower().endswith(".json") else "csv"
+    furnaces = parse_fleet(uploaded.getvalue().decode(), fmt)
+else:
+    st.sidebar.caption("Using fleet_example.csv")
+    furnaces = load_fleet(Path(__file__).resolve().parent / "fleet_example.csv")
+
+# --- Parallel per-furnace simulation, savings and ROI ---
+start = clock.perf_counter()
+results = evaluate_fleet(tuple(furnaces), processes=workers)
+elapsed = clock.perf_counter() - start
+summary = fleet_summary(results, [f.software_cost for f in furnaces])
+
+# --- Aggregate KPIs ---
+st.markdown("### 📊 Fleet Summary")
+col1, col2, col3, col4 = st.columns(4)
+with col1:
+    st.metric("Furnaces", f"{summary['furnaces']}")
+    st.metric("Production", f"{summary['tons']:,.0f} tons/month")
+with col2:
+    st.metric("Energy Saved", f"{summary['saved_kwh'] / 1000:,.0f} MWh/month")
+    st.metric("Energy Savings", f"{summary['saving_pct']:.1f} %")
+with col3:
+    st.metric("Monthly Savings", f"{summary['eur_saved']:,.0f} €")
+    st.metric("Fleet kWh/ton", f"{summary['kwh_per_ton']:.1f}")
+with col4:
+    st.metric("Fleet ROI", f"{summary['roi_months']:.1f} months")
+    st.metric("Compute Time", f"{elapsed * 1000:.0f} ms")
+
+# --- Per-Furnace KPIs ---
+import pandas as pd
+st.markdown("### 🔥 Per-Furnace Results")
+table = pd.DataFrame(results).rename(columns={
+    "name": "Furnace", "site": "Site", "heats": "Heats", "tons": "Tons",
+    "energy_kwh": "Energy (kWh)", "saved_kwh": "Saved (kWh)", "saving_pct": "Saving (%)",
+    "kwh_per_ton": "kWh/ton", "power_on_reduction_pct": "Power-On Reduction (%)",
+    "eur_saved": "Savings (€)", "roi_months": "ROI (months)",
+})
+st.dataframe(table, hide_index=True)
+
+import matplotlib.pyplot as plt
+fig, ax = plt.subplots(figsize=(10, max(3, 0.35 * len(results))))
+names = [r["name"] for r in results]
+roi = np.array([r["roi_months"] for r in results])
+ax.barh(names, np.minimum(roi, 36), color="steelblue")
+ax.axvline(summary["roi_months"], color="black", linestyle="--", label="Fleet ROI")
+ax.invert_yaxis()
+ax.set_xlabel("ROI (months, capped at 36)")
+ax.set_title("ROI per Furnace")
+ax.legend()
+ax.grid(True, axis="x")
+st.pyplot(fig)
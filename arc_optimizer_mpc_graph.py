@@ -1,7 +1,6 @@
 
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
 
 st.set_page_config(page_title="Arc Optimizer: MPC vs Non-MPC", layout="wide")
 
@@ -19,6 +18,7 @@ time = np.linspace(0, duration, duration * 4)  # 4 points per minute
 base_power = 90 + 5 * np.sin(0.3 * time)      # Non-MPC: sinusoidal fluctuations
 mpc_power = 90 + 2 * np.sin(0.3 * time + 0.5)  # MPC: smoother response
 
+import matplotlib.pyplot as plt
 fig, ax = plt.subplots(figsize=(10, 5))
 ax.plot(time, base_power, label="MPC OFF", linestyle='--', color="red")
 ax.plot(time, mpc_power, label="MPC ON", linestyle='-', color="green")
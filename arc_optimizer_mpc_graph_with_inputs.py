@@ -1,9 +1,10 @@
 
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
-from itertools import groupby
-from operator import itemgetter
+
+from arc_optimizer.integrator import to_mwh
+from arc_optimizer.seeding import generator
+from arc_optimizer.zones import find_zones
 
 st.set_page_config(page_title="Arc Optimizer: MPC Energy Profile", layout="wide")
 st.title("⚡ Arc Optimizer – EAF MPC Simulation with Editable Furnace Info")
@@ -22,31 +23,29 @@ duration = st.sidebar.slider("Simulation Time (minutes)", min_value=10, max_valu
 
 # Generate curves
 time = np.linspace(0, duration, duration * 4)
-base_power = 91 + 2.5 * np.sin(0.25 * time) + 0.5 * np.random.randn(len(time))  # MPC OFF
+base_power = 91 + 2.5 * np.sin(0.25 * time) + 0.5 * generator(0).standard_normal(len(time))  # MPC OFF
 mpc_power = 91 + 1.5 * np.sin(0.25 * time + 0.5)  # MPC ON
 
-# Energy savings calculation
+# Energy savings calculation, integrated within each contiguous savings zone
 energy_savings = base_power - mpc_power
-total_savings_kwh = np.trapz(energy_savings[energy_savings > 0], time[energy_savings > 0])
+all_zones = find_zones(energy_savings > 0, time, energy_savings)
+total_savings_mwh = to_mwh(all_zones.energy.sum())
+savings_zones = all_zones.longer_than(5)
 
 # Plotting
+import matplotlib.pyplot as plt
 fig, ax = plt.subplots(figsize=(10, 5))
 ax.plot(time, base_power, '--', label="MPC OFF", color="red")
 ax.plot(time, mpc_power, '-', label="MPC ON", color="green")
 ax.fill_between(time, mpc_power, base_power, where=(base_power > mpc_power), interpolate=True,
                 color='lightgreen', alpha=0.4, label="Energy Savings")
 
-# Annotate significant savings blocks
-mask = (base_power > mpc_power)
-change_points = [i for i, x in enumerate(mask) if x]
-for k, g in groupby(enumerate(change_points), lambda i: i[0] - i[1]):
-    group = list(map(itemgetter(1), g))
-    if len(group) > 5:
-        start, end = time[group[0]], time[group[-1]]
-        mid = (start + end) / 2
-        ax.annotate("Savings", xy=(mid, mpc_power[group[0]] + 0.5),
-                    xytext=(mid, mpc_power[group[0]] + 2),
-                    arrowprops=dict(arrowstyle="->", color='green'), fontsize=9, color='green')
+# Annotate savings blocks longer than 5 samples
+for start, end in zip(savings_zones.start, savings_zones.end):
+    mid = (time[start] + time[end]) / 2
+    ax.annotate("Savings", xy=(mid, mpc_power[start] + 0.5),
+                xytext=(mid, mpc_power[start] + 2),
+                arrowprops=dict(arrowstyle="->", color='green'), fontsize=9, color='green')
 
 ax.set_xlabel("Time (minutes)")
 ax.set_ylabel("Power Input (MW)")
@@ -56,7 +55,7 @@ ax.grid(True)
 
 st.pyplot(fig)
 
-st.success(f"Estimated Energy Saved with MPC: {total_savings_kwh:.2f} MWh over {duration} minutes")
+st.success(f"Estimated Energy Saved with MPC: {total_savings_mwh:.2f} MWh over {duration} minutes")
 
 # Show furnace config summary
 st.markdown("### 🔧 Current Furnace Configuration")
@@ -2,6 +2,10 @@
 import streamlit as st
 import numpy as np
 
+from arc_optimizer.heats import simulate_month
+from arc_optimizer.roi import monte_carlo_payback, probability_within
+from arc_optimizer.sensitivity import INPUTS, LABELS, grid, tornado
+
 st.set_page_config(page_title="Arc Optimizer – ROI Calculator", layout="wide")
 st.title("📈 Arc Optimizer – ROI and Savings Simulation")
 
@@ -40,3 +44,187 @@ with col2:
     st.metric("ROI (months)", f"{roi_months:.1f}")
 
 st.info("📌 ROI shows how long it will take for Arc Optimizer to pay for itself through energy savings alone.")
+
+# --- Heat-by-Heat Month ---
+st.sidebar.header("Heat-by-Heat Simulation")
+simulate_every_heat = st.sidebar.toggle("Simulate Every Heat of the Month", value=False)
+mpc_availability = st.sidebar.slider("MPC Availability (% of heats)", 0, 100, 90)
+if simulate_every_heat:
+    month = simulate_month(tap_weight, heats_per_day, working_days_per_month, energy_baseline,
+                           expected_saving_rate, mpc_share=mpc_availability / 100)
+    month_eur_saved = month["saved_kwh"] * electricity_price
+    month_roi = software_cost / month_eur_saved if month_eur_saved > 0 else float("inf")
+
+    st.subheader(f"🔥 Heat-by-Heat Month ({month['heats']} heats, {month['mpc_heats']} with MPC)")
+    col9, col10, col11 = st.columns(3)
+    with col9:
+        st.metric("Simulated Production", f"{month['tons']:,.0f} tons")
+        st.metric("Energy Saved", f"{month['saved_kwh']:,.0f} kWh")
+    with col10:
+        st.metric("kWh/ton with MPC", f"{month.get('kwh_per_ton_on', month['kwh_per_ton']):.1f}")
+        st.metric("kWh/ton without MPC", f"{month.get('kwh_per_ton_off', energy_baseline):.1f}")
+    with col11:
+        st.metric("Energy Savings (EUR)", f"{month_eur_saved:,.0f} €")
+        st.metric("ROI (months)", f"{month_roi:.1f}")
+    if "power_on_reduction_pct" in month:
+        st.caption(f"Power-on time reduction on MPC heats: {month['power_on_reduction_pct']:.1f} %")
+
+# --- Payback Uncertainty (Monte Carlo) ---
+import matplotlib.pyplot as plt
+st.sidebar.header("Uncertainty (1 σ)")
+price_sd = st.sidebar.number_input("Electricity Price σ (EUR/kWh)", value=0.02, step=0.005, format="%.3f")
+saving_sd = st.sidebar.number_input("Energy Saving σ (%-points)", value=1.0, step=0.25)
+heats_sd = st.sidebar.number_input("Heats per Day σ", value=1.0, step=0.5)
+days_sd = st.sidebar.number_input("Working Days σ", value=2.0, step=0.5)
+baseline_sd = st.sidebar.number_input("Consumption σ (kWh/ton)", value=15.0, step=5.0)
+n_scenarios = st.sidebar.select_slider("Scenarios", options=[10**4, 10**5, 10**6, 10**7], value=10**6)
+
+
+mc = monte_carlo_payback(
+    software_cost, tap_weight,
+    electricity_price=("normal", electricity_price, price_sd),
+    saving_pct=("normal", expected_saving_rate, saving_sd),
+    heats_per_day=("normal", heats_per_day, heats_sd),
+    days_per_month=("normal", working_days_per_month, days_sd),
+    energy_baseline=("normal", energy_baseline, baseline_sd),
+    n_scenarios=n_scenarios)
+pct = mc["percentiles"]
+
+st.subheader("🎲 Payback Time Distribution")
+col3, col4, col5, col6 = st.columns(4)
+col3.metric("P10 Payback", f"{pct[10]:.1f} months")
+col4.metric("Median Payback", f"{pct[50]:.1f} months")
+col5.metric("P90 Payback", f"{pct[90]:.1f} months")
+col6.metric("Paid Back within 12 Months", f"{probability_within(mc, 12) * 100:.0f} %")
+
+upper = min(pct[95] * 1.5, mc["edges"][-1]) if np.isfinite(pct[95]) else mc["edges"][-1]
+# Regroup the fine histogram into ~60 bars up to 1.5x the P95
+last = int(np.searchsorted(mc["edges"], upper))
+group = max(last // 60, 1)
+bars = np.add.reduceat(mc["counts"][:last], np.arange(0, last, group)) / mc["n_scenarios"] * 100
+fig, ax = plt.subplots(figsize=(10, 4))
+ax.bar(mc["edges"][:last:group], bars, width=mc["edges"][group], align="edge", color="steelblue")
+for p, style in ((10, ":"), (50, "--"), (90, ":")):
+    ax.axvline(pct[p], color="black", linestyle=style, linewidth=1)
+ax.set_xlabel("Payback (months)")
+ax.set_ylabel("Share of Scenarios (%)")
+ax.set_title(f"Payback over {mc['n_scenarios']:,} Scenarios (dashed: median, dotted: P10/P90)")
+ax.grid(True, axis="y")
+st.pyplot(fig)
+
+# --- Sensitivity Analysis ---
+st.sidebar.header("Sensitivity Analysis")
+show_sensitivity = st.sidebar.toggle("Show Sensitivity", value=False)
+if show_sensitivity:
+    swing_pct = st.sidebar.slider("Tornado Swing (± %)", 5, 50, 20)
+    x_name = st.sidebar.selectbox("Heatmap X Axis", INPUTS, index=INPUTS.index("electricity_price"),
+                                  format_func=LABELS.get)
+    y_name = st.sidebar.selectbox("Heatmap Y Axis", INPUTS, index=INPUTS.index("saving_pct"),
+                                  format_func=LABELS.get)
+    resolution = st.sidebar.select_slider("Grid Resolution", options=[50, 100, 300, 1000], value=300)
+
+    base = {
+        "software_cost": software_cost,
+        "tap_weight": tap_weight,
+        "heats_per_day": heats_per_day,
+        "days_per_month": working_days_per_month,
+        "energy_baseline": energy_baseline,
+        "saving_pct": expected_saving_rate,
+        "electricity_price": electricity_price,
+    }
+
+    st.subheader("🌪️ ROI Sensitivity")
+    col7, col8 = st.columns(2)
+    with col7:
+        names, low, high, base_roi = tornado(base, swing_pct)
+        fig, ax = plt.subplots(figsize=(6, 4.5))
+        y = np.arange(len(names))[::-1]
+        ax.barh(y, low - base_roi, left=base_roi, color="seagreen", label=f"-{swing_pct} %")
+        ax.barh(y, high - base_roi, left=base_roi, color="indianred", label=f"+{swing_pct} %")
+        ax.axvline(base_roi, color="black", linewidth=1)
+        ax.set_yticks(y)
+        ax.set_yticklabels([LABELS[n] for n in names])
+        ax.set_xlabel("ROI (months)")
+        ax.set_title("Tornado: One Input at a Time")
+        ax.legend()
+        st.pyplot(fig)
+    with col8:
+        if x_name == y_name:
+            st.warning("Pick two different inputs for the heatmap.")
+        else:
+            # Sweep each axis from half to 1.5x its current value
+            x_values = np.linspace(0.5, 1.5, resolution) * base[x_name]
+            y_values = np.linspace(0.5, 1.5, resolution) * base[y_name]
+            roi_grid = np.minimum(grid(base, x_name, x_values, y_name, y_values), 36)
+            fig, ax = plt.subplots(figsize=(6, 4.5))
+            mesh = ax.pcolormesh(x_values, y_values, roi_grid, shading="auto", cmap="RdYlGn_r")
+            contours = ax.contour(x_values, y_values, roi_grid, levels=[6, 12, 24], colors="black", linewidths=0.8)
+            ax.clabel(contours, fmt="%d mo", fontsize=8)
+            ax.plot(base[x_name], base[y_name], "k*", markersize=10)
+            fig.colorbar(mesh, ax=ax, label="ROI (months, capped at 36)")
+            ax.set_xlabel(LABELS[x_name])
+            ax.set_ylabel(LABELS[y_name])
+            ax.set_title("ROI Heatmap")
+            st.pyplot(fig)
+
+# --- Time-of-Use Tariff Scheduling ---
+st.sidebar.header("Time-of-Use Tariff")
+use_tariff = st.sidebar.toggle("Schedule Heats on Hourly Prices", value=False)
+if use_tariff:
+    from arc_optimizer.tariff import (EXAMPLE_DEMAND_HOURS, EXAMPLE_PRICES, parse_prices, tariff_savings,
+                                      weekly_maintenance)
+
+    price_file = st.sidebar.file_uploader("Hourly Prices (CSV, EUR/kWh)", type=["csv"])
+    tap_to_tap = st.sidebar.number_input("Tap-to-Tap Time (min)", value=60, step=5)
+    power_on = st.sidebar.number_input("Power-On Time (min)", value=45, step=5)
+    demand_charge = st.sidebar.number_input("Peak Demand Charge (EUR/kW, 17–21 h)", value=5.0, step=1.0)
+    maintenance_hours = st.sidebar.slider("Weekly Maintenance Stop (h, day 7 from 06:00)", 0, 16, 8)
+
+    if price_file is not None:
+        prices = parse_prices(price_file.getvalue().decode())
+    else:
+        st.sidebar.caption("Using the example day-ahead profile")
+        prices = np.array(EXAMPLE_PRICES)
+    try:
+        tou = tariff_savings(prices, working_days_per_month, heats_per_day, tap_weight, energy_baseline,
+                             expected_saving_rate, electricity_price, software_cost,
+                             tap_to_tap_min=tap_to_tap, power_on_min=power_on, demand_charge=demand_charge,
+                             demand_hours=EXAMPLE_DEMAND_HOURS if len(prices) == 24 else None,
+                             maintenance=weekly_maintenance(working_days_per_month, 6, 6, maintenance_hours))
+    except ValueError as exc:
+        st.error(f"Cannot schedule: {exc}")
+    else:
+        optimized, baseline = tou["optimized"], tou["baseline"]
+        st.subheader("🕒 Time-of-Use Heat Schedule")
+        col12, col13, col14 = st.columns(3)
+        with col12:
+            st.metric("Flat-Price Energy Cost", f"{tou['flat_eur']:,.0f} €")
+            st.metric("Evenly Spaced Heats", f"{baseline.total_eur:,.0f} €")
+        with col13:
+            st.metric("Optimized Schedule", f"{optimized.total_eur:,.0f} €",
+                      f"-{tou['scheduling_eur_saved']:,.0f} € vs. evenly spaced", delta_color="inverse")
+            st.metric("Peak Demand Charge", f"{optimized.demand_eur:,.0f} €")
+        with col14:
+            st.metric("MPC Savings at Tariff Prices", f"{tou['mpc_eur_saved']:,.0f} €/month",
+                      f"{tou['mpc_eur_saved'] - tou['flat_mpc_eur_saved']:+,.0f} € vs. flat price")
+            st.metric("ROI at Tariff Prices", f"{tou['payback_months']:.1f} months",
+                      f"{tou['payback_months'] - tou['flat_payback_months']:+.1f} vs. flat price",
+                      delta_color="inverse")
+
+        # First three days: hourly price and power-on periods of both schedules
+        hours = np.arange(72)
+        fig, ax = plt.subplots(figsize=(10, 3.5))
+        ax.step(hours, np.resize(prices, 72), where="post", color="black", label="Price (EUR/kWh)")
+        for row, (schedule, color, label) in enumerate(((baseline, "lightgray", "Evenly Spaced"),
+                                                        (optimized, "seagreen", "Optimized"))):
+            starts = schedule.starts[schedule.starts < 72 * 60] / 60
+            ax.broken_barh([(start, power_on / 60) for start in starts], (0.02 + row * 0.07, 0.05),
+                           transform=ax.get_xaxis_transform(), color=color, label=f"{label} Power-On")
+        ax.set_xlabel("Hour of Month")
+        ax.set_ylabel("Price (EUR/kWh)")
+        ax.set_title("Hourly Prices and Heat Power-On Periods (first 3 days)")
+        ax.legend(loc="upper left", fontsize=8)
+        ax.grid(True)
+        st.pyplot(fig)
+        st.caption("Energy cost per month under the tariff. MPC saves the same kWh either way; "
+                   "the € it saves depends on the hours the heats run in.")
@@ -0,0 +1,44 @@
+"""Three-phase arc circuit simulation time for a full heat against sample rate.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_arc --rates 100 1000 2000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from arc_optimizer.arc import DEFAULT_HEAT, simulate_arc
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rates", type=int, nargs="+", default=[100, 500, 1000, 2000],
+                        help="sample rates in Hz")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per rate (best is kept)")
+    args = parser.parse_args()
+
+    minutes = sum(stage.minutes for stage in DEFAULT_HEAT)
+    print(f"{minutes:g}-minute heat, stages: {', '.join(stage.name for stage in DEFAULT_HEAT)}")
+    print(f"{'rate Hz':>8} {'samples':>12} {'best s':>8} {'Msamples/s':>11}")
+    for rate in args.rates:
+        best = float("inf")
+        for seed in range(args.repeat):
+            start = time.perf_counter()
+            result = simulate_arc(rate_hz=rate, seed=seed)
+            best = min(best, time.perf_counter() - start)
+        n = len(result.time)
+        print(f"{rate:>8} {n:>12,} {best:>8.3f} {3 * n / best / 1e6:>11.1f}")
+
+    power = result.total_active_power()
+    print(f"\n{'stage':<10} {'P MW':>7} {'Q MVAr':>7} {'I kA':>6} {'PF':>6} {'P std':>6}")
+    for index, stage in enumerate(DEFAULT_HEAT):
+        mask = result.stage == index
+        print(f"{stage.name:<10} {power[mask].mean():>7.1f} {result.total_reactive_power()[mask].mean():>7.1f} "
+              f"{result.current[:, mask].mean():>6.1f} {result.power_factor[:, mask].mean():>6.3f} "
+              f"{np.std(power[mask]):>6.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Per-step MPC solve time against prediction horizon length.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_mpc --steps 500
+"""
+import argparse
+import time
+
+import numpy as np
+
+from arc_optimizer.mpc import MPCController
+from arc_optimizer.seeding import generator
+from arc_optimizer.simulation import SAMPLES_PER_MINUTE, BASE_SETPOINT, MPC_REFERENCE, arc_fluctuation
+
+
+def bench_horizon(horizon, steps, u_min, u_max, seed=0):
+    controller = MPCController(horizon, u_min=u_min, u_max=u_max)
+    t = np.arange(steps + horizon + 1) / SAMPLES_PER_MINUTE
+    forecast = 2.0 * arc_fluctuation(t)
+    noise = 0.8 * generator(seed).standard_normal(len(t))
+
+    x = u_prev = BASE_SETPOINT
+    solve_times = np.empty(steps)
+    iterations = np.empty(steps, dtype=int)
+    for k in range(steps):
+        start = time.perf_counter()
+        u = controller.solve(x, u_prev, forecast[k + 1:k + 1 + horizon], MPC_REFERENCE)
+        solve_times[k] = time.perf_counter() - start
+        iterations[k] = controller.last_iterations
+        u_prev = u[0]
+        x = controller.a * x + (1 - controller.a) * u_prev + 0.05 * noise[k]
+    return solve_times, iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=500, help="closed-loop steps per horizon")
+    parser.add_argument("--horizons", type=int, nargs="+",
+                        default=[1, 2, 5, 10, 20, 30, 60, 120],
+                        help="prediction horizons in minutes")
+    parser.add_argument("--u-min", type=float, default=89.0)
+    parser.add_argument("--u-max", type=float, default=93.0)
+    args = parser.parse_args()
+
+    print(f"{'minutes':>8} {'steps N':>8} {'mean ms':>9} {'p95 ms':>9} {'max ms':>9} "
+          f"{'mean it':>8} {'constr %':>9}")
+    for minutes in args.horizons:
+        horizon = minutes * SAMPLES_PER_MINUTE
+        solve_times, iterations = bench_horizon(horizon, args.steps, args.u_min, args.u_max)
+        ms = solve_times * 1e3
+        print(f"{minutes:>8} {horizon:>8} {ms.mean():>9.3f} {np.percentile(ms, 95):>9.3f} "
+              f"{ms.max():>9.3f} {iterations.mean():>8.1f} {100 * np.mean(iterations > 0):>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""Per-stage scaling benchmark of the dashboard data pipeline.
+
+Stages, each timed on its own at every input size:
+
+  generate  synthetic time/base/MPC series written chunk by chunk into a
+            historian store (the MPC solver itself is covered by bench_mpc)
+  savings   clipped savings and their integral (historian.integrated_savings)
+  zones     savings-zone detection with per-zone energy (zones.find_zones)
+  render    decimated matplotlib chart serialised to PNG, as st.pyplot /
+            st.image receive it (charts.render_live_vs_predicted)
+  export    chunked report export (reports.power_report_batches -> report_bytes)
+
+Inputs are memory-mapped stores in a temporary directory, so 10^8 samples
+(2.4 GB for the three channels) fit on small machines. Time is the best of ``--repeat``
+runs; peak memory is the tracemalloc peak of one extra traced run (NumPy
+reports its buffers to tracemalloc). Results go to a JSON file that
+``--compare`` can diff against a previous run on the same box.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_pipeline --sizes 1e3 1e4 1e5 1e6 1e7 1e8 -o bench.json
+    python -m benchmarks.bench_pipeline -o new.json --compare bench.json
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from arc_optimizer.charts import render_live_vs_predicted
+from arc_optimizer.historian import DEFAULT_CHUNK_ROWS, integrated_savings, open_store, write_store
+from arc_optimizer.reports import power_report_batches, report_bytes
+from arc_optimizer.seeding import generator
+from arc_optimizer.simulation import BASE_SETPOINT, MPC_REFERENCE, SAMPLES_PER_MINUTE, arc_fluctuation
+from arc_optimizer.zones import find_zones
+
+STAGES = ("generate", "savings", "zones", "render", "export")
+DEFAULT_SIZES = ("1e3", "1e4", "1e5", "1e6", "1e7")
+
+
+def synthetic_chunks(n, chunk_rows=DEFAULT_CHUNK_ROWS, seed=0):
+    """``(time, base_power, mpc_power)`` chunks of a synthetic ``n``-sample history."""
+    rng = generator(seed)
+    for start in range(0, n, chunk_rows):
+        t = np.arange(start, min(start + chunk_rows, n)) / SAMPLES_PER_MINUTE
+        fluctuation = arc_fluctuation(t)
+        base = BASE_SETPOINT + fluctuation + 0.8 * rng.standard_normal(len(t))
+        mpc = MPC_REFERENCE + 0.4 * fluctuation + 0.3 * rng.standard_normal(len(t))
+        yield t, base, mpc
+
+
+def _generate(store, n):
+    write_store(store, synthetic_chunks(n))
+
+
+def _savings(series):
+    integrated_savings(*series)
+
+
+def _zones(series):
+    time, base, mpc = series
+    find_zones(np.greater(base, mpc), time, np.clip(np.subtract(base, mpc), 0, None))
+
+
+def _render(series):
+    time, base, mpc = series
+    # Last 5 minutes as the predicted segment, like the dashboards
+    split = max(len(time) - 5 * SAMPLES_PER_MINUTE, 1)
+    render_live_vs_predicted(time[:split], base[:split], mpc[:split],
+                             time[split:], base[split:], mpc[split:], dpi=100)
+
+
+def _export(series, fmt):
+    report_bytes(power_report_batches(*series), fmt)
+
+
+def _measure(fn, repeat, memory):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+        if best > 5:
+            break  # large sizes: one run is enough
+    peak = None
+    if memory:
+        tracemalloc.start()
+        try:
+            fn()
+            peak = tracemalloc.get_traced_memory()[1] / 2**20
+        finally:
+            tracemalloc.stop()
+    return best, peak
+
+
+def run(sizes, stages, repeat=3, memory=True, export_format="csv", workdir=None):
+    results = []
+    with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+        for n in sizes:
+            store = Path(tmp) / f"series-{n}"
+            for stage in stages:
+                if stage == "generate":
+                    seconds, peak = _measure(lambda: _generate(store, n), repeat, memory)
+                else:
+                    if not (store / "time.f64").exists():
+                        _generate(store, n)
+                    series = open_store(store)
+                    fn = {"savings": lambda: _savings(series),
+                          "zones": lambda: _zones(series),
+                          "render": lambda: _render(series),
+                          "export": lambda: _export(series, export_format)}[stage]
+                    seconds, peak = _measure(fn, repeat, memory)
+                result = {"stage": stage, "samples": n, "seconds": seconds, "peak_mb": peak,
+                          "samples_per_s": n / seconds if seconds else float("inf")}
+                results.append(result)
+                memory_text = f"{peak:>10.1f} MB" if peak is not None else f"{'-':>13}"
+                print(f"{stage:<9}{n:>12,}{seconds:>11.4f} s{memory_text}{result['samples_per_s']:>15,.0f} /s",
+                      flush=True)
+    return results
+
+
+def _metadata():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = ""
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "platform": platform.platform(),
+    }
+
+
+def compare(results, baseline_path):
+    baseline = {(r["stage"], r["samples"]): r for r in json.loads(Path(baseline_path).read_text())["results"]}
+    print(f"\nvs {baseline_path}  (time ratio new/old; > 1 is slower)")
+    for r in results:
+        old = baseline.get((r["stage"], r["samples"]))
+        if old:
+            memory = (f"{r['peak_mb'] - old['peak_mb']:>+10.1f} MB"
+                      if r["peak_mb"] is not None and old["peak_mb"] is not None else "")
+            print(f"{r['stage']:<9}{r['samples']:>12,}{r['seconds'] / old['seconds']:>9.2f}x{memory}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", nargs="+", default=list(DEFAULT_SIZES),
+                        help="input sizes in samples (e.g. 1e3 ... 1e8)")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES))
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per point (best is kept)")
+    parser.add_argument("--no-memory", action="store_true", help="skip the traced peak-memory run")
+    parser.add_argument("--export-format", choices=("csv", "parquet", "arrow"), default="csv")
+    parser.add_argument("--workdir", help="where to put the temporary input stores (default: system tmp)")
+    parser.add_argument("-o", "--output", default="bench_pipeline.json", help="JSON result file")
+    parser.add_argument("--compare", help="previous JSON result file to compare against")
+    args = parser.parse_args()
+
+    sizes = [int(float(s)) for s in args.sizes]
+    print(f"{'stage':<9}{'samples':>12}{'time':>13}{'peak':>13}{'throughput':>17}")
+    results = run(sizes, args.stages, args.repeat, not args.no_memory, args.export_format, args.workdir)
+    payload = {"meta": {**_metadata(), "argv": sys.argv[1:]}, "results": results}
+    Path(args.output).write_text(json.dumps(payload, indent=2))
+    print(f"\nwrote {args.output}")
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Cold-start and first-paint time of the dashboards.
+
+Each script runs once in a fresh interpreter (Streamlit's AppTest harness,
+no browser), as after a container restart. Reported per script:
+
+  first paint  process start -> the page title is emitted
+  first run    process start -> the whole script has run once
+  heavy        which of pandas / matplotlib / PIL / pyarrow got imported
+
+Run from the repository root:
+
+    python -m benchmarks.bench_startup arc_optimizer_apc_final_habas_split.py
+"""
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+HEAVY_MODULES = ("pandas", "matplotlib", "PIL", "pyarrow")
+
+_CHILD = r"""
+import json, os, sys, time
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+marks = {}
+_title = st.title
+def title(*args, **kwargs):
+    marks.setdefault("first_paint", time.time())
+    return _title(*args, **kwargs)
+st.title = title
+
+at = AppTest.from_file(os.path.abspath(sys.argv[1]), default_timeout=120)
+at.run()
+marks["first_run"] = time.time()
+marks["errors"] = [str(e.value) for e in at.exception]
+marks["heavy"] = [m for m in json.loads(sys.argv[2]) if m in sys.modules]
+print("@@" + json.dumps(marks))
+"""
+
+
+def measure(script):
+    start = time.time()
+    out = subprocess.run([sys.executable, "-c", _CHILD, script, json.dumps(HEAVY_MODULES)],
+                         capture_output=True, text=True, check=True).stdout
+    marks = json.loads(next(line[2:] for line in out.splitlines() if line.startswith("@@")))
+    return {
+        "script": script,
+        "first_paint_s": marks["first_paint"] - start if "first_paint" in marks else float("nan"),
+        "first_run_s": marks["first_run"] - start,
+        "heavy": marks["heavy"],
+        "errors": marks["errors"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scripts", nargs="+", help="dashboard scripts to start")
+    parser.add_argument("--repeat", type=int, default=3, help="cold starts per script (best is reported)")
+    args = parser.parse_args()
+
+    print(f"{'script':<44}{'first paint':>13}{'first run':>11}  heavy imports")
+    for script in args.scripts:
+        runs = [measure(script) for _ in range(args.repeat)]
+        best = min(runs, key=lambda r: r["first_run_s"])
+        paint = min(r["first_paint_s"] for r in runs)
+        note = f"  ERROR: {best['errors'][0]}" if best["errors"] else ""
+        print(f"{script:<44}{paint:>12.2f}s{best['first_run_s']:>10.2f}s  "
+              f"{', '.join(best['heavy']) or '-'}{note}")
+
+
+if __name__ == "__main__":
+    main()
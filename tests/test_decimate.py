@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from arc_optimizer.decimate import decimate_for_plot, minmax_indices
+
+
+@pytest.mark.parametrize("n", [2001, 2999, 5000, 10**6, 1_234_567])
+def test_point_budget_is_about_two_per_pixel(n):
+    rng = np.random.default_rng(n)
+    x = np.arange(n)
+    base, mpc = rng.standard_normal(n), rng.standard_normal(n)
+    for series in ((), (base,), (base, mpc)):
+        idx = minmax_indices(x, *series, width_px=1000)
+        assert len(idx) <= 2 * 1000
+        assert idx[0] == 0 and idx[-1] == n - 1
+        assert np.all(np.diff(idx) > 0)
+
+
+def test_short_input_is_kept_whole():
+    x = np.arange(1500)
+    assert np.array_equal(minmax_indices(x, np.sin(x), width_px=1000), x)
+
+
+def test_extremes_and_crossings_survive():
+    n = 10**6
+    x = np.arange(n, dtype=float)
+    base = np.sin(x / 5000)
+    base[10_000] = 5.0    # on a positive half-wave, so no extra crossings
+    base[20_000] = -5.0
+    mpc = np.zeros(n)
+    t, b, m = decimate_for_plot(x, base, mpc)
+    assert b.max() == 5.0 and b.min() == -5.0
+    # Every sign change of base - mpc still has a sample on each side
+    full_crossings = np.flatnonzero(np.diff(base > mpc))
+    kept = set(t.astype(int))
+    for i in full_crossings:
+        assert i in kept and i + 1 in kept
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from arc_optimizer.events import EventDetector, event_spans
+
+
+def signal(n=2000, seed=0):
+    rng = np.random.default_rng(seed)
+    values = 91 + 0.5 * rng.standard_normal(n)
+    values[600:640] += 6.0
+    values[1300:1320] -= 6.0
+    return values
+
+
+def test_single_samples_match_batches():
+    values = signal()
+    single = EventDetector(window=30)
+    records = [r for x in values if (r := single.update(x)) is not None]
+    batched = EventDetector(window=30)
+    batch_records = []
+    for lo in range(0, len(values), 97):
+        batch_records += batched.update_batch(values[lo:lo + 97])
+    assert records == batch_records
+    assert (single.count, single.mean, single.var, single.in_event) == \
+           (batched.count, batched.mean, batched.var, batched.in_event)
+
+
+def test_hysteresis_gives_one_event_per_excursion():
+    values = signal()
+    times = np.arange(len(values)) / 4
+    spans = {}
+    for exit_sigma in (1.0, 3.0):
+        detector = EventDetector(window=50, enter_sigma=3.0, exit_sigma=exit_sigma)
+        records = detector.update_batch(values, times=times)
+        assert [r.kind for r in records] == ["start", "stop"] * (len(records) // 2)
+        # Each excursion opens exactly one event, at its first sample
+        for lo, hi in ((600, 640), (1300, 1320)):
+            assert [r.index for r in records if r.kind == "start" and lo <= r.index < hi] == [lo]
+        spans[exit_sigma] = dict(event_spans(records, end_time=times[-1]))
+    # The lower exit threshold keeps the event open longer
+    assert spans[1.0][150.0] > spans[3.0][150.0]
+
+
+def test_thresholds_between_enter_and_exit_do_not_toggle():
+    detector = EventDetector(window=5, enter_sigma=2.0, exit_sigma=0.5, warmup=5)
+    detector.update_batch([0.0, 1.0] * 50)
+    detector.in_event = True
+    # |z| of an alternating +-1 signal around its mean stays near 1: above exit, below enter
+    assert detector.update_batch([0.0, 1.0] * 10) == []
+    assert detector.in_event
+
+
+def test_warmup_suppresses_events():
+    detector = EventDetector(window=10, warmup=10)
+    assert detector.update_batch([0.0] * 5 + [100.0] * 4) == []
+
+
+def test_invalid_thresholds():
+    with pytest.raises(ValueError):
+        EventDetector(enter_sigma=1.0, exit_sigma=2.0)
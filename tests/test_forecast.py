@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from arc_optimizer.forecast import Z_95, ARForecaster, fit_forecast
+
+
+def ar2(n, a1=1.2, a2=-0.5, c=10.0, sigma=0.3, seed=0):
+    rng = np.random.default_rng(seed)
+    y = np.full(n, c / (1 - a1 - a2))
+    noise = sigma * rng.standard_normal(n)
+    for k in range(2, n):
+        y[k] = c + a1 * y[k - 1] + a2 * y[k - 2] + noise[k]
+    return y
+
+
+def test_recovers_ar2_coefficients_and_noise():
+    forecaster = ARForecaster(order=2, forgetting=1.0)
+    forecaster.update_batch(ar2(20_000))
+    np.testing.assert_allclose(forecaster.theta[1:], [1.2, -0.5], atol=0.02)
+    assert forecaster.std == pytest.approx(0.3, rel=0.05)
+
+
+def test_single_samples_match_batches():
+    values = ar2(500, seed=1)
+    single, batched = ARForecaster(order=3), ARForecaster(order=3)
+    for value in values:
+        single.update(value)
+    for lo in range(0, len(values), 64):
+        batched.update_batch(values[lo:lo + 64])
+    np.testing.assert_allclose(single.theta, batched.theta)
+    np.testing.assert_allclose(single.forecast(10), batched.forecast(10))
+
+
+def test_forecast_follows_the_model_and_widens():
+    values = ar2(20_000, seed=2)
+    mean, std = fit_forecast(values, 20, order=2, forgetting=1.0)
+    # Noise-free recursion from the last two samples with the true coefficients
+    expected = list(values[-2:])
+    for _ in range(20):
+        expected.append(10 + 1.2 * expected[-1] - 0.5 * expected[-2])
+    np.testing.assert_allclose(mean, expected[2:], atol=0.1)
+    assert std[0] == pytest.approx(0.3, rel=0.05)
+    assert np.all(np.diff(std) >= -1e-12)
+
+
+def test_band_covers_about_95_percent():
+    values = ar2(6000, seed=3)
+    forecaster = ARForecaster(order=2)
+    forecaster.update_batch(values[:1000])
+    hits = []
+    for k in range(1000, len(values)):
+        mean, std = forecaster.forecast(1)
+        hits.append(abs(values[k] - mean[0]) <= Z_95 * std[0])
+        forecaster.update(values[k])
+    assert np.mean(hits) == pytest.approx(0.95, abs=0.02)
+
+
+def test_holds_last_value_until_ready():
+    forecaster = ARForecaster(order=4)
+    forecaster.update_batch([90.0, 91.0, 92.0])
+    mean, std = forecaster.forecast(5)
+    assert not forecaster.ready
+    np.testing.assert_array_equal(mean, 92.0)
+    np.testing.assert_array_equal(std, 0.0)
@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from arc_optimizer.historian import CHANNELS, integrated_savings, load_series
+
+
+@pytest.fixture
+def frame():
+    time = np.arange(2500) / 4
+    base = 92 + np.sin(time)
+    mpc = 91 + 0.5 * np.sin(time + 0.3)
+    return pd.DataFrame({"time": time, "base_power": base, "mpc_power": mpc})
+
+
+def write(frame, path):
+    if path.suffix == ".csv":
+        frame.to_csv(path, index=False)
+    elif path.suffix == ".parquet":
+        pq.write_table(pa.Table.from_pandas(frame, preserve_index=False), path, row_group_size=700)
+    else:
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        with pa.ipc.new_file(str(path), table.schema) as writer:
+            for batch in table.to_batches(max_chunksize=700):
+                writer.write_batch(batch)
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet", ".arrow"])
+def test_round_trip_through_memory_mapped_store(tmp_path, frame, suffix):
+    source = tmp_path / f"heat{suffix}"
+    write(frame, source)
+    cache = tmp_path / "cache"
+    series = load_series(source, cache_dir=cache, chunk_rows=300)
+    for channel, values in zip(CHANNELS, series):
+        assert isinstance(values, np.memmap)
+        # pandas' fast CSV float parser may differ from the written value in the last bit
+        np.testing.assert_allclose(values, frame[channel].to_numpy(), rtol=1e-15 if suffix == ".csv" else 0)
+    # Second load maps the finished store; no staging directories are left behind
+    again = load_series(source, cache_dir=cache)
+    np.testing.assert_array_equal(again.base_power, series.base_power)
+    assert [p.name for p in cache.iterdir() if p.name.startswith(".")] == []
+
+
+def test_column_mapping_is_part_of_the_cache_key(tmp_path, frame):
+    source = tmp_path / "heat.csv"
+    frame.assign(other=frame["mpc_power"] - 1).to_csv(source, index=False)
+    cache = tmp_path / "cache"
+    default = load_series(source, cache_dir=cache)
+    mapped = load_series(source, cache_dir=cache, columns={"mpc_power": "other"})
+    np.testing.assert_allclose(mapped.mpc_power, default.mpc_power - 1)
+
+
+def test_interrupted_conversion_is_not_reused(tmp_path, frame):
+    source = tmp_path / "heat.csv"
+    frame.to_csv(source, index=False)
+    cache = tmp_path / "cache"
+    load_series(source, cache_dir=cache)
+    store, = cache.iterdir()
+    # Simulate a conversion that died half way: no completion marker, truncated channel
+    (store / "complete").unlink()
+    (store / "time.f64").write_bytes(b"")
+    series = load_series(source, cache_dir=cache)
+    np.testing.assert_array_equal(series.time, frame["time"].to_numpy())
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 7, 1000, 10**6])
+def test_integrated_savings_is_independent_of_chunking(frame, chunk_rows):
+    # Constant 1 MW saving over 2499 samples of 0.25 min, plus a zero-clipped stretch
+    time = frame["time"].to_numpy()
+    base = np.full(len(time), 92.0)
+    mpc = np.where(time < 300, 91.0, 93.0)
+    mwh, mean_savings, mean_base = integrated_savings(time, base, mpc, chunk_rows=chunk_rows)
+    inside = time < 300
+    expected = (time[inside][-1] - time[0]) / 60 + 0.5 * 0.25 / 60
+    assert mwh == pytest.approx(expected)
+    assert mean_savings == pytest.approx(inside.mean())
+    assert mean_base == 92.0
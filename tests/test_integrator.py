@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from arc_optimizer.integrator import EnergyCounters, EnergyIntegrator, integrate
+
+
+def test_trapezoid_matches_closed_form():
+    # P(t) = 90 + 0.1 t MW over 60 min: the trapezoid rule is exact for a line
+    t = np.linspace(0, 60, 241)
+    assert integrate(t, 90 + 0.1 * t) == pytest.approx((90 * 60 + 0.05 * 60 ** 2) / 60)
+    # Units only change the scale: the same curve in seconds
+    assert integrate(t * 60, 90 + 0.1 * t, time_unit="s") == pytest.approx(integrate(t, 90 + 0.1 * t))
+
+
+def test_streaming_matches_one_shot():
+    rng = np.random.default_rng(0)
+    t = np.cumsum(rng.uniform(0.1, 0.4, 1000))
+    p = 90 + rng.standard_normal(1000)
+    integrator = EnergyIntegrator()
+    for lo in range(0, 1000, 37):
+        integrator.update_batch(t[lo:lo + 37], p[lo:lo + 37])
+    single = EnergyIntegrator()
+    for ti, pi in zip(t, p):
+        single.update(ti, pi)
+    assert integrator.mwh == pytest.approx(integrate(t, p))
+    assert single.mwh == pytest.approx(integrate(t, p))
+    assert integrator.samples == single.samples == 1000
+
+
+def test_gap_longer_than_threshold_is_not_bridged():
+    integrator = EnergyIntegrator(max_gap=1.0)
+    integrator.update_batch([0, 0.5, 1.0], [60, 60, 60])
+    integrator.update_batch([11.0, 12.0], [60, 60])
+    # Two 1-minute stretches at 60 MW; the 10-minute gap adds nothing
+    assert integrator.mwh == pytest.approx(2.0)
+    assert integrator.gap_time == pytest.approx(10.0)
+
+
+def test_repeated_and_nan_samples_are_dropped():
+    integrator = EnergyIntegrator()
+    integrator.update_batch([0, 1, 1, 0.5, 2], [60, 60, 999, 999, 60])
+    integrator.update(3, np.nan)
+    assert integrator.mwh == pytest.approx(2.0)
+    assert integrator.samples == 3
+
+
+def test_counters_roll_over_at_shift_boundaries():
+    # 60 MW from 05:00 to 15:00; shifts start at 22:00, 06:00 and 14:00, and each
+    # 15-minute interval is booked to the shift of its closing sample
+    counters = EnergyCounters(start="2025-03-01T05:00", shift_hours=8, shift_start_hour=6)
+    t = np.arange(0, 10 * 60 + 1, 15.0)
+    for lo in range(0, len(t), 5):
+        counters.update_batch(t[lo:lo + 5], np.full(len(t[lo:lo + 5]), 60.0))
+    shifts = [(counters.period_start("shift", key), mwh) for period, key, mwh in counters.history
+              if period == "shift"]
+    assert shifts == [(np.datetime64("2025-02-28T22", "h"), pytest.approx(45.0)),
+                      (np.datetime64("2025-03-01T06", "h"), pytest.approx(480.0))]
+    assert counters.value("shift") == pytest.approx(75.0)
+    assert counters.value("total") == pytest.approx(600.0)
+
+
+def test_counters_roll_over_at_month_boundaries_and_heats():
+    counters = EnergyCounters(start="2025-01-31T23:00", time_unit="h")
+    counters.update_batch([0.0, 0.5, 1.0], [10.0, 10.0, 10.0])
+    counters.start_heat("H2")
+    counters.update_batch([1.5, 2.0], [10.0, 10.0])
+    months = [(counters.period_start("month", key), mwh) for period, key, mwh in counters.history
+              if period == "month"]
+    # The interval closing at midnight already belongs to February
+    assert months == [(np.datetime64("2025-01", "M"), pytest.approx(5.0))]
+    assert counters.value("month", unit="kWh") == pytest.approx(15_000.0)
+    assert ("heat", 0, pytest.approx(10.0)) in counters.history
+    assert counters.keys["heat"] == "H2"
+    assert counters.value("heat") == pytest.approx(10.0)
+    assert counters.value("total") == pytest.approx(20.0)
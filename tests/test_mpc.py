@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from arc_optimizer.mpc import MPCController, simulate_closed_loop
+from arc_optimizer.simulation import arc_fluctuation
+
+
+def objective(controller, x0, u_prev, disturbance, reference, u):
+    """The QP cost written out over the simulated states, independent of the condensed form."""
+    x, cost, last = x0, 0.0, u_prev
+    for k in range(controller.horizon):
+        x = controller.a * x + (1 - controller.a) * u[k]
+        cost += controller.q * (x + disturbance[k] - reference) ** 2
+        cost += controller.r_move * (u[k] - last) ** 2 + controller.r_input * (u[k] - reference) ** 2
+        last = u[k]
+    return 0.5 * cost
+
+
+def gradient(controller, x0, u_prev, disturbance, reference, u, eps=1e-6):
+    return np.array([(objective(controller, x0, u_prev, disturbance, reference, u + eps * e)
+                      - objective(controller, x0, u_prev, disturbance, reference, u - eps * e)) / (2 * eps)
+                     for e in np.eye(len(u))])
+
+
+def test_unconstrained_optimum_is_stationary():
+    controller = MPCController(12, u_min=-1e9, u_max=1e9)
+    disturbance = np.linspace(-1, 2, 12)
+    u = controller.solve(91.0, 90.0, disturbance, 91.0)
+    assert controller.last_iterations == 0
+    np.testing.assert_allclose(gradient(controller, 91.0, 90.0, disturbance, 91.0, u), 0, atol=1e-5)
+
+
+def test_constrained_solution_satisfies_kkt():
+    controller = MPCController(20, u_min=89.0, u_max=92.0, tol=1e-9, max_iter=5000)
+    disturbance = 3 * np.sin(np.arange(20) / 3)
+    u = controller.solve(91.0, 91.0, disturbance, 91.0)
+    assert controller.last_iterations > 0
+    assert u.min() >= 89.0 and u.max() <= 92.0
+    grad = gradient(controller, 91.0, 91.0, disturbance, 91.0, u)
+    at_lower, at_upper = np.isclose(u, 89.0), np.isclose(u, 92.0)
+    assert at_lower.any() or at_upper.any()
+    # Free components are stationary; active bounds push outward only
+    np.testing.assert_allclose(grad[~at_lower & ~at_upper], 0, atol=1e-4)
+    assert np.all(grad[at_lower] > -1e-4) and np.all(grad[at_upper] < 1e-4)
+
+
+def test_move_penalty_limits_setpoint_rate():
+    disturbance = 4 * np.sign(np.sin(np.arange(16) / 2))
+    moves = []
+    for r_move in (0.01, 1.0, 10.0):
+        controller = MPCController(16, r_move=r_move)
+        u = controller.solve(91.0, 91.0, disturbance, 91.0)
+        moves.append(np.max(np.abs(np.diff(np.concatenate(([91.0], u))))))
+    assert moves[0] > moves[1] > moves[2]
+
+
+def test_warm_start_gives_the_same_result_in_fewer_iterations():
+    horizon, bounds = 20, dict(u_min=88.0, u_max=94.0)
+    t = np.arange(260) / 4
+    d = 3 * arc_fluctuation(t) + 0.8 * np.random.default_rng(0).standard_normal(len(t))
+    warm = MPCController(horizon, **bounds)
+    x = u_prev = 91.0
+    warm_iterations = cold_iterations = 0
+    for k in range(200):
+        forecast = d[k + 1:k + 1 + horizon]
+        u = warm.solve(x, u_prev, forecast, 91.0)
+        cold = MPCController(horizon, **bounds)
+        np.testing.assert_allclose(u, cold.solve(x, u_prev, forecast, 91.0), atol=1e-5)
+        warm_iterations += warm.last_iterations
+        cold_iterations += cold.last_iterations
+        u_prev = u[0]
+        x = warm.a * x + (1 - warm.a) * u_prev
+    assert 0 < warm_iterations < cold_iterations
+
+
+def test_closed_loop_reduces_fluctuation():
+    t = np.arange(240) / 4
+    forecast = 2 * arc_fluctuation(t)
+    disturbance = forecast + 0.3 * np.random.default_rng(1).standard_normal(len(t))
+    power = simulate_closed_loop(disturbance, 20, reference=91.0, forecast=forecast, x0=91.0)
+    assert np.std(power[20:]) < np.std(91.0 + disturbance[20:])
+    assert np.mean(power[20:]) == pytest.approx(91.0, abs=0.5)
@@ -0,0 +1,48 @@
+import io
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+import pytest
+from streamlit.runtime.download_data_util import convert_data_to_bytes_and_infer_mime
+
+from arc_optimizer.reports import POWER_REPORT_COLUMNS, columns_report, power_report, prediction_report
+
+
+def download(report):
+    """What ``st.download_button`` does with a deferred callable when the button is clicked."""
+    data, _ = convert_data_to_bytes_and_infer_mime(report(), unsupported_error=TypeError(type(report())))
+    return data
+
+
+def read(data, fmt):
+    if fmt == "csv":
+        return pacsv.read_csv(io.BytesIO(data))
+    if fmt == "parquet":
+        return pq.read_table(io.BytesIO(data))
+    return pa.ipc.open_file(pa.BufferReader(data)).read_all()
+
+
+@pytest.mark.parametrize("fmt", ["csv", "parquet", "arrow"])
+def test_power_report_downloads(fmt):
+    time = np.arange(10.0)
+    base = np.full(10, 92.0)
+    mpc = np.full(10, 90.5)
+    table = read(download(power_report(time, base, mpc, fmt, chunk_rows=3)), fmt)
+    assert table.column_names == list(POWER_REPORT_COLUMNS)
+    assert table.num_rows == 10
+    np.testing.assert_allclose(table["Savings (MW)"].to_numpy(), 1.5)
+
+
+@pytest.mark.parametrize("fmt", ["csv", "parquet", "arrow"])
+def test_prediction_report_downloads(fmt):
+    table = read(download(prediction_report(10, 2, fmt)), fmt)
+    assert table.num_rows == 12 * 4
+
+
+def test_nan_padding_is_written_as_empty_csv_cells():
+    data = download(columns_report({"Live": np.array([1.0, 2.0, 3.0]), "Predicted": np.array([np.nan, np.nan, 4.0])}))
+    lines = data.decode().splitlines()
+    assert lines[1] == "1,"
+    assert lines[3] == "3,4"
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from arc_optimizer.ringbuffer import RingBuffer
+
+
+def test_window_wraps_around_in_chronological_order():
+    buffer = RingBuffer(5, ("t", "p"), slack=3)
+    for i in range(23):
+        buffer.append(i, 10 * i)
+        expected = np.arange(max(0, i - 4), i + 1)
+        np.testing.assert_array_equal(buffer.channel("t"), expected)
+        np.testing.assert_array_equal(buffer.channel("p"), 10 * expected)
+    assert len(buffer) == 5
+    assert buffer.total == 23
+    np.testing.assert_array_equal(buffer.latest(2), [[21, 22], [210, 220]])
+
+
+def test_compaction_happens_exactly_at_capacity_plus_slack():
+    buffer = RingBuffer(4, ("t",), slack=2)
+    storage = buffer._data
+    for i in range(6):
+        buffer.append(i)
+    # The storage is full but nothing has moved yet
+    assert buffer._head == 6
+    np.testing.assert_array_equal(storage[0], np.arange(6))
+    buffer.append(6)
+    # The seventh sample triggers one compaction: the 3 survivors move to the front
+    assert buffer._head == 4
+    assert buffer._data is storage
+    np.testing.assert_array_equal(storage[0, :4], [3, 4, 5, 6])
+    np.testing.assert_array_equal(buffer.channel("t"), [3, 4, 5, 6])
+
+
+@pytest.mark.parametrize("sizes", [(3, 3, 3, 3), (1, 7, 2, 9, 4), (20,), (4, 4, 4, 4, 4, 4, 4)])
+def test_batches_match_single_appends(sizes):
+    single = RingBuffer(6, ("t", "p"), slack=4)
+    batched = RingBuffer(6, ("t", "p"), slack=4)
+    start = 0
+    for n in sizes:
+        t = np.arange(start, start + n, dtype=float)
+        for value in t:
+            single.append(value, -value)
+        batched.extend(t, -t)
+        start += n
+        np.testing.assert_array_equal(batched.latest(), single.latest())
+        view = batched.channel("t")
+        # Views are contiguous, zero-copy and chronological
+        assert view.base is not None and view.flags["C_CONTIGUOUS"]
+        assert np.all(np.diff(view) == 1) and view[-1] == start - 1
+    assert batched.total == single.total == sum(sizes)
+
+
+def test_clear_resets_the_window():
+    buffer = RingBuffer(3, ("t",))
+    buffer.extend(np.arange(5.0))
+    buffer.clear()
+    assert len(buffer) == 0 and buffer.total == 0
+    buffer.append(7.0)
+    np.testing.assert_array_equal(buffer.channel("t"), [7.0])
@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+from arc_optimizer.seeding import generator, seed_key, spawn_seeds
+
+
+def draws(seeds):
+    return [generator(seed).standard_normal(4) for seed in seeds]
+
+
+def test_children_depend_only_on_the_root_value():
+    root = spawn_seeds(7, 3)[1]
+    first, again = spawn_seeds(root, 4), spawn_seeds(root, 4)
+    assert [seed_key(s) for s in first] == [seed_key(s) for s in again]
+    np.testing.assert_array_equal(draws(first), draws(again))
+    # Spawning more children keeps the existing ones
+    np.testing.assert_array_equal(draws(spawn_seeds(root, 6))[:4], draws(first))
+
+
+def test_children_are_distinct_streams():
+    values = draws(spawn_seeds(0, 5))
+    assert len({v.tobytes() for v in values}) == 5
+
+
+def test_generators_need_a_seed_to_be_cached():
+    assert seed_key(3) == 3
+    with pytest.raises(TypeError):
+        seed_key(np.random.default_rng(0))
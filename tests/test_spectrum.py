@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from arc_optimizer.spectrum import (FLICKER_REFERENCE, SpectrumAnalyzer, flicker_pst, flicker_weighting,
+                                    thd)
+
+RATE = 10_000
+
+
+def tone(seconds, components, noise=0.0, seed=0):
+    """Sum of ``(frequency_hz, amplitude)`` sines, plus optional white noise."""
+    t = np.arange(int(seconds * RATE)) / RATE
+    signal = sum(a * np.sin(2 * np.pi * f * t) for f, a in components)
+    return signal + noise * np.random.default_rng(seed).standard_normal(len(t))
+
+
+def test_psd_peaks_at_known_frequency_with_its_power():
+    analyzer = SpectrumAnalyzer(RATE, block=2000)
+    analyzer.update(tone(4, [(250.0, 2.0)], noise=0.1))
+    freq, density = analyzer.psd()
+    assert freq[np.argmax(density)] == pytest.approx(250.0)
+    # Power of the tone (A^2 / 2) sits in the bins around it; the rest is the noise floor
+    df = freq[1]
+    around = np.abs(freq - 250.0) <= 3 * df
+    assert density[around].sum() * df == pytest.approx(2.0, rel=0.05)
+    assert density[~around].sum() * df == pytest.approx(0.1 ** 2, rel=0.1)
+
+
+def test_streamed_chunks_match_one_update():
+    signal = tone(3, [(50.0, 1.0), (150.0, 0.2)], noise=0.05)
+    whole = SpectrumAnalyzer(RATE, block=2000, max_batch=4)
+    whole.update(signal)
+    chunked = SpectrumAnalyzer(RATE, block=2000, max_batch=4)
+    for lo in range(0, len(signal), 1234):
+        chunked.update(signal[lo:lo + 1234])
+    assert chunked.blocks == whole.blocks == (len(signal) - 2000) // 1000 + 1
+    np.testing.assert_allclose(chunked.psd()[1], whole.psd()[1])
+
+
+def test_harmonics_and_thd():
+    analyzer = SpectrumAnalyzer(RATE, block=2000)
+    analyzer.update(tone(2, [(50.0, 100.0), (250.0, 8.0), (350.0, 6.0)]))
+    orders, magnitudes = analyzer.harmonics(orders=range(1, 10))
+    rms = dict(zip(orders, magnitudes))
+    assert rms[1] == pytest.approx(100 / np.sqrt(2), rel=1e-3)
+    assert rms[5] == pytest.approx(8 / np.sqrt(2), rel=1e-3)
+    assert rms[7] == pytest.approx(6 / np.sqrt(2), rel=1e-3)
+    assert rms[3] < 1e-3
+    assert thd(orders, magnitudes) == pytest.approx(10.0, rel=1e-3)
+
+
+def test_reference_fluctuation_reads_pinst_one():
+    ref_hz, ref_pp = FLICKER_REFERENCE
+    analyzer = SpectrumAnalyzer(RATE, block=2 ** 16)
+    analyzer.update(tone(30, [(ref_hz, ref_pp / 2)]))
+    freq, density = analyzer.psd()
+    assert flicker_pst(freq, density) == pytest.approx(0.714, rel=0.02)
+    # The lamp-eye response peaks near 8.8 Hz
+    grid = np.linspace(0.5, 30, 300)
+    assert grid[np.argmax(flicker_weighting(grid))] == pytest.approx(8.8, abs=0.5)
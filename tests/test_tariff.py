@@ -0,0 +1,55 @@
+import itertools
+import time
+
+import numpy as np
+import pytest
+
+from arc_optimizer.tariff import (EXAMPLE_DEMAND_HOURS, EXAMPLE_PRICES, _solve, schedule_heats,
+                                  weekly_maintenance)
+
+
+def brute_force(start_cost, allowed, heats_per_day, slots_per_day, duration):
+    """Cheapest total over every choice of ``heats_per_day`` starts per day; inf if none fits."""
+    n_slots = len(start_cost)
+    days = n_slots // slots_per_day
+    per_day = [
+        [combo for combo in itertools.combinations(range(day * slots_per_day, (day + 1) * slots_per_day),
+                                                   heats_per_day)
+         if all(allowed[s] and s + duration <= n_slots for s in combo)]
+        for day in range(days)
+    ]
+    best = np.inf
+    for choice in itertools.product(*per_day):
+        starts = [s for combo in choice for s in combo]
+        if all(b - a >= duration for a, b in zip(starts, starts[1:])):
+            best = min(best, sum(start_cost[s] for s in starts))
+    return best
+
+
+def test_solve_matches_brute_force():
+    rng = np.random.default_rng(0)
+    for _ in range(300):
+        slots_per_day = int(rng.integers(4, 9))
+        days = int(rng.integers(1, 3))
+        heats_per_day = int(rng.integers(1, 4))
+        duration = int(rng.integers(1, 4))
+        start_cost = rng.uniform(0, 10, days * slots_per_day)
+        allowed = rng.random(days * slots_per_day) > 0.2
+        expected = brute_force(start_cost, allowed, heats_per_day, slots_per_day, duration)
+        if not np.isfinite(expected):
+            with pytest.raises(ValueError):
+                _solve(start_cost, allowed, heats_per_day, slots_per_day, duration)
+            continue
+        starts = _solve(start_cost, allowed, heats_per_day, slots_per_day, duration)
+        assert np.all(np.diff(starts) >= duration)
+        assert np.all(np.bincount(starts // slots_per_day, minlength=days) == heats_per_day)
+        assert start_cost[starts].sum() == pytest.approx(expected)
+
+
+def test_month_schedule_is_fast():
+    start = time.perf_counter()
+    schedule = schedule_heats(EXAMPLE_PRICES, 31, 16, 145 * 296.0, maintenance=weekly_maintenance(31, 2, 6, 6),
+                              demand_charge=10.0, demand_hours=EXAMPLE_DEMAND_HOURS)
+    elapsed = time.perf_counter() - start
+    assert len(schedule.starts) == 31 * 16
+    assert elapsed < 2.0
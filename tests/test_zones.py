@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from arc_optimizer.zones import find_zones
+
+
+def loop_zones(mask, time, savings):
+    """Reference: walk the samples and integrate each run of True with the trapezoid rule."""
+    zones = []
+    start = None
+    for i, flag in enumerate(list(mask) + [False]):
+        if flag and start is None:
+            start = i
+        elif not flag and start is not None:
+            energy = sum(0.5 * (savings[j] + savings[j + 1]) * (time[j + 1] - time[j]) for j in range(start, i - 1))
+            zones.append((start, i - 1, i - start, energy))
+            start = None
+    return zones
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_runs_and_energy_match_a_python_loop(seed):
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(1, 200))
+    time = np.cumsum(rng.uniform(0.1, 1.0, n))
+    savings = rng.standard_normal(n)
+    mask = savings > rng.uniform(-1, 1)
+    zones = find_zones(mask, time, savings)
+    expected = loop_zones(mask, time, savings)
+    assert list(zip(zones.start, zones.end, zones.length)) == [z[:3] for z in expected]
+    np.testing.assert_allclose(zones.energy, [z[3] for z in expected], atol=1e-12)
+
+
+@pytest.mark.parametrize("mask, runs", [
+    ([], []),
+    ([False, False], []),
+    ([True], [(0, 0)]),
+    ([True, True, False, True], [(0, 1), (3, 3)]),
+    ([False, True, True, True], [(1, 3)]),
+])
+def test_boundaries(mask, runs):
+    zones = find_zones(mask)
+    assert list(zip(zones.start, zones.end)) == runs
+    assert np.all(zones.energy == 0)
+
+
+def test_longer_than_filters_every_field():
+    zones = find_zones([True, False, True, True, True, False, True, True], np.arange(8.0), np.ones(8))
+    long = zones.longer_than(2)
+    assert list(long.start) == [2] and list(long.length) == [3] and list(long.energy) == [2.0]
+
+
+def test_savings_need_time():
+    with pytest.raises(ValueError):
+        find_zones([True, True], savings=[1.0, 1.0])